@@ -26,8 +26,9 @@ from .const.eos import State, Restriction
 from .data.cache_handler.exception import TypeFetchError
 from .data.source import SourceManager
 from .fit import Fit
+from .fit.format import FitFormatError
 from .fit.restriction.exception import ValidationError
-from .fit.tuples import DamageTypes
+from .fit.tuples import DamageTypes, DroneSpec, FitSpec, ModuleSpec
 from .data.cache_handler import *
 from .data.data_handler import *
 from .fit.item import *
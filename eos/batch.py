@@ -0,0 +1,320 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Bulk evaluation of many fits, optionally spread across multiple
+processes. Fits are passed around as lightweight specs (see
+eos.fit.spec); each worker process obtains source once, then builds
+fits out of specs it receives, validates them and collects requested
+data. Results are streamed back in the same order specs came in.
+"""
+
+
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from logging import getLogger
+from time import perf_counter
+
+from eos.data.source import SourceManager
+from eos.exception import EosError
+from eos.fit.restriction import ValidationError
+from eos.fit import Fit
+from eos.fit.spec import _fill_fit
+
+
+logger = getLogger(__name__)
+
+
+BatchResult = namedtuple('BatchResult', ('index', 'valid', 'violations', 'stats', 'data', 'error'))
+BatchProgress = namedtuple('BatchProgress', ('done', 'failed', 'elapsed', 'rate'))
+
+
+# Evaluator of worker process, initialized once per process
+_worker_evaluator = None
+# Description of error which prevented worker initialization
+_worker_error = None
+
+
+class BatchError(EosError):
+    """
+    Raised when fits cannot be evaluated at all, e.g. when
+    source factory fails.
+    """
+    pass
+
+
+def evaluate(
+    fit_specs, validate=True, skip_checks=(), stats=False, extract=None, workers=None,
+    source_factory=None, chunk_size=64, max_pending=None, progress=None
+):
+    """
+    Evaluate fits described by specs.
+
+    Specs are consumed lazily and are sent to workers in chunks; amount
+    of chunks which are in flight is limited, thus memory use does not
+    depend on amount of specs, as long as results are consumed. If
+    worker process dies, chunks which were being processed at that time
+    are re-run one by one, and specs which kill worker on their own are
+    reported as failed, without affecting other specs.
+
+    Required arguments:
+    fit_specs -- iterable with FitSpec objects
+
+    Optional arguments:
+    validate -- run fit validation, default is True
+    skip_checks -- iterable with restriction types to skip
+    stats -- when True, collect stat snapshot of every fit
+    extract -- callable which receives fit and returns extra data
+        to collect; has to be picklable when workers are used
+    workers -- amount of worker processes, when None, amount of CPUs
+        is used; when 0, fits are evaluated in current process
+    source_factory -- picklable callable which is run once per worker
+        and returns source (or its alias) to use for fits, when None,
+        default source is used
+    chunk_size -- amount of specs sent to worker at once
+    max_pending -- max amount of chunks in flight, when None, it's
+        twice the amount of workers
+    progress -- callable which is called after every chunk with
+        BatchProgress(done, failed, elapsed, rate) object, where rate
+        is amount of processed specs per second
+
+    Return value:
+    Iterator over BatchResult(index, valid, violations, stats, data,
+    error) objects, one per spec and in order of specs. Violations are
+    in {location: {restriction type: error data}} format, where location
+    is tuple which points to item within spec, e.g. ('high', 2); valid
+    and violations are None when fit was not validated, stats is
+    StatSnapshot or None, data is whatever extract returned. When
+    fit could not be evaluated, error contains its description and
+    the rest of fields are None.
+
+    Possible exceptions:
+    BatchError -- raised during iteration when source factory fails,
+        or when worker processes cannot be started
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = max(workers, 1) * 2
+    options = (source_factory, validate, frozenset(skip_checks), stats, extract)
+    chunks = _iter_chunks(fit_specs, chunk_size)
+    if workers == 0:
+        results = _run_local(chunks, options)
+    else:
+        results = _run_pool(chunks, options, workers, max_pending)
+    return _report(results, progress)
+
+
+class _Evaluator:
+    """
+    Build and evaluate fits out of specs, using source which
+    is fetched once on initialization.
+    """
+
+    def __init__(self, source_factory, validate, skip_checks, stats, extract):
+        if source_factory is None:
+            self.__source = SourceManager.default
+        else:
+            self.__source = source_factory()
+        self.__validate = validate
+        self.__skip_checks = skip_checks
+        self.__stats = stats
+        self.__extract = extract
+
+    def run(self, chunk):
+        return [self.__evaluate(index, spec) for index, spec in chunk]
+
+    def __evaluate(self, index, spec):
+        try:
+            # Restriction checks rely on stats, thus stat service is
+            # needed for validation even when snapshot isn't requested
+            fit = Fit(
+                source=self.__source, restrictions=self.__validate,
+                stats=self.__stats or self.__validate)
+            locations = _fill_fit(fit, spec)
+            valid = violations = None
+            if self.__validate:
+                violations = {}
+                try:
+                    fit.validate(self.__skip_checks)
+                except ValidationError as e:
+                    for item, item_errors in e.args[0].items():
+                        violations[locations[item]] = item_errors
+                valid = not violations
+            stats = fit.stats.snapshot() if self.__stats else None
+            data = self.__extract(fit) if self.__extract is not None else None
+        except Exception as e:
+            return _make_error(index, _describe_error(e))
+        return BatchResult(index=index, valid=valid, violations=violations, stats=stats, data=data, error=None)
+
+
+def _make_error(index, error):
+    return BatchResult(index=index, valid=None, violations=None, stats=None, data=None, error=error)
+
+
+def _describe_error(error):
+    try:
+        message = str(error)
+    except Exception:
+        message = None
+    if not message:
+        return type(error).__name__
+    return '{}: {}'.format(type(error).__name__, message)
+
+
+def _iter_chunks(fit_specs, chunk_size):
+    """Split specs into lists of (index, spec) pairs."""
+    indexed = enumerate(fit_specs)
+    while True:
+        chunk = list(islice(indexed, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _make_evaluator(options):
+    try:
+        return _Evaluator(*options)
+    except Exception as e:
+        raise BatchError('source factory failed: {}'.format(_describe_error(e))) from e
+
+
+def _init_worker(options):
+    # Exceptions raised by initializer break the whole pool, which
+    # can't be told apart from spec which kills worker; thus error
+    # is stored and reported when worker is asked to do anything
+    global _worker_evaluator, _worker_error
+    try:
+        _worker_evaluator = _make_evaluator(options)
+    except BatchError as e:
+        _worker_error = e.args[0]
+
+
+def _check_worker():
+    if _worker_evaluator is None:
+        raise BatchError(_worker_error)
+
+
+def _run_worker_chunk(chunk):
+    _check_worker()
+    return _worker_evaluator.run(chunk)
+
+
+def _run_local(chunks, options):
+    evaluator = _make_evaluator(options)
+    for chunk in chunks:
+        yield evaluator.run(chunk)
+
+
+def _run_pool(chunks, options, workers, max_pending):
+    """
+    Run chunks in process pool, yielding chunk results in order.
+
+    When pool breaks, it is not known which of chunks caused it, thus
+    all chunks which were in flight are re-run in isolation, one at a
+    time. Isolated chunk which breaks pool is split into single-spec
+    chunks, and single spec which breaks pool is reported as failed.
+    """
+    def make_executor():
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options,))
+
+    def submit(chunk):
+        # Pool can be found broken on submission as well, then
+        # it is handled when its result is requested
+        try:
+            return executor.submit(_run_worker_chunk, chunk)
+        except BrokenProcessPool:
+            return None
+
+    def restart():
+        # Make sure that fresh pool is able to do anything before
+        # blaming specs; otherwise every spec would be reported as
+        # failed, with pool restart per spec
+        nonlocal executor
+        executor.shutdown(wait=False)
+        executor = make_executor()
+        try:
+            executor.submit(_check_worker).result()
+        except BrokenProcessPool as e:
+            raise BatchError('worker processes cannot be started') from e
+
+    executor = make_executor()
+    # Format: deque([(chunk, future)])
+    pending = deque()
+    try:
+        while True:
+            for chunk in islice(chunks, max_pending - len(pending)):
+                pending.append((chunk, submit(chunk)))
+            if not pending:
+                return
+            chunk, future = pending[0]
+            try:
+                if future is None:
+                    raise BrokenProcessPool
+                results = future.result()
+            except BrokenProcessPool:
+                logger.warning('worker process died, re-running {} chunks in isolation'.format(len(pending)))
+                suspects = deque(c for c, _ in pending)
+                pending.clear()
+                restart()
+                while suspects:
+                    chunk = suspects.popleft()
+                    future = submit(chunk)
+                    try:
+                        if future is None:
+                            raise BrokenProcessPool
+                        results = future.result()
+                    except BrokenProcessPool:
+                        restart()
+                        if len(chunk) > 1:
+                            suspects.extendleft([pair] for pair in reversed(chunk))
+                            continue
+                        index = chunk[0][0]
+                        logger.warning('spec {} terminated worker process'.format(index))
+                        results = [_make_error(index, 'worker process terminated abruptly')]
+                    yield results
+                continue
+            pending.popleft()
+            yield results
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _report(chunk_results, progress):
+    """Flatten chunk results, reporting throughput if requested."""
+    started = perf_counter()
+    done = 0
+    failed = 0
+    for results in chunk_results:
+        yield from results
+        if progress is None:
+            continue
+        done += len(results)
+        failed += sum(1 for r in results if r.error is not None)
+        elapsed = perf_counter() - started
+        rate = done / elapsed if elapsed > 0 else None
+        progress(BatchProgress(done=done, failed=failed, elapsed=elapsed, rate=rate))
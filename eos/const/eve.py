@@ -56,6 +56,15 @@ class Attribute(IntEnum):
     explosive_damage = 116
     kinetic_damage = 117
     thermal_damage = 118
+    # Damage application
+    aoe_cloud_size = 654
+    aoe_damage_reduction_factor = 1353
+    aoe_velocity = 653
+    explosion_delay = 281
+    falloff = 158
+    max_range = 54
+    optimal_sig_radius = 620
+    tracking_speed = 160
     # Resistances
     armor_em_damage_resonance = 267
     armor_explosive_damage_resonance = 268
@@ -75,6 +84,9 @@ class Attribute(IntEnum):
     shield_capacity = 263
     # Repairing
     armor_damage_amount = 84
+    # Capacitor
+    capacitor_capacity = 482
+    recharge_rate = 55
     # Charge-related
     charge_group_1 = 604
     charge_group_2 = 605
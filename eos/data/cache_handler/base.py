@@ -34,6 +34,11 @@ class BaseCacheHandler(metaclass=ABCMeta):
     def get_type(self, type_id):
         ...
 
+    @abstractmethod
+    def get_type_ids(self):
+        """Return iterable with IDs of all eve types in cache."""
+        ...
+
     @abstractmethod
     def get_attribute(self, attr_id):
         ...
@@ -107,6 +107,9 @@ class JsonCacheHandler(BaseCacheHandler):
             self.__type_obj_cache[type_id] = type_
         return type_
 
+    def get_type_ids(self):
+        return [int(type_id) for type_id in self.__type_data_cache]
+
     def get_attribute(self, attr_id):
         try:
             attr_id = int(attr_id)
@@ -23,7 +23,6 @@ from logging import getLogger
 
 from eos.const.eos import State, ModifierTargetFilter, ModifierDomain, ModifierOperator
 from eos.const.eve import Attribute
-from eos.fit.messages import AttrValueChanged, AttrValueChangedOverride
 from ..python import BasePythonModifier
 from ..exception import ModificationCalculationError
 
@@ -63,28 +62,10 @@ class PropulsionModuleVelocityBoostModifier(BasePythonModifier):
             raise ModificationCalculationError from e
         return ModifierOperator.post_percent, ship_speed_percentage
 
-    def _revise_on_attr_change(self, message, carrier_item, fit):
-        """
-        If any of the attribute values this modifier relies on is changed,
-        then modification value can be changed as well.
-        """
-        if (
-            (message.item is fit.ship and message.attr == Attribute.mass) or
-            (message.item is carrier_item and message.attr == Attribute.speed_factor) or
-            (message.item is carrier_item and message.attr == Attribute.speed_boost_factor)
-        ):
-            return True
-        return False
-
-    _revision_map = {
-        AttrValueChanged: _revise_on_attr_change,
-        AttrValueChangedOverride: _revise_on_attr_change
-    }
-
     @property
-    def revise_message_types(self):
-        return set(self._revision_map.keys())
-
-    def revise_modification(self, message, carrier_item, fit):
-        revision_func = self._revision_map[type(message)]
-        return revision_func(self, message, carrier_item, fit)
+    def revise_attrs(self):
+        return (
+            (ModifierDomain.ship, Attribute.mass),
+            (ModifierDomain.self, Attribute.speed_factor),
+            (ModifierDomain.self, Attribute.speed_boost_factor)
+        )
@@ -19,7 +19,7 @@
 # ===============================================================================
 
 
-from abc import ABCMeta, abstractmethod
+from abc import ABCMeta
 
 from eos.util.repr import make_repr_str
 from .base import BaseModifier
@@ -41,15 +41,29 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
         )
 
     @property
-    @abstractmethod
+    def revise_attrs(self):
+        """
+        Iterable with (domain, attribute ID) pairs, which describe
+        attributes modification provided by this modifier depends on.
+        Domain is relative to carrier item: ModifierDomain.self for
+        carrier item itself, ModifierDomain.ship and ModifierDomain.character
+        for ship and character of fit carrier item belongs to. When value
+        of any of these attributes changes, calculated value of target
+        attribute on all items targeted by modifier will be removed to
+        force recalculation. Unlike message-based revision, attribute
+        changes are routed only to modifiers which depend on them.
+        """
+        return ()
+
+    @property
     def revise_message_types(self):
         """
         Iterable with message types which potentially may change
-        modification provided by this modifier.
+        modification provided by this modifier, and which cannot be
+        expressed as attribute dependencies.
         """
-        ...
+        return ()
 
-    @abstractmethod
     def revise_modification(self, message, carrier_item, fit):
         """
         Rely on provided event and context for it, decide if modification
@@ -57,7 +71,7 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
         value of target attribute on all items targeted by modifier will be
         removed to force recalculation.
         """
-        ...
+        return False
 
     # Auxiliary methods
     def __repr__(self):
@@ -0,0 +1,294 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Damage application math. All functions accept target parameters
+as TargetData, where each field is either number or sequence of
+numbers; numbers are broadcast against sequences. When NumPy is
+available, sequences are processed as arrays (any shapes which
+can be broadcast are accepted, results are arrays). Pure python
+fallback requires all sequences to be flat and of equal length,
+results are lists. If all target parameters are numbers, results
+are numbers as well.
+"""
+
+
+from itertools import product
+from math import inf
+
+from eos.util.numpy_support import numpy
+from .tuples import DamageTypesTotal, TargetData
+
+
+# Chance of turret shot to be wrecking hit
+WRECKING_CHANCE = 0.01
+# Damage multiplier of wrecking hits
+WRECKING_MULTIPLIER = 3
+
+
+def make_target_grid(distance, transversal=0, signature_radius=0, velocity=0):
+    """
+    Build target data for every combination of passed target
+    parameters.
+
+    Required arguments:
+    distance -- number or iterable with distances to target
+
+    Optional arguments:
+    transversal, signature_radius, velocity -- number or iterable
+        with numbers for each of target parameters, by default 0
+
+    Return value:
+    TargetData with flat sequences; combinations are ordered so
+    that distance changes slowest and velocity - fastest
+    """
+    axes = [
+        (value,) if isinstance(value, (int, float)) else tuple(value)
+        for value in (distance, transversal, signature_radius, velocity)
+    ]
+    if numpy is not None:
+        grids = numpy.meshgrid(*(numpy.asarray(axis, dtype=float) for axis in axes), indexing='ij')
+        return TargetData(*(grid.ravel() for grid in grids))
+    return TargetData(*(list(column) for column in zip(*product(*axes))))
+
+
+def turret_chance_to_hit(target_data, optimal, falloff, tracking, optimal_sig_radius):
+    """
+    Calculate chance of turret to hit targets.
+
+    Required arguments:
+    target_data -- TargetData with target parameters
+    optimal, falloff -- turret optimal range and falloff, in meters
+    tracking -- turret tracking speed, in radians per second
+    optimal_sig_radius -- signature radius which turret tracking
+        is balanced against
+
+    Return value:
+    Chance to hit in range [0, 1] for each target
+    """
+    (distance, transversal, signature, _), scalar = _prepare(target_data)
+    if numpy is not None:
+        angular = numpy.where(distance > 0, transversal / numpy.where(distance > 0, distance, 1), 0)
+        tracking_term = _np_ratio(angular * optimal_sig_radius, tracking * signature) ** 2
+        range_term = _np_ratio(numpy.maximum(distance - optimal, 0), falloff) ** 2
+        return _finalize(0.5 ** (tracking_term + range_term), scalar)
+    chances = []
+    for d, t, s in zip(distance, transversal, signature):
+        angular = t / d if d > 0 else 0
+        tracking_term = _ratio(angular * optimal_sig_radius, tracking * s) ** 2
+        range_term = _ratio(max(d - optimal, 0), falloff) ** 2
+        chances.append(0.5 ** (tracking_term + range_term))
+    return _finalize(chances, scalar)
+
+
+def turret_damage_multiplier(chance_to_hit):
+    """
+    Calculate average damage multiplier of turret shots,
+    accounting for misses, glancing and wrecking hits.
+
+    Required arguments:
+    chance_to_hit -- chance to hit, as returned by
+        turret_chance_to_hit()
+
+    Return value:
+    Damage multiplier for each target
+    """
+    if numpy is not None:
+        chance = numpy.asarray(chance_to_hit, dtype=float)
+        wrecking = numpy.minimum(chance, WRECKING_CHANCE)
+        normal = chance - wrecking
+        multiplier = (
+            wrecking * WRECKING_MULTIPLIER +
+            numpy.where(normal > 0, normal * ((WRECKING_CHANCE + chance) / 2 + 0.49), 0)
+        )
+        return _finalize(multiplier, chance.ndim == 0)
+    scalar = isinstance(chance_to_hit, (int, float))
+    multipliers = []
+    for chance in ((chance_to_hit,) if scalar else chance_to_hit):
+        wrecking = min(chance, WRECKING_CHANCE)
+        normal = chance - wrecking
+        multiplier = wrecking * WRECKING_MULTIPLIER
+        if normal > 0:
+            multiplier += normal * ((WRECKING_CHANCE + chance) / 2 + 0.49)
+        multipliers.append(multiplier)
+    return _finalize(multipliers, scalar)
+
+
+def missile_damage_multiplier(
+    target_data, flight_range, explosion_radius,
+    explosion_velocity, damage_reduction_factor
+):
+    """
+    Calculate share of missile damage applied to targets.
+
+    Required arguments:
+    target_data -- TargetData with target parameters
+    flight_range -- distance missile can fly, in meters
+    explosion_radius, explosion_velocity -- missile explosion
+        parameters
+    damage_reduction_factor -- exponent which defines how fast
+        damage drops for fast targets
+
+    Return value:
+    Damage multiplier in range [0, 1] for each target
+    """
+    (distance, _, signature, velocity), scalar = _prepare(target_data)
+    if numpy is not None:
+        sig_term = _np_ratio(signature, explosion_radius)
+        velocity_term = _np_ratio(signature * explosion_velocity, explosion_radius * velocity)
+        multiplier = numpy.minimum(numpy.minimum(sig_term, velocity_term ** damage_reduction_factor), 1)
+        return _finalize(numpy.where(distance > flight_range, 0, multiplier), scalar)
+    multipliers = []
+    for d, s, v in zip(distance, signature, velocity):
+        if d > flight_range:
+            multipliers.append(0)
+            continue
+        sig_term = _ratio(s, explosion_radius)
+        velocity_term = _ratio(s * explosion_velocity, explosion_radius * v)
+        multipliers.append(min(sig_term, velocity_term ** damage_reduction_factor, 1))
+    return _finalize(multipliers, scalar)
+
+
+def unreduced_damage_multiplier(target_data):
+    """
+    Get damage multiplier for weapons which apply full
+    damage to any target.
+
+    Required arguments:
+    target_data -- TargetData with target parameters
+
+    Return value:
+    Damage multiplier of 1 for each target
+    """
+    (distance, _, _, _), scalar = _prepare(target_data)
+    if numpy is not None:
+        return _finalize(numpy.ones_like(distance), scalar)
+    return _finalize([1.0] * len(distance), scalar)
+
+
+def apply_damage_multiplier(damage, multiplier):
+    """
+    Multiply damage stats by damage multiplier.
+
+    Required arguments:
+    damage -- object with em, thermal, kinetic and explosive
+        attributes, as numbers or Nones
+    multiplier -- number or sequence of numbers
+
+    Return value:
+    DamageTypesTotal with per-target damage
+    """
+    return _make_damage_total(*(
+        None if value is None else _scale(multiplier, value)
+        for value in (damage.em, damage.thermal, damage.kinetic, damage.explosive)
+    ))
+
+
+def sum_damage(damages):
+    """
+    Sum per-target damage stats of multiple items.
+
+    Required arguments:
+    damages -- iterable with DamageTypesTotal objects, as
+        returned by apply_damage_multiplier()
+
+    Return value:
+    DamageTypesTotal with summed per-target damage
+    """
+    sums = [None, None, None, None]
+    for damage in damages:
+        for i, value in enumerate((damage.em, damage.thermal, damage.kinetic, damage.explosive)):
+            if value is None:
+                continue
+            sums[i] = value if sums[i] is None else _add(sums[i], value)
+    return _make_damage_total(*sums)
+
+
+def _prepare(target_data):
+    """
+    Convert target data into form used in calculations.
+
+    Return value:
+    Tuple with sequence of target parameters and flag which
+    tells if all target parameters are numbers
+    """
+    if numpy is not None:
+        fields = numpy.broadcast_arrays(*(numpy.asarray(f, dtype=float) for f in target_data))
+        return fields, fields[0].ndim == 0
+    lengths = {len(f) for f in target_data if not isinstance(f, (int, float))}
+    if len(lengths) > 1:
+        raise ValueError('target parameter sequences have different lengths')
+    if not lengths:
+        return tuple((f,) for f in target_data), True
+    length = lengths.pop()
+    fields = tuple(
+        (f,) * length if isinstance(f, (int, float)) else tuple(f)
+        for f in target_data
+    )
+    return fields, False
+
+
+def _finalize(values, scalar):
+    if not scalar:
+        return values
+    if isinstance(values, list):
+        return float(values[0])
+    return float(values)
+
+
+def _ratio(dividend, divisor):
+    """Divide, treating 0 / 0 as 0 and x / 0 as infinity."""
+    if divisor == 0:
+        return 0 if dividend == 0 else inf
+    return dividend / divisor
+
+
+def _np_ratio(dividend, divisor):
+    dividend = numpy.asarray(dividend, dtype=float)
+    divisor = numpy.asarray(divisor, dtype=float)
+    safe_divisor = numpy.where(divisor == 0, 1, divisor)
+    return numpy.where(divisor == 0, numpy.where(dividend == 0, 0, inf), dividend / safe_divisor)
+
+
+def _scale(vector, factor):
+    if isinstance(vector, (int, float)):
+        return vector * factor
+    if numpy is not None:
+        return numpy.asarray(vector) * factor
+    return [value * factor for value in vector]
+
+
+def _add(vector1, vector2):
+    if isinstance(vector1, (int, float)) and isinstance(vector2, (int, float)):
+        return vector1 + vector2
+    if numpy is not None:
+        return numpy.add(vector1, vector2)
+    return [value1 + value2 for value1, value2 in zip(vector1, vector2)]
+
+
+def _make_damage_total(em, therm, kin, expl):
+    components = [c for c in (em, therm, kin, expl) if c is not None]
+    if not components:
+        return DamageTypesTotal(em=None, thermal=None, kinetic=None, explosive=None, total=None)
+    total = components[0]
+    for component in components[1:]:
+        total = _add(total, component)
+    return DamageTypesTotal(em=em, thermal=therm, kinetic=kin, explosive=expl, total=total)
@@ -0,0 +1,216 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.util.pubsub import BaseSubscriber
+from .messages import (
+    ItemAdded, ItemRemoved, ItemStateChanged, EffectsEnabled, EffectsDisabled,
+    AttrValueChangedOverride
+)
+
+
+# Names of fit attributes which hold single items
+SINGLE_ITEM_ATTRS = ('ship', 'stance', 'character', 'effect_beacon')
+
+
+class FitBranch(BaseSubscriber):
+    """
+    What-if branch over fit.
+
+    Branch does not copy anything: edits are applied to the fit
+    itself, so that calculation services process them incrementally
+    as usual, and only items and attributes affected by the edit are
+    recalculated. Branch keeps journal of pre-edit state of everything
+    which has been touched, which allows to roll fit back to state it
+    had when branch has been started. Ordered containers, single-item
+    containers, module charges and skill levels are cheap to snapshot
+    and are captured when branch is started; everything else is
+    recorded on the first change, using fit messages.
+
+    Can be used as context manager; changes which have not been
+    committed by the end of the block are discarded.
+
+    Required arguments:
+    fit -- fit to start branch on
+    """
+
+    def __init__(self, fit):
+        self.__fit = fit
+        self.__active = True
+        # Format: {attribute name: item}
+        self.__singles = {name: getattr(fit, name) for name in SINGLE_ITEM_ATTRS}
+        # Format: {rack: [items and Nones]}
+        racks = fit.modules
+        self.__racks = {rack: list(rack) for rack in (racks.high, racks.med, racks.low)}
+        # Format: {module: charge}
+        self.__charges = {module: module.charge for module in racks.items()}
+        # Format: {item: {attribute ID: override data}}
+        self.__overrides = {skill: dict(skill.attributes._overrides) for skill in fit.skills}
+        # Format: {item: (container, membership status)}
+        self.__memberships = {}
+        # Format: {item: state}
+        self.__states = {}
+        # Format: {item: {effect ID: effect status}}
+        self.__effect_statuses = {}
+        # Items whose overrides have been changed
+        self.__overridden = set()
+        fit._subscribe(self, self._handler_map.keys())
+
+    @property
+    def active(self):
+        """Return True if branch has not been committed or discarded yet."""
+        return self.__active
+
+    def commit(self):
+        """Keep all changes made to fit since branch has been started."""
+        if not self.__active:
+            return
+        self.__close()
+
+    def discard(self):
+        """Roll fit back to state it had when branch has been started."""
+        if not self.__active:
+            return
+        self.__close()
+        fit = self.__fit
+        for item, state in self.__states.items():
+            if item.state != state:
+                item.state = state
+        for item, statuses in self.__effect_statuses.items():
+            item._set_effects_status({e for e, s in statuses.items() if s is False}, False)
+            item._set_effects_status({e for e, s in statuses.items() if s is True}, True)
+        for item in self.__overridden:
+            self.__restore_overrides(item)
+        # Get rid of items added within branch before bringing back removed
+        # ones, to avoid clashes in type-restricted containers
+        memberships = self.__memberships
+        for item, (container, member) in memberships.items():
+            if not member and item in container:
+                container.remove(item)
+        for item, (container, member) in memberships.items():
+            if member and item not in container:
+                container.add(item)
+        for name, item in self.__singles.items():
+            if getattr(fit, name) is not item:
+                setattr(fit, name, item)
+        for rack, snapshot in self.__racks.items():
+            self.__restore_rack(rack, snapshot)
+        for module, charge in self.__charges.items():
+            if module.charge is not charge:
+                module.charge = charge
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.discard()
+
+    # Message handling
+    def _handle_item_addition(self, message):
+        self.__record_membership(message.item, False)
+
+    def _handle_item_removal(self, message):
+        self.__record_membership(message.item, True)
+
+    def _handle_item_state_change(self, message):
+        self.__states.setdefault(message.item, message.old)
+
+    def _handle_effects_enabling(self, message):
+        statuses = self.__effect_statuses.setdefault(message.item, {})
+        for effect_id in message.effects:
+            statuses.setdefault(effect_id, False)
+
+    def _handle_effects_disabling(self, message):
+        statuses = self.__effect_statuses.setdefault(message.item, {})
+        for effect_id in message.effects:
+            statuses.setdefault(effect_id, True)
+
+    def _handle_attr_override_change(self, message):
+        if message.item in self.__overrides:
+            self.__overridden.add(message.item)
+
+    _handler_map = {
+        ItemAdded: _handle_item_addition,
+        ItemRemoved: _handle_item_removal,
+        ItemStateChanged: _handle_item_state_change,
+        EffectsEnabled: _handle_effects_enabling,
+        EffectsDisabled: _handle_effects_disabling,
+        AttrValueChangedOverride: _handle_attr_override_change
+    }
+
+    def _notify(self, message):
+        try:
+            handler = self._handler_map[type(message)]
+        except KeyError:
+            return
+        handler(self, message)
+
+    # Private methods
+    def __close(self):
+        self.__active = False
+        self.__fit._unsubscribe(self, self._handler_map.keys())
+
+    def __record_membership(self, item, member):
+        """
+        Remember if item has been part of its unordered container
+        before it was touched for the first time. Items from other
+        containers are restored from snapshot and are skipped here.
+        """
+        if item in self.__memberships:
+            return
+        fit = self.__fit
+        for container in (
+            fit.skills, fit.implants, fit.boosters,
+            fit.subsystems, fit.rigs, fit.drones
+        ):
+            if item in container:
+                self.__memberships[item] = (container, member)
+                return
+
+    def __restore_overrides(self, item):
+        attributes = item.attributes
+        snapshot = self.__overrides[item]
+        for attr in set(attributes._overrides).difference(snapshot):
+            attributes._override_del(attr)
+        for attr, data in snapshot.items():
+            if attributes._overrides.get(attr) != data:
+                attributes._override_set(attr, data.value, persist=data.persistent)
+
+    def __restore_rack(self, rack, snapshot):
+        """
+        Free all slots which do not match snapshot, then put
+        missing items back to their positions. Items which
+        kept their positions are not touched.
+        """
+        current = list(rack)
+        if current == snapshot:
+            return
+        for index, item in enumerate(current):
+            if item is None:
+                continue
+            if index < len(snapshot) and snapshot[index] is item:
+                continue
+            rack.free(item)
+        for index, item in enumerate(snapshot):
+            if item is None:
+                continue
+            if index < len(rack) and rack[index] is item:
+                continue
+            rack.place(index, item)
@@ -29,6 +29,7 @@ from eos.data.cache_handler.exception import AttributeFetchError
 from eos.fit.null_source import NoSourceError
 from eos.fit.messages import AttrValueChanged, AttrValueChangedOverride
 from eos.util.keyed_set import KeyedSet
+from eos.util.volatile_cache import track_volatile_dependency
 from .exception import BaseValueError, AttributeMetaError
 
 
@@ -108,6 +109,8 @@ class MutableAttributeMap:
     item -- item, to which this map is assigned
     """
 
+    __slots__ = ('__item', '__modified_attributes', '__overridden_attributes', '__cap_map', '__keys')
+
     def __init__(self, item):
         # Reference to item for internal needs
         self.__item = item
@@ -119,8 +122,14 @@ class MutableAttributeMap:
         # the time
         self.__overridden_attributes = None
         self.__cap_map = None
+        # Cached set of keys, along with base attribute
+        # dictionary it has been built against
+        # Format: (base attributes, keys)
+        self.__keys = None
 
     def __getitem__(self, attr):
+        # Let volatile data know what it's calculated from
+        track_volatile_dependency((self.__item, attr))
         # Try getting override first
         if attr in self._overrides:
             return self._overrides[attr].value
@@ -129,29 +138,64 @@ class MutableAttributeMap:
             val = self.__modified_attributes[attr]
         # Else, we have to run full calculation process
         except KeyError:
-            try:
-                val = self.__modified_attributes[attr] = self.__calculate(attr)
-            except BaseValueError as e:
-                msg = 'unable to find base value for attribute {} on eve type {}'.format(
-                    e.args[0], self.__item._eve_type_id)
-                logger.warning(msg)
-                raise KeyError(attr) from e
-            except AttributeMetaError as e:
-                msg = 'unable to fetch metadata for attribute {}, requested for eve type {}'.format(
-                    e.args[0], self.__item._eve_type_id)
-                logger.error(msg)
-                raise KeyError(attr) from e
-            except NoSourceError as e:
-                raise KeyError(attr) from e
-            else:
-                self.__item._fit._publish(AttrValueChanged(item=self.__item, attr=attr))
+            val = self.__calculate_and_store(attr)
         return val
 
+    def get_many(self, attrs):
+        """
+        Get values of multiple attributes at once. Values which
+        are not calculated yet are calculated using single pass
+        over affectors of the item.
+
+        Required arguments:
+        attrs -- iterable with attribute IDs
+
+        Return value:
+        Dictionary in {attribute ID: value} format; attributes
+        whose values cannot be fetched are not included
+        """
+        values = {}
+        to_calculate = []
+        overrides = self._overrides
+        for attr in attrs:
+            track_volatile_dependency((self.__item, attr))
+            if attr in overrides:
+                values[attr] = overrides[attr].value
+            elif attr in self.__modified_attributes:
+                values[attr] = self.__modified_attributes[attr]
+            else:
+                to_calculate.append(attr)
+        if len(to_calculate) == 0:
+            return values
+        try:
+            modifications = self.__item._fit._calculator.get_modifications_many(self.__item, to_calculate)
+        # If there's no fit, calculation will fail anyway
+        except AttributeError:
+            modifications = {}
+        for attr in to_calculate:
+            # Value might've been calculated when fetching modifications
+            # (e.g. when item modifies itself)
+            try:
+                values[attr] = self.__modified_attributes[attr]
+                continue
+            except KeyError:
+                pass
+            try:
+                values[attr] = self.__calculate_and_store(attr, modifications.get(attr, ()))
+            except KeyError:
+                continue
+        return values
+
     def __len__(self):
         return len(self.keys())
 
     def __contains__(self, attr):
-        return attr in self.keys()
+        if attr in self.__modified_attributes or attr in self._overrides:
+            return True
+        try:
+            return attr in self.__item._eve_type.attributes
+        except NoSourceError:
+            return False
 
     def __iter__(self):
         for k in self.keys():
@@ -173,6 +217,7 @@ class MutableAttributeMap:
         # And make sure services are aware of changed value if it
         # actually was changed
         else:
+            self.__keys = None
             self.__item._fit._publish(AttrValueChanged(item=self.__item, attr=attr))
 
     def get(self, attr, default=None):
@@ -186,26 +231,73 @@ class MutableAttributeMap:
             base_attrs = self.__item._eve_type.attributes
         except NoSourceError:
             base_attrs = {}
-        # Return union of attributes from base, modified and override dictionary
-        return self.__modified_attributes.keys() | base_attrs.keys() | self._overrides.keys()
+        # Union of attributes from base, modified and override dictionary
+        # is cached, until any of these sets changes
+        if self.__keys is None or self.__keys[0] is not base_attrs:
+            keys = frozenset(self.__modified_attributes.keys() | base_attrs.keys() | self._overrides.keys())
+            self.__keys = (base_attrs, keys)
+        return self.__keys[1]
 
     def clear(self):
         """Reset map to its initial state."""
         self.__modified_attributes.clear()
         self.__cap_map = None
+        self.__keys = None
         # Clear only non-persistent overrides
         if self.__overridden_attributes is not None:
             overrides = self.__overridden_attributes
             for attr in tuple(filter(lambda attr: overrides[attr].persistent is False, overrides)):
                 self._override_del(attr)
 
-    def __calculate(self, attr):
+    def __calculate_and_store(self, attr, modifications=None):
+        """
+        Calculate value of attribute, store it and notify
+        services about it.
+
+        Required arguments:
+        attr -- ID of attribute to be calculated
+
+        Optional arguments:
+        modifications -- iterable with modifications of attribute,
+            if not specified, they are requested from calculator
+
+        Return value:
+        Calculated attribute value
+
+        Possible exceptions:
+        KeyError -- raised when value cannot be calculated
+        """
+        try:
+            val = self.__modified_attributes[attr] = self.__calculate(attr, modifications)
+        except BaseValueError as e:
+            msg = 'unable to find base value for attribute {} on eve type {}'.format(
+                e.args[0], self.__item._eve_type_id)
+            logger.warning(msg)
+            raise KeyError(attr) from e
+        except AttributeMetaError as e:
+            msg = 'unable to fetch metadata for attribute {}, requested for eve type {}'.format(
+                e.args[0], self.__item._eve_type_id)
+            logger.error(msg)
+            raise KeyError(attr) from e
+        except NoSourceError as e:
+            raise KeyError(attr) from e
+        keys = self.__keys
+        if keys is not None and attr not in keys[1]:
+            self.__keys = None
+        self.__item._fit._publish(AttrValueChanged(item=self.__item, attr=attr))
+        return val
+
+    def __calculate(self, attr, modifications=None):
         """
         Run calculations to find the actual value of attribute.
 
         Required arguments:
         attr -- ID of attribute to be calculated
 
+        Optional arguments:
+        modifications -- iterable with modifications of attribute,
+            if not specified, they are requested from calculator
+
         Return value:
         Calculated attribute value
 
@@ -241,7 +333,9 @@ class MutableAttributeMap:
         # Format: {operator: [values]}
         penalized_mods = {}
         # Now, go through all affectors affecting our item
-        for operator, mod_value, carrier_item in self.__item._fit._calculator.get_modifications(self.__item, attr):
+        if modifications is None:
+            modifications = self.__item._fit._calculator.get_modifications(self.__item, attr)
+        for operator, mod_value, carrier_item in modifications:
             # Decide if it should be stacking penalized or not, based on stackable property,
             # carrier item eve type category and operator
             penalize = (
@@ -344,6 +438,52 @@ class MutableAttributeMap:
             list_result *= chain_result
         return list_result
 
+    def _copy_from(self, other):
+        """
+        Replace contents of this map with copy of contents
+        of passed map (calculated values, overrides and cap
+        data). Nothing is published, thus it should be used
+        only when both maps are known to have the same
+        context, e.g. when item is part of cloned fit.
+        """
+        self.__modified_attributes = dict(other.__modified_attributes)
+        if other.__overridden_attributes is None:
+            self.__overridden_attributes = None
+        else:
+            self.__overridden_attributes = dict(other.__overridden_attributes)
+        if other.__cap_map is None:
+            self.__cap_map = None
+        else:
+            self.__cap_map = KeyedSet()
+            for capping_attr, capped_attrs in other.__cap_map.items():
+                self.__cap_map.add_data_set(capping_attr, capped_attrs)
+        self.__keys = None
+
+    def _dump_values(self):
+        """
+        Return copy of calculated values and cap data,
+        in ({attribute ID: value}, {capping attribute ID:
+        {capped attribute IDs}}) format.
+        """
+        caps = {capping_attr: set(capped_attrs) for capping_attr, capped_attrs in self._cap_map.items()}
+        return dict(self.__modified_attributes), caps
+
+    def _load_values(self, values, caps):
+        """
+        Replace calculated values and cap data with passed ones,
+        which are in format returned by _dump_values(). Like
+        _copy_from(), it doesn't publish anything, thus values
+        have to be known to be valid in context of item.
+        """
+        self.__modified_attributes = dict(values)
+        if caps:
+            self.__cap_map = KeyedSet()
+            for capping_attr, capped_attrs in caps.items():
+                self.__cap_map.add_data_set(capping_attr, capped_attrs)
+        else:
+            self.__cap_map = None
+        self.__keys = None
+
     # Override-related methods
     @property
     def _overrides(self):
@@ -364,6 +504,7 @@ class MutableAttributeMap:
         else:
             old_composite = self.__modified_attributes.get(attr)
         self.__overridden_attributes[attr] = OverrideData(value=value, persistent=persist)
+        self.__keys = None
         # If value of attribute is changing after operation, force refresh
         # of attributes which rely on it
         fit = self.__item._fit
@@ -375,6 +516,7 @@ class MutableAttributeMap:
         if attr not in overrides:
             return
         del overrides[attr]
+        self.__keys = None
         # Set overrides map to None if there're none left
         # to save some memory
         if len(overrides) == 0:
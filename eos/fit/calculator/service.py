@@ -19,6 +19,8 @@
 # ===============================================================================
 
 
+from logging import getLogger
+
 from eos.const.eos import State, ModifierDomain
 from eos.data.cache_object.modifier import DogmaModifier, ModificationCalculationError
 from eos.data.cache_object.modifier.python import BasePythonModifier
@@ -32,6 +34,9 @@ from .affector import Affector
 from .register import AffectionRegister
 
 
+logger = getLogger(__name__)
+
+
 class CalculationService(BaseSubscriber):
     """
     Class which collects data about fit item and with
@@ -49,6 +54,11 @@ class CalculationService(BaseSubscriber):
         # Container with affectors which will receive messages
         # Format: {message type: set(affectors)}
         self.__subscribed_affectors = KeyedSet()
+        # Container with affectors which depend on attributes, keyed
+        # by carrier item for attributes of carrier itself, and by
+        # domain for attributes of fit-wide items
+        # Format: {(carrier item or domain, attribute ID): set(affectors)}
+        self.__attr_dependent_affectors = KeyedSet()
         fit._subscribe(self, self._handler_map.keys())
 
     def get_modifications(self, target_item, target_attr):
@@ -75,6 +85,34 @@ class CalculationService(BaseSubscriber):
                 modifications.add((mod_oper, mod_value, carrier_item))
         return modifications
 
+    def get_modifications_many(self, target_item, target_attrs):
+        """
+        Get modifications of multiple target attrs on target item,
+        using single pass over affectors of the item.
+
+        Required arguments:
+        target_item -- item, for which we're getting modifications
+        target_attrs -- iterable with target attribute IDs
+
+        Return value:
+        {target attribute ID: set((operator, modification value, carrier item))}
+        Attributes which are not modified are not included.
+        """
+        target_attrs = set(target_attrs)
+        modifications = {}
+        for modifier, carrier_item in self.__affections.get_affectors(target_item):
+            target_attr = modifier.tgt_attr
+            if target_attr not in target_attrs:
+                continue
+            try:
+                mod_oper, mod_value = modifier.get_modification(carrier_item, self.__fit)
+            # Do nothing here - errors should be logged in modification getter
+            # or even earlier
+            except ModificationCalculationError:
+                continue
+            modifications.setdefault(target_attr, set()).add((mod_oper, mod_value, carrier_item))
+        return modifications
+
     # Handle item addition/removal
     def _handle_item_addition(self, message):
         self.__add_item(message.item)
@@ -156,6 +194,23 @@ class CalculationService(BaseSubscriber):
                 continue
             for target_item in self.__affections.get_affectees(affector):
                 del target_item.attributes[modifier.tgt_attr]
+        # Remove values of target attributes of python modifiers which
+        # declared changing attribute as their dependency
+        attr_dependents = self.__attr_dependent_affectors
+        if not attr_dependents:
+            return
+        fit = self.__fit
+        dependency_keys = [(item, attr)]
+        if item is fit.ship:
+            dependency_keys.append((ModifierDomain.ship, attr))
+        if item is fit.character:
+            dependency_keys.append((ModifierDomain.character, attr))
+        for dependency_key in dependency_keys:
+            # Iterate over copy, as removal of attribute values may
+            # lead to changes of affector map
+            for affector in tuple(attr_dependents.get(dependency_key, ())):
+                for target_item in self.__affections.get_affectees(affector):
+                    del target_item.attributes[affector.modifier.tgt_attr]
 
     def _revise_python_attrib_dependents(self, message):
         """
@@ -267,9 +322,11 @@ class CalculationService(BaseSubscriber):
 
     # Python affector subscription/unsubscription
     def __subscribe_affector(self, affector):
-        """Subscribe python affector to message types it wants"""
+        """Subscribe python affector to message types and attributes it wants"""
         if not isinstance(affector.modifier, BasePythonModifier):
             return
+        for dependency_key in self.__get_attr_dependency_keys(affector):
+            self.__attr_dependent_affectors.add_data(dependency_key, affector)
         to_subscribe = set()
         for msg_type in affector.modifier.revise_message_types:
             # Subscribe service to new message type only if there's
@@ -284,6 +341,8 @@ class CalculationService(BaseSubscriber):
         """Unsubscribe python affector"""
         if not isinstance(affector.modifier, BasePythonModifier):
             return
+        for dependency_key in self.__get_attr_dependency_keys(affector):
+            self.__attr_dependent_affectors.rm_data(dependency_key, affector)
         to_ubsubscribe = set()
         for msg_type in affector.modifier.revise_message_types:
             # Make sure affector will not receive messages anymore
@@ -293,3 +352,20 @@ class CalculationService(BaseSubscriber):
             if msg_type not in self._handler_map and msg_type not in self.__subscribed_affectors:
                 to_ubsubscribe.add(msg_type)
         self.__fit._unsubscribe(self, to_ubsubscribe)
+
+    def __get_attr_dependency_keys(self, affector):
+        """
+        Convert attribute dependencies declared by python modifier
+        into keys of attribute dependency map.
+        """
+        keys = set()
+        for domain, attr in affector.modifier.revise_attrs:
+            if domain == ModifierDomain.self:
+                keys.add((affector.carrier_item, attr))
+            elif domain in (ModifierDomain.ship, ModifierDomain.character):
+                keys.add((domain, attr))
+            else:
+                msg = 'malformed python modifier on eve type {}: unsupported dependency domain {}'.format(
+                    affector.carrier_item._eve_type_id, domain)
+                logger.warning(msg)
+        return keys
@@ -0,0 +1,163 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Capacitor simulation. Capacitor recharges according to EVE formula
+dC/dt = 10 * Cmax / T * (sqrt(C / Cmax) - C / Cmax), which has
+closed-form solution; it is used to advance capacitor level between
+module activations, so that simulation has to process only activation
+events, which are taken in order from heap.
+"""
+
+
+from heapq import heapify, heapreplace
+from math import exp, gcd, sqrt
+
+from .tuples import CapacitorState
+
+
+# Exponent factor of recharge formula solution
+RECHARGE_FACTOR = 5
+# Peak recharge rate, which is reached at 25% of capacitor, is
+# this number multiplied by capacity and divided by recharge time
+PEAK_RECHARGE_RATE = 2.5
+# When simulated time exceeds this amount of seconds, capacitor is
+# considered to be stable
+SIMULATION_TIME_LIMIT = 6 * 60 * 60
+# Activation cycles of all modules align after least common multiple
+# of their periods; when it is longer than this amount of seconds,
+# the longest period is used for stability checks instead
+MAX_ALIGNED_PERIOD = 60 * 60
+# Level at the start of longest period shifts along with phases of
+# other modules and rarely passes stability check, thus unaligned
+# simulation is stopped after this amount of longest periods or
+# capacitor recharge times, whichever is longer
+UNALIGNED_CYCLE_LIMIT = 100
+UNALIGNED_RECHARGE_LIMIT = 3
+# Capacitor is considered stable when its level at the start of
+# aligned period changes by less than this share of capacity
+STABILITY_TOLERANCE = 1e-6
+
+
+def simulate_capacitor(capacity, recharge_time, drains):
+    """
+    Simulate capacitor of ship with all modules activated at the
+    same time and running continuously.
+
+    Required arguments:
+    capacity -- capacitor capacity
+    recharge_time -- capacitor recharge time, in seconds
+    drains -- iterable with objects with amount (capacitor used per
+        activation, negative for capacitor injection) and period
+        (seconds between activations) attributes
+
+    Return value:
+    CapacitorState, which tells if capacitor is stable; for stable
+    capacitor, stable_level is average share of capacity it oscillates
+    around, for unstable - depletion_time is time in seconds after
+    which there's not enough capacitor to activate some module. If
+    capacity or recharge time are not available, all fields are None.
+    """
+    if capacity is None or recharge_time is None:
+        return CapacitorState(stable=None, stable_level=None, depletion_time=None)
+    # Drains which share period are activated at the same time,
+    # so they are processed as single drain. Periods are converted
+    # into milliseconds to align cycles without rounding errors
+    amounts = {}
+    for drain in drains:
+        amount = drain.amount
+        period = drain.period
+        if not amount or not period or period <= 0:
+            continue
+        period_ms = round(period * 1000)
+        amounts[period_ms] = amounts.get(period_ms, 0) + amount
+    if not amounts:
+        return CapacitorState(stable=True, stable_level=1.0, depletion_time=None)
+    if max(amounts.values()) > capacity:
+        return CapacitorState(stable=False, stable_level=None, depletion_time=0.0)
+    if recharge_time <= 0:
+        return CapacitorState(stable=True, stable_level=1.0, depletion_time=None)
+    drain_rate = sum(amount * 1000 / period_ms for period_ms, amount in amounts.items())
+    # Continuous drain over peak recharge rate cannot be sustained,
+    # no need to check stability - just find out when it runs out
+    sustainable = drain_rate <= PEAK_RECHARGE_RATE * capacity / recharge_time
+    return _simulate(capacity, recharge_time, amounts, sustainable)
+
+
+def _simulate(capacity, recharge_time, amounts, sustainable):
+    """
+    Process activation events until capacitor is either depleted or
+    its level at the start of aligned period stops changing, or
+    simulation time limit is reached.
+    """
+    # Format: [(activation time, period, amount)], times in milliseconds
+    events = [(0, period_ms, amount) for period_ms, amount in amounts.items()]
+    heapify(events)
+    aligned_period = 1
+    for period_ms in amounts:
+        aligned_period = aligned_period * period_ms // gcd(aligned_period, period_ms)
+    time_limit = SIMULATION_TIME_LIMIT * 1000
+    if aligned_period > MAX_ALIGNED_PERIOD * 1000:
+        aligned_period = max(amounts)
+        time_limit = min(time_limit, max(
+            aligned_period * UNALIGNED_CYCLE_LIMIT,
+            recharge_time * 1000 * UNALIGNED_RECHARGE_LIMIT))
+    # Exponent factor per millisecond
+    decay = RECHARGE_FACTOR / recharge_time / 1000
+    tolerance = STABILITY_TOLERANCE * capacity
+    cap = capacity
+    last_time = 0
+    boundary = aligned_period
+    boundary_cap = capacity
+    low = high = None
+    while True:
+        time, period_ms, amount = events[0]
+        if time >= boundary:
+            cap = _recharge(cap, capacity, decay, boundary - last_time)
+            last_time = boundary
+            if sustainable and (abs(boundary_cap - cap) < tolerance or boundary >= time_limit):
+                return CapacitorState(
+                    stable=True, stable_level=(low + high) / 2 / capacity, depletion_time=None)
+            boundary_cap = cap
+            boundary += aligned_period
+            low = high = None
+            continue
+        cap = _recharge(cap, capacity, decay, time - last_time)
+        last_time = time
+        if amount > cap:
+            return CapacitorState(stable=False, stable_level=None, depletion_time=time / 1000)
+        if high is None or cap > high:
+            high = cap
+        cap = min(cap - amount, capacity)
+        if low is None or cap < low:
+            low = cap
+        heapreplace(events, (time + period_ms, period_ms, amount))
+
+
+def _recharge(cap, capacity, decay, elapsed):
+    """
+    Return capacitor level after it has been recharging for
+    passed amount of milliseconds.
+    """
+    if elapsed == 0:
+        return cap
+    level = 1 - (1 - sqrt(max(cap, 0) / capacity)) * exp(-decay * elapsed)
+    return capacity * level * level
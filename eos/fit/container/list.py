@@ -19,6 +19,7 @@
 # ===============================================================================
 
 
+from eos.fit.messages import ItemPositionsChanged
 from .base import ItemContainerBase
 from .exception import ItemAlreadyAssignedError, SlotTakenError
 
@@ -56,6 +57,7 @@ class ItemList(ItemContainerBase):
         self._check_class(value, allow_none=True)
         self._allocate(index - 1)
         self.__list.insert(index, value)
+        self.__fit._publish(ItemPositionsChanged(self))
         if value is None:
             self._cleanup()
         else:
@@ -160,6 +162,7 @@ class ItemList(ItemContainerBase):
         if item is not None:
             self._handle_item_removal(self.__fit, item)
         del self.__list[index]
+        self.__fit._publish(ItemPositionsChanged(self))
         self._cleanup()
 
     def free(self, value):
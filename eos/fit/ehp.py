@@ -0,0 +1,203 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Effective HP math for multiple damage profiles at once. Damage
+profiles are converted into damage shares once, after which EHP
+of each tanking layer against all profiles is calculated in one
+pass. When NumPy is available, the pass is done over arrays, else
+pure python fallback is used; either way, results are returned as
+rows of TankingLayersTotal, with None for layers without HP data.
+"""
+
+
+from math import inf, isnan
+
+from eos.util.numpy_support import numpy
+from .stats import StatsDisabledError
+from .tuples import TankingLayersTotal
+
+
+# Layers in order they're stored in matrix rows; total is the last column
+LAYERS = ('hull', 'armor', 'shield')
+DAMAGE_TYPES = ('em', 'thermal', 'kinetic', 'explosive')
+
+
+def get_damage_shares(damage_profiles):
+    """
+    Convert damage profiles into shares of each damage type in
+    total damage.
+
+    Required arguments:
+    damage_profiles -- iterable with objects which have numbers as
+        their em, thermal, kinetic and explosive attributes
+
+    Return value:
+    List with tuple of damage type shares per profile, in em,
+    thermal, kinetic, explosive order
+
+    Possible exceptions:
+    ValueError -- raised when any of profiles has all damage
+        components as 0
+    """
+    shares = []
+    for profile in damage_profiles:
+        components = tuple(getattr(profile, damage_type) for damage_type in DAMAGE_TYPES)
+        dealt = sum(components)
+        if dealt == 0:
+            raise ValueError('damage profile cannot have all damage components as 0')
+        shares.append(tuple(component / dealt for component in components))
+    return shares
+
+
+def get_ehp_matrix(hp, resistances, damage_profiles):
+    """
+    Calculate effective HP of each tanking layer against each of
+    passed damage profiles.
+
+    Required arguments:
+    hp -- TankingLayersTotal with HP of layers
+    resistances -- TankingLayers with resistances of layers; missing
+        resistances are assumed to be 0
+    damage_profiles -- iterable with objects which have numbers as
+        their em, thermal, kinetic and explosive attributes
+
+    Return value:
+    List with TankingLayersTotal(hull, armor, shield, total) per
+    damage profile; layers without HP data are None
+
+    Possible exceptions:
+    ValueError -- raised when any of profiles has all damage
+        components as 0
+    """
+    shares = get_damage_shares(damage_profiles)
+    if numpy is not None:
+        return _get_array_rows(_get_fits_ehp_array((hp,), (resistances,), shares)[0])
+    return _get_ehp_rows(hp, resistances, shares)
+
+
+def get_fits_ehp_matrix(fits, damage_profiles):
+    """
+    Calculate effective HP of ships of multiple fits against each of
+    passed damage profiles, e.g. to rank fits by their tank.
+
+    Required arguments:
+    fits -- iterable with fits
+    damage_profiles -- iterable with damage profiles
+
+    Return value:
+    List with rows of TankingLayersTotal for each fit (see
+    get_ehp_matrix())
+
+    Possible exceptions:
+    ValueError -- raised when any of profiles has all damage
+        components as 0
+    StatsDisabledError -- raised when any of fits has been created
+        without stats
+    """
+    shares = get_damage_shares(damage_profiles)
+    stats = [fit.stats for fit in fits]
+    if any(fit_stats is None for fit_stats in stats):
+        raise StatsDisabledError('fit has been created without stats')
+    if numpy is not None:
+        ehp_array = _get_fits_ehp_array(
+            [fit_stats.hp for fit_stats in stats],
+            [fit_stats.resistances for fit_stats in stats],
+            shares
+        )
+        return [_get_array_rows(fit_ehps) for fit_ehps in ehp_array]
+    return [_get_ehp_rows(fit_stats.hp, fit_stats.resistances, shares) for fit_stats in stats]
+
+
+def _get_fits_ehp_array(hps, resistances, shares):
+    """
+    Calculate F×N×4 EHP array for F sets of layer HP and resistances,
+    using F×3×4 resonance array and N×4 damage share array.
+    """
+    shares = numpy.array(shares, dtype=float).reshape(len(shares), len(DAMAGE_TYPES))
+    layer_hps = numpy.array(
+        [[numpy.nan if getattr(hp, layer) is None else getattr(hp, layer) for layer in LAYERS] for hp in hps],
+        dtype=float
+    ).reshape(len(hps), len(LAYERS))
+    resonances = 1 - numpy.array(
+        [[
+            [getattr(getattr(layers, layer), damage_type) or 0 for damage_type in DAMAGE_TYPES]
+            for layer in LAYERS
+        ] for layers in resistances],
+        dtype=float
+    ).reshape(len(resistances), len(LAYERS), len(DAMAGE_TYPES))
+    # Share of dealt damage which is received by each layer, F×N×3
+    received = numpy.einsum('nd,fld->fnl', shares, resonances)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        layer_ehps = numpy.where(
+            layer_hps[:, None, :] == 0, 0, layer_hps[:, None, :] / received)
+    totals = numpy.where(
+        numpy.isnan(layer_ehps).all(axis=2), numpy.nan, numpy.nansum(layer_ehps, axis=2))
+    return numpy.concatenate((layer_ehps, totals[:, :, None]), axis=2)
+
+
+def _get_array_rows(ehp_array):
+    """
+    Convert N×4 EHP array into list of TankingLayersTotal
+    rows, replacing NaN with None.
+    """
+    return [
+        TankingLayersTotal(*(None if isnan(value) else value for value in row))
+        for row in ehp_array.tolist()
+    ]
+
+
+def _get_ehp_rows(hp, resistances, shares):
+    """
+    Calculate list of TankingLayersTotal rows, one per
+    damage share tuple.
+    """
+    return [
+        _make_row(tuple(
+            _get_layer_ehp(getattr(hp, layer), getattr(resistances, layer), profile_shares)
+            for layer in LAYERS
+        ))
+        for profile_shares in shares
+    ]
+
+
+def _get_layer_ehp(layer_hp, layer_resists, profile_shares):
+    """
+    Calculate layer EHP against single profile. If layer raw HP
+    is None or 0, it is returned as-is.
+    """
+    if not layer_hp:
+        return layer_hp
+    received = sum(
+        share * (1 - (getattr(layer_resists, damage_type) or 0))
+        for share, damage_type in zip(profile_shares, DAMAGE_TYPES)
+    )
+    if received == 0:
+        return inf
+    return layer_hp / received
+
+
+def _make_row(layer_ehps):
+    hull, armor, shield = layer_ehps
+    total = (hull or 0) + (armor or 0) + (shield or 0)
+    if total == 0 and hull is None and armor is None and shield is None:
+        total = None
+    return TankingLayersTotal(hull=hull, armor=armor, shield=shield, total=total)
@@ -0,0 +1,143 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from array import array
+from math import nan
+
+from eos.util.numpy_support import numpy
+from .stats import StatsDisabledError
+from .tuples import AttributeExport, AttributeColumns, StatSnapshot
+
+
+# Data type of structured array, as used for NumPy export
+STRUCTURED_DTYPE = (('item_index', 'i8'), ('type_id', 'i8'), ('attr_id', 'i8'), ('value', 'f8'))
+
+
+def iter_fit_items(fit):
+    """
+    Iterate over all items assigned to fit, including charges,
+    in stable order: character-related items, ship-related items,
+    modules rack by rack with their charges, drones.
+    """
+    for item in (fit.character, fit.ship, fit.stance, fit.effect_beacon):
+        if item is not None:
+            yield item
+    for container in (fit.skills, fit.implants, fit.boosters, fit.subsystems, fit.rigs):
+        yield from container
+    for module in fit.modules.items():
+        yield module
+        charge = module.charge
+        if charge is not None:
+            yield charge
+    yield from fit.drones
+
+
+def export_attributes(fit, attrs=None, structured=False):
+    """
+    Evaluate attributes of all fit items and export them
+    as columns.
+
+    Required arguments:
+    fit -- fit to export attributes of
+
+    Optional arguments:
+    attrs -- iterable with IDs of attributes to export, when
+        None, all attributes of all items are exported
+    structured -- when True, export data as NumPy structured
+        array
+
+    Return value:
+    AttributeExport(items, data), where items is tuple of
+    exported items, which are referred by index in item_index
+    column; data is either AttributeColumns with arrays,
+    or structured array with the same fields
+
+    Possible exceptions:
+    ImportError -- raised when structured export is requested,
+        but NumPy is not available
+    """
+    if structured and numpy is None:
+        raise ImportError('NumPy is required for structured export')
+    if attrs is not None:
+        attrs = tuple(attrs)
+    items = tuple(iter_fit_items(fit))
+    item_indices = array('l')
+    type_ids = array('l')
+    attr_ids = array('l')
+    values = array('d')
+    for item_index, item in enumerate(items):
+        item_attributes = item.attributes
+        item_attrs = item_attributes.keys() if attrs is None else attrs
+        item_values = item_attributes.get_many(item_attrs)
+        amount = len(item_values)
+        if amount == 0:
+            continue
+        item_indices.extend((item_index,) * amount)
+        type_ids.extend((item._eve_type_id,) * amount)
+        attr_ids.extend(item_values.keys())
+        values.extend(item_values.values())
+    if not structured:
+        return AttributeExport(items, AttributeColumns(item_indices, type_ids, attr_ids, values))
+    data = numpy.empty(len(values), dtype=list(STRUCTURED_DTYPE))
+    data['item_index'] = item_indices
+    data['type_id'] = type_ids
+    data['attr_id'] = attr_ids
+    data['value'] = values
+    return AttributeExport(items, data)
+
+
+def export_stats(fits, structured=False):
+    """
+    Take stat snapshot of each fit and export them as columns.
+
+    Required arguments:
+    fits -- iterable with fits to export stats of
+
+    Optional arguments:
+    structured -- when True, export data as NumPy structured
+        array
+
+    Return value:
+    Either StatSnapshot with array of numbers in each field, or
+    structured array with the same fields; row N contains stats
+    of N-th fit. Stats which cannot be calculated are exported
+    as NaN, boolean stats - as 0 or 1
+
+    Possible exceptions:
+    ImportError -- raised when structured export is requested,
+        but NumPy is not available
+    StatsDisabledError -- raised when any of fits has been created
+        without stats
+    """
+    if structured and numpy is None:
+        raise ImportError('NumPy is required for structured export')
+    columns = tuple(array('d') for _ in StatSnapshot._fields)
+    for fit in fits:
+        if fit.stats is None:
+            raise StatsDisabledError('fit has been created without stats')
+        for column, value in zip(columns, fit.stats.snapshot()):
+            column.append(nan if value is None else value)
+    if not structured:
+        return StatSnapshot(*columns)
+    data = numpy.empty(len(columns[0]), dtype=[(field, 'f8') for field in StatSnapshot._fields])
+    for field, column in zip(StatSnapshot._fields, columns):
+        data[field] = column
+    return data
@@ -23,11 +23,16 @@ from eos.const.eve import Type
 from eos.data.source import SourceManager, Source
 from eos.util.pubsub import MessageBroker, BaseSubscriber
 from eos.util.repr import make_repr_str
+from .branch import FitBranch
 from .calculator import CalculationService
 from .container import ItemDescriptorOnFit, ItemList, ItemRestrictedSet, ItemSet, ModuleRacks
+from .export import export_attributes
 from .item import *
 from .messages import ItemAdded, ItemRemoved, EnableServices, DisableServices, RefreshSource
-from .restriction import RestrictionService
+from .reconcile import apply_fit_spec
+from .restriction import RestrictionService, RestrictionsDisabledError, get_compatibility_index
+from .skill_profile import check_skill_profiles
+from .source_diff import get_changed_items
 from .stats import StatService
 from .volatile import FitVolatileManager
 
@@ -38,9 +43,26 @@ class Fit(MessageBroker, BaseSubscriber):
 
     Optional arguments:
     source -- source to use for this fit
+    restrictions -- when False, restriction service is not created,
+        and fit cannot be validated. Default is True.
+    stats -- when False, stat service is not created, stats
+        attribute is None, and stat helpers like export_stats()
+        reject the fit. Restriction checks rely on stats, thus
+        stats can be disabled only together with restrictions.
+        Default is True.
+
+    Calculation-only fits (without restrictions and stats) do not
+    spend any time on item registration in these services, which
+    makes them cheaper for bulk attribute calculation.
+
+    Possible exceptions:
+    ValueError -- raised when stats are disabled while restrictions
+        are enabled
     """
 
-    def __init__(self, source=None):
+    def __init__(self, source=None, restrictions=True, stats=True):
+        if restrictions and not stats:
+            raise ValueError('restrictions cannot be enabled without stats')
         MessageBroker.__init__(self)
         self.__source = None
         # Keep list of all items which belong to this fit
@@ -63,9 +85,9 @@ class Fit(MessageBroker, BaseSubscriber):
         # (module racks, implant set), thus they have to be initialized
         # after it
         self._calculator = CalculationService(self)
-        self._restriction = RestrictionService(self)
-        self.stats = StatService(self)
-        self._volatile_mgr = FitVolatileManager(self, volatiles=(self.stats,))
+        self._restriction = RestrictionService(self) if restrictions else None
+        self.stats = StatService(self) if stats else None
+        self._volatile_mgr = FitVolatileManager(self)
         # Use default source, unless specified otherwise. Source setting may
         # enable services (if there's source), thus it has to be after service
         # initialization
@@ -91,8 +113,214 @@ class Fit(MessageBroker, BaseSubscriber):
 
         Possible exceptions:
         ValidationError -- raised when validation fails
+        RestrictionsDisabledError -- raised when fit has been
+            created without restrictions
+        """
+        self.__get_restriction().validate(skip_checks)
+
+    def has_violations(self, skip_checks=()):
+        """
+        Check if fit violates any restrictions. Validation results
+        are kept current as fit changes, thus this check is cheap.
+
+        Optional arguments:
+        skip_checks -- iterable with checks to be skipped
+
+        Return value:
+        True if any of restrictions is violated, else False
+        """
+        return self.__get_restriction().has_violations(skip_checks)
+
+    def get_item_violations(self, item, skip_checks=()):
+        """
+        Get restrictions violated by single item.
+
+        Required arguments:
+        item -- item to get violations for
+
+        Optional arguments:
+        skip_checks -- iterable with checks to be skipped
+
+        Return value:
+        Dictionary in {restriction type: error data} format
+        """
+        return self.__get_restriction().get_item_violations(item, skip_checks)
+
+    def check_candidate(self, item, container=None, skip_checks=()):
+        """
+        Check if item would violate any restrictions if it was added
+        to fit. Fit is not changed, and item is not processed by any
+        calculation services.
+
+        Required arguments:
+        item -- item which is not assigned to any fit
+
+        Optional arguments:
+        container -- for charges, item which charge would be loaded into
+        skip_checks -- iterable with checks to be skipped
+
+        Return value:
+        Dictionary in {restriction type: error data} format, empty
+        if item can be added to fit
+        """
+        return self.__get_restriction().check_candidate(item, container, skip_checks)
+
+    def check_skill_profiles(self, profiles):
+        """
+        Check skill requirements of all fit items against multiple
+        skill profiles at once (see eos.fit.skill_profile).
+
+        Required arguments:
+        profiles -- iterable with SkillProfile objects
+
+        Return value:
+        List with SkillProfileCheck(passed, missing) per profile,
+        where missing is dictionary in {item: (SkillRequirementErrorData,)}
+        format
+        """
+        return check_skill_profiles(self, profiles)
+
+    def get_compatible_modules(self):
+        """
+        Get modules and rigs which can be fit to ship of this fit,
+        considering ship type, group, capital and rig size
+        restrictions. Uses precomputed source-level index.
+
+        Return value:
+        Frozenset with type IDs, empty if fit has no ship or source
+        """
+        if self.ship is None or self.source is None:
+            return frozenset()
+        index = get_compatibility_index(self.source.cache_handler)
+        return index.get_ship_modules(self.ship._eve_type_id)
+
+    def get_compatible_charges(self, module):
+        """
+        Get charges which can be loaded into module, considering
+        charge group, size and volume restrictions. Uses precomputed
+        source-level index.
+
+        Required arguments:
+        module -- module to get charges for
+
+        Return value:
+        Frozenset with type IDs, empty if fit has no source
         """
-        self._restriction.validate(skip_checks)
+        if self.source is None:
+            return frozenset()
+        index = get_compatibility_index(self.source.cache_handler)
+        return index.get_module_charges(module._eve_type_id)
+
+    def apply_spec(self, spec):
+        """
+        Change fit to match spec, keeping items which are already
+        in place (see eos.fit.reconcile).
+
+        Required arguments:
+        spec -- FitSpec object describing desired fit contents
+        """
+        apply_fit_spec(self, spec)
+
+    def branch(self):
+        """
+        Start what-if branch over fit.
+
+        Changes made to fit after this call are applied to fit itself,
+        and are processed incrementally, i.e. only items and attributes
+        which are touched by the changes are recalculated. Branch allows
+        to either keep these changes or roll fit back to its original
+        state.
+
+        Return value:
+        FitBranch object with commit() and discard() methods, which can
+        also be used as context manager (discards changes on exit unless
+        they were committed)
+        """
+        return FitBranch(self)
+
+    def clone(self):
+        """
+        Make independent copy of fit.
+
+        All items are copied and put into the same positions of new
+        fit; services of new fit register them as usual. Values of
+        attributes which are already calculated on original fit are
+        carried over as-is, including overrides and cap data, thus
+        copy does not need recalculation.
+
+        Return value:
+        New fit object
+        """
+        clone = type(self)(
+            source=self.source,
+            restrictions=self._restriction is not None,
+            stats=self.stats is not None
+        )
+        # Explicitly requested fit without source can get
+        # default source on initialization
+        clone.source = self.source
+        # Format: [(original item, item copy)]
+        pairs = []
+        for attr_name in ('ship', 'stance', 'character', 'effect_beacon'):
+            item = getattr(self, attr_name)
+            setattr(clone, attr_name, self.__clone_item(item, pairs))
+        for attr_name in ('skills', 'implants', 'boosters', 'subsystems', 'rigs', 'drones'):
+            container = getattr(clone, attr_name)
+            for item in getattr(self, attr_name):
+                container.add(self.__clone_item(item, pairs))
+        for rack_name in ('high', 'med', 'low'):
+            rack = getattr(clone.modules, rack_name)
+            for index, item in enumerate(getattr(self.modules, rack_name)):
+                if item is not None:
+                    rack.place(index, self.__clone_item(item, pairs))
+        # Transfer attribute values only when everything is in place,
+        # as services invalidate values when items are added
+        for item, item_clone in pairs:
+            item_clone.attributes._copy_from(item.attributes)
+        return clone
+
+    def __get_restriction(self):
+        if self._restriction is None:
+            raise RestrictionsDisabledError('fit has been created without restrictions')
+        return self._restriction
+
+    @staticmethod
+    def __clone_item(item, pairs):
+        """
+        Make copy of passed item and record it and its sub-items
+        into passed list of pairs.
+        """
+        if item is None:
+            return None
+        item_clone = item._clone()
+        pairs.append((item, item_clone))
+        charge = getattr(item, 'charge', None)
+        if charge is not None:
+            pairs.append((charge, item_clone.charge))
+        return item_clone
+
+    def export_attributes(self, attrs=None, structured=False):
+        """
+        Export attribute values of all fit items as columns.
+
+        Optional arguments:
+        attrs -- iterable with IDs of attributes to export, when
+            None, all attributes of all items are exported
+        structured -- when True, export data as NumPy structured
+            array
+
+        Return value:
+        AttributeExport(items, data), where items is tuple of
+        exported items, which are referred by index in item_index
+        column; data is either AttributeColumns(item_index, type_id,
+        attr_id, value) with arrays, or structured array with the
+        same fields
+
+        Possible exceptions:
+        ImportError -- raised when structured export is requested,
+            but NumPy is not available
+        """
+        return export_attributes(self, attrs=attrs, structured=structured)
 
     @property
     def source(self):
@@ -118,6 +346,43 @@ class Fit(MessageBroker, BaseSubscriber):
         if new_source is not None:
             self._publish(EnableServices(self.__items))
 
+    def switch_source(self, new_source):
+        """
+        Switch fit to other source, reprocessing only items whose eve
+        type data differs between sources. Unlike assignment to source
+        attribute, service registrations and calculated values of items
+        whose eve types are the same in both sources are kept; such
+        items keep using eve type objects of old source. When metadata
+        of attributes differs between sources, or fit has no source,
+        everything is rebuilt as on regular assignment.
+
+        Required arguments:
+        new_source -- source object or its alias
+        """
+        if not isinstance(new_source, Source) and new_source is not None:
+            new_source = SourceManager.get(new_source)
+        old_source = self.source
+        if new_source is old_source:
+            return
+        changed = None
+        if old_source is not None and new_source is not None:
+            changed = get_changed_items(self.__items, old_source.cache_handler, new_source.cache_handler)
+        if changed is None:
+            self.source = new_source
+            return
+        if changed:
+            self._publish(DisableServices(changed))
+        self.__source = new_source
+        # Only items which changed get data from new source
+        refresh = RefreshSource()
+        for item in changed:
+            item._notify(refresh)
+        # Values cached on fit level may rely on source-specific
+        # data, they are cheap to recalculate
+        self._volatile_mgr._reset()
+        if changed:
+            self._publish(EnableServices(changed))
+
     # Message handling
     def _handle_item_addition(self, message):
         self.__items.add(message.item)
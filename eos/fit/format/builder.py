@@ -0,0 +1,157 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.fit.item import *
+from eos.fit.tuples import DroneSpec, FitSpec, ModuleSpec
+from .exception import FitFormatError
+
+
+RACK_NAMES = {ModuleHigh: 'high', ModuleMed: 'med', ModuleLow: 'low'}
+SET_NAMES = {Subsystem: 'subsystems', Rig: 'rigs', Implant: 'implants', Booster: 'boosters'}
+# No fit can hold more items than this in a single container; bigger
+# amounts are rejected, so that malformed input cannot blow up specs
+MAX_RACK_SIZE = 8
+MAX_SET_SIZE = 10
+MAX_DRONES = 1000
+
+
+class SpecBuilder:
+    """
+    Collect items of fit, which is being imported from text
+    format, into fit spec.
+
+    Required arguments:
+    resolver -- TypeResolver to use
+    """
+
+    def __init__(self, resolver):
+        self.__resolver = resolver
+        self.__ship = None
+        self.__stance = None
+        # Format: {rack name: [module specs and Nones]}
+        self.__racks = {'high': [], 'med': [], 'low': []}
+        # Format: {container name: [type IDs]}
+        self.__sets = {name: [] for name in SET_NAMES.values()}
+        self.__drones = []
+        # Charges which are not bound to any module
+        self.__charges = []
+
+    def set_ship(self, type_id):
+        if self.__resolver.get_item_class(type_id) is not Ship:
+            raise FitFormatError('type {} is not a ship'.format(type_id))
+        self.__ship = type_id
+
+    def get_item_class(self, type_id):
+        return self.__resolver.get_item_class(type_id)
+
+    def add(self, type_id, amount=1, state=None, charge=None):
+        """
+        Add items of passed eve type to container they belong to.
+
+        Optional arguments:
+        amount -- amount of items to add
+        state -- state of modules and drones, when None, modules are
+            put into highest state up to active, and drones are offline
+        charge -- type ID of charge to load into modules
+
+        Return value:
+        Item class eve type has been added as
+
+        Possible exceptions:
+        FitFormatError -- raised when type is unknown or cannot be
+            put onto fit, or when amount is not positive or exceeds
+            amount of items container can hold
+        """
+        if amount < 1:
+            raise FitFormatError('invalid amount {} of type {}'.format(amount, type_id))
+        resolver = self.__resolver
+        item_class = resolver.get_item_class(type_id)
+        if item_class in RACK_NAMES:
+            if state is None:
+                state = resolver.get_module_state(type_id)
+            module_spec = ModuleSpec(type_id, state, charge)
+            rack_name = RACK_NAMES[item_class]
+            rack = self.__racks[rack_name]
+            self.__check_size(rack_name, len(rack) + amount, MAX_RACK_SIZE)
+            rack.extend([module_spec] * amount)
+        elif item_class in SET_NAMES:
+            set_name = SET_NAMES[item_class]
+            type_ids = self.__sets[set_name]
+            self.__check_size(set_name, len(type_ids) + amount, MAX_SET_SIZE)
+            type_ids.extend([type_id] * amount)
+        elif item_class is Drone:
+            drone_spec = DroneSpec(type_id) if state is None else DroneSpec(type_id, state)
+            self.__check_size('drones', len(self.__drones) + amount, MAX_DRONES)
+            self.__drones.extend([drone_spec] * amount)
+        elif item_class is Charge:
+            self.__charges.append(type_id)
+        elif item_class is Stance:
+            self.__stance = type_id
+        else:
+            raise FitFormatError('type {} cannot be put onto fit'.format(type_id))
+        return item_class
+
+    def add_empty(self, rack_name):
+        """Reserve slot in module rack."""
+        rack = self.__racks[rack_name]
+        self.__check_size(rack_name, len(rack) + 1, MAX_RACK_SIZE)
+        rack.append(None)
+
+    @staticmethod
+    def __check_size(container_name, size, max_size):
+        if size > max_size:
+            raise FitFormatError('{} cannot hold more than {} items'.format(container_name, max_size))
+
+    def load_charges(self):
+        """
+        Load charges which are not bound to any module into modules
+        without charge; every module gets the first charge which
+        can be loaded into it.
+        """
+        charges = self.__charges
+        if not charges:
+            return
+        resolver = self.__resolver
+        for rack in self.__racks.values():
+            for index, module_spec in enumerate(rack):
+                if module_spec is None or module_spec.charge is not None:
+                    continue
+                allowed = resolver.get_module_charges(module_spec.type_id)
+                for charge in charges:
+                    if charge in allowed:
+                        rack[index] = module_spec._replace(charge=charge)
+                        break
+
+    def build(self):
+        racks = {}
+        for rack_name, rack in self.__racks.items():
+            # Empty slots at the end of rack do not mean anything
+            while rack and rack[-1] is None:
+                rack.pop()
+            racks[rack_name] = tuple(rack)
+        sets = {name: tuple(type_ids) for name, type_ids in self.__sets.items()}
+        return FitSpec(
+            ship=self.__ship,
+            stance=self.__stance,
+            drones=tuple(self.__drones),
+            **racks,
+            **sets
+        )
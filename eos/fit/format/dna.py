@@ -0,0 +1,157 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Ship DNA is compact fit format used by EVE client, where fit is
+described by type IDs with amounts:
+ship:subsystem;1:module;2:rig;1:charge;100:drone;5::
+
+Type IDs do not carry any info on where item belongs, thus it is
+taken from source. DNA does not bind charges to modules, so every
+module gets loaded with the first charge which fits it.
+"""
+
+
+from collections import OrderedDict
+
+from .builder import SpecBuilder
+from .exception import FitFormatError
+from .resolver import TypeResolver
+
+
+def parse_dna(dna, source):
+    """
+    Parse ship DNA string into fit spec.
+
+    Required arguments:
+    dna -- ship DNA string
+    source -- source object or its alias, to get data about types
+
+    Return value:
+    FitSpec object
+
+    Possible exceptions:
+    FitFormatError -- raised when string cannot be parsed, or
+        refers types which are unknown or cannot be put onto fit
+    """
+    return _parse(dna, TypeResolver(source))
+
+
+def iter_dna(lines, source, on_error=None):
+    """
+    Parse ship DNA strings one by one. Lines are consumed lazily and
+    data about types is shared between lines, thus it is suitable
+    for files with large amount of fits, and output can be fed
+    directly to eos.batch.evaluate().
+
+    Required arguments:
+    lines -- iterable with DNA strings, e.g. file object; empty
+        lines are skipped
+    source -- source object or its alias, to get data about types
+
+    Optional arguments:
+    on_error -- callable which is called with line number (starting
+        from 1), line and exception for lines which cannot be
+        parsed; such lines are skipped. When None, exception is
+        propagated.
+
+    Return value:
+    Iterator over FitSpec objects
+    """
+    resolver = TypeResolver(source)
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            spec = _parse(line, resolver)
+        except FitFormatError as e:
+            if on_error is None:
+                raise
+            on_error(line_number, line, e)
+            continue
+        yield spec
+
+
+def make_dna(spec):
+    """
+    Make ship DNA string out of fit spec. Empty slots, module states,
+    implants and boosters are not part of the format and are not
+    exported.
+
+    Required arguments:
+    spec -- FitSpec object
+
+    Return value:
+    Ship DNA string
+    """
+    # Format: {type ID: amount}
+    amounts = OrderedDict()
+
+    def add(type_id):
+        amounts[type_id] = amounts.get(type_id, 0) + 1
+
+    for type_id in spec.subsystems:
+        add(type_id)
+    charges = []
+    for rack in (spec.high, spec.med, spec.low):
+        for module_spec in rack:
+            if module_spec is None:
+                continue
+            add(module_spec.type_id)
+            if module_spec.charge is not None:
+                charges.append(module_spec.charge)
+    for type_id in spec.rigs:
+        add(type_id)
+    for type_id in charges:
+        add(type_id)
+    for drone_spec in spec.drones:
+        add(drone_spec.type_id)
+    tokens = ['' if spec.ship is None else str(spec.ship)]
+    if spec.stance is not None:
+        tokens.append('{};1'.format(spec.stance))
+    tokens.extend('{};{}'.format(type_id, amount) for type_id, amount in amounts.items())
+    return ':'.join(tokens) + '::'
+
+
+def _parse(dna, resolver):
+    tokens = dna.strip().rstrip(':').split(':')
+    builder = SpecBuilder(resolver)
+    builder.set_ship(_parse_int(tokens[0], dna))
+    for token in tokens[1:]:
+        if not token:
+            continue
+        type_token, _, amount_token = token.partition(';')
+        # Items marked with underscore are in cargo bay
+        if type_token.endswith('_'):
+            continue
+        type_id = _parse_int(type_token, dna)
+        amount = _parse_int(amount_token, dna) if amount_token else 1
+        builder.add(type_id, amount=amount)
+    builder.load_charges()
+    return builder.build()
+
+
+def _parse_int(token, dna):
+    try:
+        return int(token)
+    except ValueError:
+        raise FitFormatError('malformed ship DNA "{}"'.format(dna)) from None
@@ -0,0 +1,175 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+EFT is human-readable fit format, where items are referred by
+names:
+
+[Rifter, My Rifter]
+Gyrostabilizer II
+[Empty Low slot]
+
+1MN Afterburner II
+
+200mm AutoCannon II, EMP S
+200mm AutoCannon II, EMP S /offline
+
+Warrior II x3
+
+Eve types are referred by names, which are not part of source
+data, thus parser and serializer need name to type ID mapping.
+Location of items is taken from source as well, so order of
+sections does not matter on import.
+"""
+
+
+from collections import OrderedDict
+
+from eos.const.eos import State
+from eos.fit.item import Drone
+from eos.fit.tuples import EftFit
+from .builder import SpecBuilder
+from .exception import FitFormatError
+from .resolver import TypeResolver
+
+
+# Racks whose empty slots are kept on import
+RACK_NAMES = ('high', 'med', 'low')
+OFFLINE_SUFFIX = ' /offline'
+
+
+def parse_eft(text, source, type_ids):
+    """
+    Parse fit in EFT format into fit spec.
+
+    Required arguments:
+    text -- EFT string
+    source -- source object or its alias, to get data about types
+    type_ids -- mapping in {type name: type ID} format
+
+    Return value:
+    EftFit(name, spec) object
+
+    Possible exceptions:
+    FitFormatError -- raised when string cannot be parsed, or
+        refers types which are unknown or cannot be put onto fit
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line]
+    if not lines or not (lines[0].startswith('[') and lines[0].endswith(']')):
+        raise FitFormatError('EFT header is missing')
+    ship_name, _, fit_name = lines[0][1:-1].partition(',')
+    builder = SpecBuilder(TypeResolver(source))
+    builder.set_ship(_get_type_id(ship_name.strip(), type_ids))
+    for line in lines[1:]:
+        _parse_line(line, builder, type_ids)
+    return EftFit(name=fit_name.strip(), spec=builder.build())
+
+
+def make_eft(spec, type_names, name=''):
+    """
+    Make EFT string out of fit spec. Module states other than
+    offline are not part of the format and are not exported.
+
+    Required arguments:
+    spec -- FitSpec object
+    type_names -- mapping in {type ID: type name} format
+
+    Optional arguments:
+    name -- name of fit
+
+    Return value:
+    EFT string
+    """
+    def get_name(type_id):
+        try:
+            return type_names[type_id]
+        except KeyError:
+            raise FitFormatError('no name for type {}'.format(type_id)) from None
+
+    sections = []
+    for rack_name, rack in (('Low', spec.low), ('Med', spec.med), ('High', spec.high)):
+        lines = []
+        for module_spec in rack:
+            if module_spec is None:
+                lines.append('[Empty {} slot]'.format(rack_name))
+                continue
+            line = get_name(module_spec.type_id)
+            if module_spec.charge is not None:
+                line = '{}, {}'.format(line, get_name(module_spec.charge))
+            if module_spec.state == State.offline:
+                line += OFFLINE_SUFFIX
+            lines.append(line)
+        sections.append(lines)
+    for type_ids in (spec.rigs, spec.subsystems):
+        sections.append([get_name(type_id) for type_id in type_ids])
+    # Format: {type ID: amount}
+    drones = OrderedDict()
+    for drone_spec in spec.drones:
+        drones[drone_spec.type_id] = drones.get(drone_spec.type_id, 0) + 1
+    sections.append(['{} x{}'.format(get_name(type_id), amount) for type_id, amount in drones.items()])
+    for type_ids in (spec.implants, spec.boosters):
+        sections.append([get_name(type_id) for type_id in type_ids])
+    if spec.stance is not None:
+        sections.append([get_name(spec.stance)])
+    header = '[{}, {}]'.format('' if spec.ship is None else get_name(spec.ship), name)
+    blocks = '\n\n'.join('\n'.join(lines) for lines in sections if lines)
+    if not blocks:
+        return header
+    return '{}\n{}'.format(header, blocks)
+
+
+def _parse_line(line, builder, type_ids):
+    if line.startswith('[') and line.endswith(']'):
+        # Empty slot markers look like [Empty Low slot]
+        words = line[1:-1].lower().split()
+        if len(words) == 3 and words[0] == 'empty' and words[2] == 'slot':
+            if words[1] in RACK_NAMES:
+                builder.add_empty(words[1])
+        return
+    state = None
+    if line.endswith(OFFLINE_SUFFIX):
+        line = line[:-len(OFFLINE_SUFFIX)].rstrip()
+        state = State.offline
+    name, _, charge_name = line.partition(',')
+    name = name.strip()
+    charge_name = charge_name.strip()
+    amount = None
+    head, _, tail = name.rpartition(' x')
+    if head and tail.isdigit():
+        name = head.strip()
+        amount = int(tail)
+    type_id = _get_type_id(name, type_ids)
+    charge = _get_type_id(charge_name, type_ids) if charge_name else None
+    if amount is None:
+        builder.add(type_id, state=state, charge=charge)
+        return
+    # Lines with amount are either drones, or cargo
+    # items, which are not part of fit
+    if builder.get_item_class(type_id) is Drone:
+        builder.add(type_id, amount=amount, state=state)
+
+
+def _get_type_id(name, type_ids):
+    try:
+        return type_ids[name]
+    except KeyError:
+        raise FitFormatError('unknown type name "{}"'.format(name)) from None
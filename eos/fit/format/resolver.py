@@ -0,0 +1,105 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.data.cache_handler.exception import TypeFetchError
+from eos.data.source import Source, SourceManager
+from eos.fit.item import *
+from eos.fit.restriction.compatibility import get_compatibility_index
+from eos.fit.restriction.register.item_class import CLASS_VALIDATORS
+from .exception import FitFormatError
+
+
+# Item classes which can be specified in text fit formats,
+# in order they are tried for eve type
+ITEM_CLASSES = (
+    Ship, Stance, Subsystem, ModuleHigh, ModuleMed, ModuleLow,
+    Rig, Charge, Drone, Implant, Booster
+)
+
+
+class TypeResolver:
+    """
+    Provide info on eve types which is needed to put them into
+    fit spec, using data from source. Results are memoized, thus
+    the same resolver should be used for many fits from the
+    same source.
+
+    Required arguments:
+    source -- source object or its alias
+    """
+
+    def __init__(self, source):
+        if not isinstance(source, Source):
+            source = SourceManager.get(source)
+        self.__cache_handler = source.cache_handler
+        # Format: {type ID: item class}
+        self.__item_classes = {}
+        # Format: {type ID: state}
+        self.__module_states = {}
+
+    def get_item_class(self, type_id):
+        """
+        Get item class eve type can be used as.
+
+        Return value:
+        Item class, or None if eve type cannot be used by
+        any of supported item classes
+
+        Possible exceptions:
+        FitFormatError -- raised when source has no such type
+        """
+        try:
+            return self.__item_classes[type_id]
+        except KeyError:
+            pass
+        eve_type = self.__get_type(type_id)
+        item_class = None
+        for candidate in ITEM_CLASSES:
+            if CLASS_VALIDATORS[candidate](eve_type):
+                item_class = candidate
+                break
+        self.__item_classes[type_id] = item_class
+        return item_class
+
+    def get_module_state(self, type_id):
+        """
+        Get state imported module should be put into, which is
+        highest state it can take, up to active.
+        """
+        try:
+            return self.__module_states[type_id]
+        except KeyError:
+            pass
+        state = min(self.__get_type(type_id).max_state, State.active)
+        self.__module_states[type_id] = state
+        return state
+
+    def get_module_charges(self, type_id):
+        """Get type IDs of charges which can be loaded into module."""
+        index = get_compatibility_index(self.__cache_handler)
+        return index.get_module_charges(type_id)
+
+    def __get_type(self, type_id):
+        try:
+            return self.__cache_handler.get_type(type_id)
+        except TypeFetchError as e:
+            raise FitFormatError('unknown type {}'.format(type_id)) from e
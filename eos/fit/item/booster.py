@@ -38,6 +38,8 @@ class Booster(ImmutableStateMixin, SideEffectMixin):
     __init__
     """
 
+    __slots__ = ()
+
     def __init__(self, type_id, **kwargs):
         super().__init__(type_id=type_id, state=State.offline, **kwargs)
 
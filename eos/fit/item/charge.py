@@ -36,6 +36,8 @@ class Charge(ImmutableStateMixin):
     __init__
     """
 
+    __slots__ = ('container',)
+
     def __init__(self, type_id, **kwargs):
         # Item-container, into which our charge item is "loaded"
         self.container = None
@@ -46,6 +46,8 @@ class Drone(
     __init__
     """
 
+    __slots__ = ()
+
     def __init__(self, type_id, state=State.offline, **kwargs):
         super().__init__(type_id=type_id, state=state, **kwargs)
 
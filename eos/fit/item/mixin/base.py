@@ -21,12 +21,14 @@
 
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from copy import copy
 from random import random
 
 from eos.fit.calculator import MutableAttributeMap
 from eos.fit.messages import EffectsEnabled, EffectsDisabled, RefreshSource
 from eos.fit.null_source import NullSourceItem
 from eos.util.pubsub import BaseSubscriber
+from eos.util.volatile_cache import CooperativeVolatileMixin
 
 
 EffectData = namedtuple('EffectData', ('effect', 'chance', 'status'))
@@ -47,6 +49,12 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
     __init__
     """
 
+    # Besides base item data, slot for storage of volatile data is defined
+    # here: other item mixins cannot have non-empty slots, as they are
+    # combined in various ways, and each of those would break instance
+    # layout otherwise
+    __slots__ = ('_eve_type_id', 'attributes', '__fit', '__disabled_effects', '_eve_type', '_volatile_attrs')
+
     def __init__(self, type_id, **kwargs):
         self._eve_type_id = type_id
         # Special dictionary subclass that holds modified attributes
@@ -59,8 +67,10 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
         # has such effect, but if item has it, it will be disabled. We need to keep
         # such IDs for case when item has effect disabled, then it switches source
         # where it doesn't have effect with this ID anymore, then when it switches
-        # back - this effect will be disabled like it has been before source switch
-        self.__disabled_effects = set()
+        # back - this effect will be disabled like it has been before source switch.
+        # Initialized as None to save memory, as most items never have any
+        # effects disabled
+        self.__disabled_effects = None
         # Which eve type this item wraps. Use null source item by default,
         # as item doesn't have fit with source yet
         self._eve_type = NullSourceItem
@@ -80,6 +90,24 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
         if new_fit is not None:
             new_fit._subscribe(self, (RefreshSource,))
 
+    def _clone(self):
+        """
+        Make copy of item, which is not assigned to any fit.
+        Copy carries the same eve type ID, state, effect statuses
+        and sub-items, but has empty attribute map and no cached
+        data.
+        """
+        clone = copy(self)
+        clone.attributes = MutableAttributeMap(clone)
+        clone.__fit = None
+        if self.__disabled_effects is not None:
+            clone.__disabled_effects = set(self.__disabled_effects)
+        clone._eve_type = NullSourceItem
+        # Make sure cached data is not shared with original
+        if isinstance(clone, CooperativeVolatileMixin):
+            clone._volatile_attrs = {}
+        return clone
+
     # Properties used by attribute calculator
     @property
     @abstractmethod
@@ -102,12 +130,13 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
             on effect activation, status=effect status)}
         """
         data = {}
+        disabled_effects = self.__disabled_effects or ()
         for effect in self._eve_type.effects:
             # Get chance from modified attributes, if specified
             chance_attr = effect.fitting_usage_chance_attribute
             chance = self.attributes[chance_attr] if chance_attr is not None else None
             # Get effect status
-            status = effect.id not in self.__disabled_effects
+            status = effect.id not in disabled_effects
             data[effect.id] = EffectData(effect, chance, status)
         return data
 
@@ -155,7 +184,7 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
     @property
     def _enabled_effects(self):
         """Return set with IDs of enabled effects"""
-        return set(e.id for e in self._eve_type.effects).difference(self.__disabled_effects)
+        return set(e.id for e in self._eve_type.effects).difference(self.__disabled_effects or ())
 
     @property
     def _disabled_effects(self):
@@ -166,7 +195,7 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
         Unlike self.__disabled_effects, this property returns
         IDs of actual effects which are not active on this item.
         """
-        return set(e.id for e in self._eve_type.effects).intersection(self.__disabled_effects)
+        return set(e.id for e in self._eve_type.effects).intersection(self.__disabled_effects or ())
 
     def __enable_effects(self, effect_ids):
         """
@@ -176,10 +205,14 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
         Required arguments:
         effect_ids -- iterable with effect IDs to enable
         """
+        if self.__disabled_effects is None:
+            return
         to_enable = self.__disabled_effects.intersection(effect_ids)
         if len(to_enable) == 0:
             return
         self.__disabled_effects.difference_update(to_enable)
+        if len(self.__disabled_effects) == 0:
+            self.__disabled_effects = None
         if self.__fit is not None:
             self.__fit._publish(EffectsEnabled(self, to_enable))
 
@@ -191,11 +224,13 @@ class BaseItemMixin(BaseSubscriber, metaclass=ABCMeta):
         Required arguments:
         effect_ids -- iterable with effect IDs to disable
         """
-        to_disable = set(effect_ids).difference(self.__disabled_effects)
+        to_disable = set(effect_ids).difference(self.__disabled_effects or ())
         if len(to_disable) == 0:
             return
         if self.__fit is not None:
             self.__fit._publish(EffectsDisabled(self, to_disable))
+        if self.__disabled_effects is None:
+            self.__disabled_effects = set()
         self.__disabled_effects.update(to_disable)
 
     # Message handling
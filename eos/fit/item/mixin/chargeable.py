@@ -47,12 +47,23 @@ class ChargeableMixin(BaseItemMixin, CooperativeVolatileMixin):
     __init__
     """
 
+    __slots__ = ()
+
     def __init__(self, charge, **kwargs):
         super().__init__(**kwargs)
         self.charge = charge
 
     charge = ItemDescriptorOnItem('_charge', 'container', Charge)
 
+    def _clone(self):
+        clone = super()._clone()
+        charge = self.charge
+        if charge is not None:
+            charge_clone = charge._clone()
+            charge_clone.container = clone
+            clone._charge = charge_clone
+        return clone
+
     @VolatileProperty
     def charge_quantity(self):
         """
@@ -22,6 +22,10 @@
 from enum import IntEnum, unique
 
 from eos.const.eve import Attribute, Effect
+from eos.fit.application import (
+    turret_chance_to_hit, turret_damage_multiplier, missile_damage_multiplier,
+    unreduced_damage_multiplier, apply_damage_multiplier
+)
 from eos.fit.tuples import DamageTypesTotal
 from eos.util.volatile_cache import CooperativeVolatileMixin, VolatileProperty
 from .base import BaseItemMixin
@@ -60,6 +64,10 @@ MISSILE_EFFECT_WEAPON_MAP = {
     Effect.bomb_launching: WeaponType.bomb
 }
 
+# Signature radius turret tracking is balanced against, used when
+# turret does not define it
+DEFAULT_OPTIMAL_SIG_RADIUS = 40000
+
 
 class DamageDealerMixin(BaseItemMixin, CooperativeVolatileMixin):
     """
@@ -67,6 +75,8 @@ class DamageDealerMixin(BaseItemMixin, CooperativeVolatileMixin):
     to deal damage (modules, drones).
     """
 
+    __slots__ = ()
+
     def __get_base_dmg_item(self):
         """
         Return item damage attribs as 4-tuple.
@@ -287,14 +297,107 @@ class DamageDealerMixin(BaseItemMixin, CooperativeVolatileMixin):
                 pass
         return None
 
-    def get_volley_vs_target(self, target_data=None, target_resistances=None):
-        # TODO
-        return
+    def get_chance_to_hit(self, target_data):
+        """
+        Get chance of turret to hit targets.
+
+        Required arguments:
+        target_data -- TargetData with distance, transversal, signature
+        radius and velocity of targets; each of these can be number or
+        sequence of numbers (see eos.fit.application)
+
+        Return value:
+        Chance to hit for each target, or None if item is not turret
+        or if its tracking/range data is not available
+        """
+        if self._weapon_type != WeaponType.turret:
+            return None
+        turret_data = self._turret_application_data
+        if turret_data is None:
+            return None
+        return turret_chance_to_hit(target_data, *turret_data)
+
+    def get_volley_vs_target(self, target_data, target_resistances=None):
+        """
+        Get volley of item applied to targets. For turrets, average
+        damage is calculated accounting for misses and wrecking hits;
+        for missiles and bombs, damage is reduced according to target
+        signature radius and velocity, and is zero for targets out of
+        flight range. Damage of other weapon types is not reduced.
+
+        Required arguments:
+        target_data -- TargetData with distance, transversal, signature
+        radius and velocity of targets; each of these can be number or
+        sequence of numbers (see eos.fit.application)
+
+        Optional arguments:
+        target_resistances -- object which has following numbers as its attibutes:
+        em, thermal, kinetic and explosive (all in range [0, 1])
+        If none, raw volley damage is calculated. By default None.
+
+        Return value:
+        Object with em, thermal, kinetic, explosive and total attributes,
+        which contain damage for each target
+        """
+        volley = self.get_nominal_volley(target_resistances=target_resistances)
+        return apply_damage_multiplier(volley, self.__get_damage_multiplier(target_data))
+
+    def get_dps_vs_target(self, target_data, target_resistances=None, reload=False):
+        """
+        Same as get_volley_vs_target, but returns damage per second.
+        Takes additional reload argument, which tells if reload should
+        be taken into consideration. By default False.
+        """
+        dps = self.get_nominal_dps(target_resistances=target_resistances, reload=reload)
+        return apply_damage_multiplier(dps, self.__get_damage_multiplier(target_data))
+
+    def __get_damage_multiplier(self, target_data):
+        """
+        Get share of damage which is applied to each of targets.
+        """
+        weapon_type = self._weapon_type
+        if weapon_type == WeaponType.turret:
+            chance_to_hit = self.get_chance_to_hit(target_data)
+            if chance_to_hit is not None:
+                return turret_damage_multiplier(chance_to_hit)
+        elif weapon_type in (WeaponType.guided_missile, WeaponType.bomb):
+            missile_data = self._missile_application_data
+            if missile_data is not None:
+                return missile_damage_multiplier(target_data, *missile_data)
+        return unreduced_damage_multiplier(target_data)
 
-    def get_chance_to_hit(self, target_data=None):
-        # TODO
-        return
+    @VolatileProperty
+    def _turret_application_data(self):
+        """
+        Return optimal, falloff, tracking and optimal signature radius
+        of turret, or None if any of them is not available.
+        """
+        optimal = self.attributes.get(Attribute.max_range)
+        falloff = self.attributes.get(Attribute.falloff)
+        tracking = self.attributes.get(Attribute.tracking_speed)
+        optimal_sig_radius = self.attributes.get(Attribute.optimal_sig_radius, DEFAULT_OPTIMAL_SIG_RADIUS)
+        if optimal is None or falloff is None or tracking is None:
+            return None
+        return optimal, falloff, tracking, optimal_sig_radius
 
-    def get_dps_vs_target(self, target_data=None, target_resistances=None, reload=True):
-        # TODO
-        return
+    @VolatileProperty
+    def _missile_application_data(self):
+        """
+        Return flight range, explosion radius, explosion velocity and
+        damage reduction factor of loaded charge, or None if any of them
+        is not available.
+        """
+        charge = getattr(self, 'charge', None)
+        if charge is None:
+            return None
+        charge_attribs = charge.attributes
+        try:
+            flight_range = charge_attribs[Attribute.max_velocity] * charge_attribs[Attribute.explosion_delay] / 1000
+            return (
+                flight_range,
+                charge_attribs[Attribute.aoe_cloud_size],
+                charge_attribs[Attribute.aoe_velocity],
+                charge_attribs[Attribute.aoe_damage_reduction_factor]
+            )
+        except KeyError:
+            return None
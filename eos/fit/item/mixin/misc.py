@@ -29,6 +29,8 @@ class DefaultEffectAttribMixin(BaseItemMixin):
     values is provided by default effect of an eve type.
     """
 
+    __slots__ = ()
+
     @property
     def tracking_speed(self):
         return self.__get_eve_type_specific_attr('tracking_speed_attribute')
@@ -28,6 +28,8 @@ class SideEffectMixin(BaseItemMixin):
     side-effects.
     """
 
+    __slots__ = ()
+
     @property
     def side_effects(self):
         """
@@ -35,6 +35,8 @@ class ImmutableStateMixin(BaseItemMixin):
     __init__
     """
 
+    __slots__ = ('__state',)
+
     def __init__(self, state, **kwargs):
         self.__state = state
         super().__init__(**kwargs)
@@ -56,6 +58,8 @@ class MutableStateMixin(BaseItemMixin):
     __init__
     """
 
+    __slots__ = ('__state',)
+
     def __init__(self, state, **kwargs):
         self.__state = state
         super().__init__(**kwargs)
@@ -20,6 +20,7 @@
 
 
 from eos.const.eve import Attribute
+from eos.fit.ehp import get_ehp_matrix
 from eos.fit.tuples import TankingLayers, TankingLayersTotal, DamageTypes
 from eos.util.volatile_cache import CooperativeVolatileMixin, VolatileProperty
 from .base import BaseItemMixin
@@ -31,6 +32,8 @@ class BufferTankingMixin(BaseItemMixin, CooperativeVolatileMixin):
     to sustain damage (ships, drones, maybe some charges).
     """
 
+    __slots__ = ()
+
     @VolatileProperty
     def hp(self):
         """
@@ -119,6 +122,24 @@ class BufferTankingMixin(BaseItemMixin, CooperativeVolatileMixin):
             total_ehp = None
         return TankingLayersTotal(hull=hull_ehp, armor=armor_ehp, shield=shield_ehp, total=total_ehp)
 
+    def get_ehp_matrix(self, damage_profiles):
+        """
+        Get effective HP of an item against multiple damage profiles.
+
+        Required arguments:
+        damage_profiles -- iterable with objects which have numbers as their
+            following attributes: em, thermal, kinetic and explosive
+
+        Return value:
+        List with TankingLayersTotal(hull, armor, shield, total) per damage
+        profile; layers whose HP can't be fetched are None (see eos.fit.ehp).
+
+        Possible exceptions:
+        ValueError -- raised when any of profiles has all damage
+            components as 0
+        """
+        return get_ehp_matrix(self.hp, self.resistances, damage_profiles)
+
     def __get_layer_ehp(self, layer_hp, layer_resists, damage_profile):
         """
         Calculate layer EHP according to passed data.
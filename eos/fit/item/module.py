@@ -32,6 +32,11 @@ class Module(
     MutableStateMixin, ChargeableMixin,
     DamageDealerMixin, DefaultEffectAttribMixin
 ):
+
+    # Storage for charge descriptor; mixins do not define any slots,
+    # as it would break layout of classes which combine them
+    __slots__ = ('_charge',)
+
     def __init__(self, type_id, state=State.offline, charge=None, **kwargs):
         super().__init__(type_id=type_id, state=state, charge=charge, **kwargs)
 
@@ -69,7 +74,8 @@ class ModuleHigh(Module):
     Cooperative methods:
     __init__
     """
-    pass
+
+    __slots__ = ()
 
 
 class ModuleMed(Module):
@@ -89,7 +95,8 @@ class ModuleMed(Module):
     Cooperative methods:
     __init__
     """
-    pass
+
+    __slots__ = ()
 
 
 class ModuleLow(Module):
@@ -109,4 +116,5 @@ class ModuleLow(Module):
     Cooperative methods:
     __init__
     """
-    pass
+
+    __slots__ = ()
@@ -37,6 +37,8 @@ class Ship(ImmutableStateMixin, BufferTankingMixin):
     __init__
     """
 
+    __slots__ = ()
+
     def __init__(self, type_id, **kwargs):
         super().__init__(type_id=type_id, state=State.offline, **kwargs)
 
@@ -40,6 +40,8 @@ class Skill(ImmutableStateMixin):
     __init__
     """
 
+    __slots__ = ()
+
     def __init__(self, type_id, level=0, **kwargs):
         super().__init__(type_id=type_id, state=State.offline, **kwargs)
         self.level = level
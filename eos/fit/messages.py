@@ -28,6 +28,7 @@ __all__ = [
     'ItemStateChanged',
     'EffectsEnabled',
     'EffectsDisabled',
+    'ItemPositionsChanged',
     'AttrValueChanged',
     'AttrValueChangedOverride',
     'EnableServices',
@@ -42,6 +43,8 @@ ItemRemoved = namedtuple('ItemRemoved', ('item',))
 ItemStateChanged = namedtuple('ItemStateChanged', ('item', 'old', 'new'))
 EffectsEnabled = namedtuple('EffectsEnabled', ('item', 'effects'))
 EffectsDisabled = namedtuple('EffectsDisabled', ('item', 'effects'))
+# Items have been shifted within ordered container
+ItemPositionsChanged = namedtuple('ItemPositionsChanged', ('container',))
 # Attribute-related
 AttrValueChanged = namedtuple('AttrValueChanged', ('item', 'attr'))
 AttrValueChangedOverride = namedtuple('AttrValueChangedOverride', ('item', 'attr'))
@@ -0,0 +1,154 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Bring existing fit to state described by fit spec with as few changes
+as possible. Items which are already in place are kept along with
+everything calculated for them; only items which differ are removed,
+added or switched to other state. Attribute calculation is lazy, thus
+values affected by the changes are recalculated just once, when they
+are requested after all changes are done.
+"""
+
+
+from collections import OrderedDict
+
+from .item import *
+
+
+RACKS = (('high', ModuleHigh), ('med', ModuleMed), ('low', ModuleLow))
+SETS = (('rigs', Rig), ('subsystems', Subsystem), ('implants', Implant), ('boosters', Booster))
+
+
+def apply_fit_spec(fit, spec):
+    """
+    Change fit to match spec.
+
+    Single-item containers and module racks are compared position
+    by position; items of unordered containers are matched by type,
+    drones of the same type are switched to other state instead of
+    being replaced. Character and effect beacon are not part of spec
+    and are not touched.
+
+    Required arguments:
+    fit -- fit to change
+    spec -- FitSpec object describing desired fit contents
+    """
+    if _get_type_id(fit.ship) != spec.ship:
+        fit.ship = None if spec.ship is None else Ship(spec.ship)
+    if _get_type_id(fit.stance) != spec.stance:
+        fit.stance = None if spec.stance is None else Stance(spec.stance)
+    for rack_name, item_class in RACKS:
+        _apply_rack(getattr(fit.modules, rack_name), item_class, getattr(spec, rack_name))
+    for attr_name, item_class in SETS:
+        _apply_set(getattr(fit, attr_name), item_class, getattr(spec, attr_name))
+    _apply_drones(fit.drones, spec.drones)
+    _apply_skills(fit.skills, dict(spec.skills))
+
+
+def _apply_rack(rack, item_class, module_specs):
+    # Free slots taken by modules of other types first, so that
+    # rack shrinks before anything is placed into it
+    for index, module in enumerate(list(rack)):
+        if module is None:
+            continue
+        module_spec = module_specs[index] if index < len(module_specs) else None
+        if module_spec is None or module_spec.type_id != module._eve_type_id:
+            rack.free(module)
+    for index, module_spec in enumerate(module_specs):
+        if module_spec is None:
+            continue
+        module = rack[index] if index < len(rack) else None
+        if module is None:
+            rack.place(index, item_class(
+                module_spec.type_id, state=module_spec.state,
+                charge=None if module_spec.charge is None else Charge(module_spec.charge)))
+            continue
+        if module.state != module_spec.state:
+            module.state = module_spec.state
+        if _get_type_id(module.charge) != module_spec.charge:
+            module.charge = None if module_spec.charge is None else Charge(module_spec.charge)
+
+
+def _apply_set(container, item_class, type_ids):
+    missing = _count(type_ids)
+    for item in list(container):
+        type_id = item._eve_type_id
+        if missing.get(type_id, 0) > 0:
+            missing[type_id] -= 1
+        else:
+            container.remove(item)
+    for type_id, amount in missing.items():
+        for _ in range(amount):
+            container.add(item_class(type_id))
+
+
+def _apply_drones(container, drone_specs):
+    # Format: {type ID: [states]}
+    missing = OrderedDict()
+    for drone_spec in drone_specs:
+        missing.setdefault(drone_spec.type_id, []).append(drone_spec.state)
+    # Drones which are not needed in their current state
+    spare = []
+    for drone in list(container):
+        states = missing.get(drone._eve_type_id, ())
+        if drone.state in states:
+            states.remove(drone.state)
+        else:
+            spare.append(drone)
+    for drone in spare:
+        states = missing.get(drone._eve_type_id)
+        if states:
+            drone.state = states.pop(0)
+        else:
+            container.remove(drone)
+    for type_id, states in missing.items():
+        for state in states:
+            container.add(Drone(type_id, state=state))
+
+
+def _apply_skills(container, levels):
+    present = set()
+    for skill in list(container):
+        type_id = skill._eve_type_id
+        if type_id not in levels:
+            container.remove(skill)
+            continue
+        present.add(type_id)
+        if skill.level != levels[type_id]:
+            skill.level = levels[type_id]
+    for type_id, level in levels.items():
+        if type_id not in present:
+            container.add(Skill(type_id, level=level))
+
+
+def _count(type_ids):
+    # Format: {type ID: amount}
+    amounts = OrderedDict()
+    for type_id in type_ids:
+        amounts[type_id] = amounts.get(type_id, 0) + 1
+    return amounts
+
+
+def _get_type_id(item):
+    if item is None:
+        return None
+    return item._eve_type_id
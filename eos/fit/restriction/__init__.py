@@ -19,5 +19,6 @@
 # ===============================================================================
 
 
-from .exception import ValidationError
+from .compatibility import CompatibilityIndex, get_compatibility_index
+from .exception import RestrictionsDisabledError, ValidationError
 from .service import RestrictionService
@@ -0,0 +1,196 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from weakref import WeakKeyDictionary
+
+from eos.const.eos import Slot
+from eos.const.eve import Attribute, Category
+from eos.util.keyed_set import KeyedSet
+from .register.capital_item import MAX_SUBCAP_VOLUME
+from .register.charge_group import get_allowed_charge_groups
+from .register.ship_type_group import get_allowed_ship_data
+
+
+# Format: {cache handler: CompatibilityIndex}
+_indices = WeakKeyDictionary()
+
+
+def get_compatibility_index(cache_handler):
+    """
+    Get compatibility index for passed cache handler. Index
+    is built on the first request and is shared by all fits
+    which use the same source.
+
+    Required arguments:
+    cache_handler -- cache handler of source
+
+    Return value:
+    CompatibilityIndex object
+    """
+    try:
+        return _indices[cache_handler]
+    except KeyError:
+        index = _indices[cache_handler] = CompatibilityIndex(cache_handler)
+        return index
+
+
+class CompatibilityIndex:
+    """
+    Source-level inverted indices, which allow to get all eve
+    types compatible with ship or module without checking eve
+    types one by one. Restrictions are interpreted the same way
+    restriction registers do it, and only unmodified attribute
+    values of eve types are used.
+
+    Following restrictions are considered:
+    Modules -- ship type and group, capital item, rig size
+    Charges -- charge group, charge size, charge volume
+
+    Required arguments:
+    cache_handler -- cache handler whose eve types are indexed
+    """
+
+    def __init__(self, cache_handler):
+        self.__cache_handler = cache_handler
+        # Modules which are not restricted to ship types or groups
+        # Format: {module type IDs}
+        self.__unrestricted_modules = set()
+        # Format: {ship type ID: {module type IDs}}
+        self.__modules_by_ship_type = KeyedSet()
+        # Format: {ship group ID: {module type IDs}}
+        self.__modules_by_ship_group = KeyedSet()
+        # Modules which can be fit only to capital ships
+        # Format: {module type IDs}
+        self.__capital_modules = set()
+        # Rigs which do not specify their size
+        # Format: {rig type IDs}
+        self.__unsized_rigs = set()
+        # Format: {rig size: {rig type IDs}}
+        self.__rigs_by_size = KeyedSet()
+        # Format: {charge group ID: {charge type IDs}}
+        self.__charges_by_group = KeyedSet()
+        # Format: {charge type ID: (charge size, charge volume)}
+        self.__charge_data = {}
+        # Query results
+        # Format: {type ID: frozenset with type IDs}
+        self.__ship_modules = {}
+        self.__module_charges = {}
+        for type_id in cache_handler.get_type_ids():
+            self.__index_type(cache_handler.get_type(type_id))
+
+    def get_ship_modules(self, ship_type_id):
+        """
+        Get modules and rigs which can be fit to ship.
+
+        Required arguments:
+        ship_type_id -- type ID of ship
+
+        Return value:
+        Frozenset with type IDs of modules and rigs
+        """
+        try:
+            return self.__ship_modules[ship_type_id]
+        except KeyError:
+            pass
+        ship_eve_type = self.__cache_handler.get_type(ship_type_id)
+        modules = set(self.__unrestricted_modules)
+        modules.update(self.__modules_by_ship_type.get_data(ship_type_id))
+        modules.update(self.__modules_by_ship_group.get_data(ship_eve_type.group))
+        if not ship_eve_type.attributes.get(Attribute.is_capital_size):
+            modules.difference_update(self.__capital_modules)
+        rig_size = ship_eve_type.attributes.get(Attribute.rig_size)
+        if rig_size is None:
+            modules.update(*self.__rigs_by_size.values())
+        else:
+            modules.update(self.__rigs_by_size.get_data(rig_size))
+        modules.update(self.__unsized_rigs)
+        modules = self.__ship_modules[ship_type_id] = frozenset(modules)
+        return modules
+
+    def get_module_charges(self, module_type_id):
+        """
+        Get charges which can be loaded into module. Modules
+        which do not specify groups of charges they accept
+        are considered to be unable to load charges.
+
+        Required arguments:
+        module_type_id -- type ID of module
+
+        Return value:
+        Frozenset with type IDs of charges
+        """
+        try:
+            return self.__module_charges[module_type_id]
+        except KeyError:
+            pass
+        module_eve_type = self.__cache_handler.get_type(module_type_id)
+        attributes = module_eve_type.attributes
+        allowed_size = attributes.get(Attribute.charge_size)
+        capacity = attributes.get(Attribute.capacity, 0)
+        charges = set()
+        for group in get_allowed_charge_groups(module_eve_type):
+            for charge_type_id in self.__charges_by_group.get_data(group):
+                charge_size, charge_volume = self.__charge_data[charge_type_id]
+                if allowed_size is not None and charge_size != allowed_size:
+                    continue
+                if charge_volume > capacity:
+                    continue
+                charges.add(charge_type_id)
+        charges = self.__module_charges[module_type_id] = frozenset(charges)
+        return charges
+
+    def __index_type(self, eve_type):
+        if eve_type.category == Category.charge:
+            self.__index_charge(eve_type)
+        elif eve_type.category == Category.module:
+            if Slot.rig in eve_type.slots:
+                self.__index_rig(eve_type)
+            else:
+                self.__index_module(eve_type)
+
+    def __index_module(self, eve_type):
+        type_id = eve_type.id
+        allowed_data = get_allowed_ship_data(eve_type)
+        if allowed_data is None:
+            self.__unrestricted_modules.add(type_id)
+        else:
+            for ship_type_id in allowed_data.types:
+                self.__modules_by_ship_type.add_data(ship_type_id, type_id)
+            for ship_group in allowed_data.groups:
+                self.__modules_by_ship_group.add_data(ship_group, type_id)
+        if eve_type.attributes.get(Attribute.volume, 0) > MAX_SUBCAP_VOLUME:
+            self.__capital_modules.add(type_id)
+
+    def __index_rig(self, eve_type):
+        rig_size = eve_type.attributes.get(Attribute.rig_size)
+        if rig_size is None:
+            self.__unsized_rigs.add(eve_type.id)
+        else:
+            self.__rigs_by_size.add_data(rig_size, eve_type.id)
+
+    def __index_charge(self, eve_type):
+        attributes = eve_type.attributes
+        self.__charge_data[eve_type.id] = (
+            attributes.get(Attribute.charge_size),
+            attributes.get(Attribute.volume, 0)
+        )
+        if eve_type.group is not None:
+            self.__charges_by_group.add_data(eve_type.group, eve_type.id)
@@ -42,3 +42,11 @@ class ValidationError(RestrictionServiceError):
     Raised when service-wide validation fails.
     """
     pass
+
+
+class RestrictionsDisabledError(RestrictionServiceError):
+    """
+    Raised when restrictions are requested from fit which
+    has been created without restriction service.
+    """
+    pass
@@ -20,6 +20,15 @@
 
 
 from abc import ABCMeta, abstractmethod
+from collections import namedtuple
+
+
+# Item which is checked against fit without being added to it
+# item -- item instance, which is not assigned to any fit
+# eve_type -- eve type of item, as defined by fit source
+# container -- item which candidate would be loaded into (for
+#     charges), or None
+Candidate = namedtuple('Candidate', ('item', 'eve_type', 'container'))
 
 
 class BaseRestrictionRegister(metaclass=ABCMeta):
@@ -33,6 +42,9 @@ class BaseRestrictionRegister(metaclass=ABCMeta):
 
         Posiitional arguments:
         item -- item to register
+
+        Return value:
+        True if item has been stored in register, else False
         """
         ...
 
@@ -44,6 +56,9 @@ class BaseRestrictionRegister(metaclass=ABCMeta):
 
         Posiitional arguments:
         item -- item to unregister
+
+        Return value:
+        True if item has been removed from register, else False
         """
         ...
 
@@ -55,6 +70,22 @@ class BaseRestrictionRegister(metaclass=ABCMeta):
         """
         ...
 
+    @abstractmethod
+    def check_candidate(self, candidate):
+        """
+        Check if candidate would be valid if it was added to fit,
+        taking into account registered items. Candidate is not
+        registered, and its attribute map is not used: unmodified
+        attribute values of its eve type are taken.
+
+        Required arguments:
+        candidate -- Candidate object to check
+
+        Return value:
+        Error data if candidate violates restriction, else None
+        """
+        ...
+
     @property
     @abstractmethod
     def restriction_type(self):
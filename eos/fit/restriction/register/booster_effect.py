@@ -23,6 +23,7 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.fit.item import Booster
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -51,15 +52,22 @@ class BoosterEffectRestrictionRegister(BaseRestrictionRegister):
         self.__boosters = set()
 
     def register_item(self, item):
-        if isinstance(item, Booster):
-            self.__boosters.add(item)
+        if not isinstance(item, Booster):
+            return False
+        self.__boosters.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__boosters.discard(item)
+        if item not in self.__boosters:
+            return False
+        self.__boosters.remove(item)
+        return True
 
     def validate(self):
         tainted_items = {}
         for booster in self.__boosters:
+            # Effect status changes are tracked on per-item basis
+            track_volatile_dependency(booster)
             # Check if any disabled effects cannot be found in
             # side-effect list
             disablable = set(booster.side_effects)
@@ -73,6 +81,11 @@ class BoosterEffectRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        # Effects of candidate are considered to be enabled,
+        # as its effect statuses are tied to fit source
+        return None
+
     @property
     def restriction_type(self):
         return Restriction.booster_effect
@@ -24,6 +24,8 @@ from collections import namedtuple
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
 from eos.fit.item import ModuleHigh, ModuleMed, ModuleLow
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -55,21 +57,26 @@ class CapitalItemRestrictionRegister(BaseRestrictionRegister):
 
     def register_item(self, item):
         if not isinstance(item, TRACKED_ITEM_CLASSES):
-            return
+            return False
         # Ignore items with no volume attribute and items with
         # volume which satisfies us regardless of ship type
         try:
             item_volume = item._eve_type.attributes[Attribute.volume]
         except KeyError:
-            return
+            return False
         if item_volume <= MAX_SUBCAP_VOLUME:
-            return
+            return False
         self.__capital_items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__capital_items.discard(item)
+        if item not in self.__capital_items:
+            return False
+        self.__capital_items.remove(item)
+        return True
 
     def validate(self):
+        track_volatile_dependency(FIT_COMPOSITION)
         # Skip validation only if ship has special
         # special attribute set to 1
         ship_item = self._fit.ship
@@ -92,6 +99,25 @@ class CapitalItemRestrictionRegister(BaseRestrictionRegister):
                 )
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        if not isinstance(candidate.item, TRACKED_ITEM_CLASSES):
+            return None
+        item_volume = candidate.eve_type.attributes.get(Attribute.volume)
+        if item_volume is None or item_volume <= MAX_SUBCAP_VOLUME:
+            return None
+        ship_item = self._fit.ship
+        try:
+            ship_eve_type = ship_item._eve_type
+        except AttributeError:
+            pass
+        else:
+            if ship_eve_type.attributes.get(Attribute.is_capital_size):
+                return None
+        return CapitalItemErrorData(
+            item_volume=item_volume,
+            max_subcap_volume=MAX_SUBCAP_VOLUME
+        )
+
     @property
     def restriction_type(self):
         return Restriction.capital_item
@@ -23,6 +23,7 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -39,6 +40,18 @@ RESTRICTION_ATTRS = (
 ChargeGroupErrorData = namedtuple('ChargeGroupErrorData', ('item_group', 'allowed_groups'))
 
 
+def get_allowed_charge_groups(eve_type):
+    """
+    Get tuple with groups of charges which can be
+    loaded into item with passed eve type.
+    """
+    allowed_groups = set()
+    for restriction_attr in RESTRICTION_ATTRS:
+        allowed_groups.add(eve_type.attributes.get(restriction_attr))
+    allowed_groups.discard(None)
+    return tuple(allowed_groups)
+
+
 class ChargeGroupRestrictionRegister(BaseRestrictionRegister):
     """
     Implements restriction:
@@ -58,27 +71,28 @@ class ChargeGroupRestrictionRegister(BaseRestrictionRegister):
         # We're going to track containers, not charges;
         # ignore all items which can't fit a charge
         if not hasattr(item, 'charge'):
-            return
-        # Compose set of charge groups this container
-        # is able to fit
-        allowed_groups = set()
-        for restriction_attr in RESTRICTION_ATTRS:
-            allowed_groups.add(item._eve_type.attributes.get(restriction_attr))
-        allowed_groups.discard(None)
+            return False
+        allowed_groups = get_allowed_charge_groups(item._eve_type)
         # Only if groups were specified, consider
         # restriction enabled
-        if allowed_groups:
-            self.__restricted_containers[item] = tuple(allowed_groups)
+        if not allowed_groups:
+            return False
+        self.__restricted_containers[item] = allowed_groups
+        return True
 
     def unregister_item(self, item):
-        if item in self.__restricted_containers:
-            del self.__restricted_containers[item]
+        if item not in self.__restricted_containers:
+            return False
+        del self.__restricted_containers[item]
+        return True
 
     def validate(self):
         tainted_items = {}
         # If item has charge and its group is not allowed,
         # taint charge (not container) item
         for container, allowed_groups in self.__restricted_containers.items():
+            # Charge switches are tracked as changes of container
+            track_volatile_dependency(container)
             charge = container.charge
             if charge is None:
                 continue
@@ -90,6 +104,18 @@ class ChargeGroupRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        try:
+            allowed_groups = self.__restricted_containers[candidate.container]
+        except KeyError:
+            return None
+        if candidate.eve_type.group not in allowed_groups:
+            return ChargeGroupErrorData(
+                item_group=candidate.eve_type.group,
+                allowed_groups=allowed_groups
+            )
+        return None
+
     @property
     def restriction_type(self):
         return Restriction.charge_group
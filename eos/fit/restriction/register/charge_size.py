@@ -23,6 +23,7 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -51,20 +52,26 @@ class ChargeSizeRestrictionRegister(BaseRestrictionRegister):
     def register_item(self, item):
         # Ignore container items without charge attribute
         if not hasattr(item, 'charge'):
-            return
+            return False
         # And without size specification
         if Attribute.charge_size not in item._eve_type.attributes:
-            return
+            return False
         self.__restricted_containers.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__restricted_containers.discard(item)
+        if item not in self.__restricted_containers:
+            return False
+        self.__restricted_containers.remove(item)
+        return True
 
     def validate(self):
         tainted_items = {}
         # Go through containers with charges, and if their
         # sizes mismatch - taint charge items
         for container in self.__restricted_containers:
+            # Charge switches are tracked as changes of container
+            track_volatile_dependency(container)
             charge = container.charge
             if charge is None:
                 continue
@@ -78,6 +85,19 @@ class ChargeSizeRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        container = candidate.container
+        if container not in self.__restricted_containers:
+            return None
+        container_size = container._eve_type.attributes[Attribute.charge_size]
+        charge_size = candidate.eve_type.attributes.get(Attribute.charge_size)
+        if container_size != charge_size:
+            return ChargeSizeErrorData(
+                item_size=charge_size,
+                allowed_size=container_size
+            )
+        return None
+
     @property
     def restriction_type(self):
         return Restriction.charge_size
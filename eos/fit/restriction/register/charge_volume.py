@@ -23,6 +23,7 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -49,15 +50,21 @@ class ChargeVolumeRestrictionRegister(BaseRestrictionRegister):
     def register_item(self, item):
         # Ignore container items without charge attribute
         if not hasattr(item, 'charge'):
-            return
+            return False
         self.__containers.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__containers.discard(item)
+        if item not in self.__containers:
+            return False
+        self.__containers.remove(item)
+        return True
 
     def validate(self):
         tainted_items = {}
         for container in self.__containers:
+            # Charge switches are tracked as changes of container
+            track_volatile_dependency(container)
             charge = container.charge
             if charge is None:
                 continue
@@ -73,6 +80,19 @@ class ChargeVolumeRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        container = candidate.container
+        if container not in self.__containers:
+            return None
+        charge_volume = candidate.eve_type.attributes.get(Attribute.volume, 0)
+        container_capacity = container._eve_type.attributes.get(Attribute.capacity, 0)
+        if charge_volume > container_capacity:
+            return ChargeVolumeErrorData(
+                item_volume=charge_volume,
+                max_allowed_volume=container_capacity
+            )
+        return None
+
     @property
     def restriction_type(self):
         return Restriction.charge_volume
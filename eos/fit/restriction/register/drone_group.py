@@ -24,6 +24,8 @@ from collections import namedtuple
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
 from eos.fit.item import Drone
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -60,43 +62,72 @@ class DroneGroupRestrictionRegister(BaseRestrictionRegister):
 
     def register_item(self, item):
         # Ignore everything but drones
-        if isinstance(item, Drone):
-            self.__restricted_items.add(item)
+        if not isinstance(item, Drone):
+            return False
+        self.__restricted_items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__restricted_items.discard(item)
+        if item not in self.__restricted_items:
+            return False
+        self.__restricted_items.remove(item)
+        return True
 
     def validate(self):
+        track_volatile_dependency(FIT_COMPOSITION)
+        allowed_groups = self.__get_allowed_groups()
+        # No allowed group attributes - no restriction
+        if allowed_groups is None:
+            return
+        tainted_items = {}
+        for item in self.__restricted_items:
+            # Taint items, whose group is not allowed
+            item_group = item._eve_type.group
+            if item_group not in allowed_groups:
+                tainted_items[item] = DroneGroupErrorData(
+                    item_group=item_group,
+                    allowed_groups=allowed_groups
+                )
+        if tainted_items:
+            raise RegisterValidationError(tainted_items)
+
+    def check_candidate(self, candidate):
+        if not isinstance(candidate.item, Drone):
+            return None
+        allowed_groups = self.__get_allowed_groups()
+        if allowed_groups is None:
+            return None
+        item_group = candidate.eve_type.group
+        if item_group not in allowed_groups:
+            return DroneGroupErrorData(
+                item_group=item_group,
+                allowed_groups=allowed_groups
+            )
+        return None
+
+    def __get_allowed_groups(self):
+        """
+        Get groups of drones ship allows, or None
+        if ship doesn't restrict drone groups.
+        """
         ship_item = self._fit.ship
         # No ship - no restriction
         try:
             ship_eve_type = ship_item._eve_type
         except AttributeError:
-            return
+            return None
         # Set with allowed groups
         allowed_groups = set()
         # Find out if we have restriction, and which drone groups it allows
         for restriction_attr in RESTRICTION_ATTRS:
             allowed_groups.add(ship_eve_type.attributes.get(restriction_attr))
         allowed_groups.discard(None)
-        # No allowed group attributes - no restriction
         if not allowed_groups:
-            return
-        tainted_items = {}
+            return None
         # Convert set to tuple, this way we can use it
         # multiple times in error data, making sure that
         # it can't be modified by validation caller
-        allowed_groups = tuple(allowed_groups)
-        for item in self.__restricted_items:
-            # Taint items, whose group is not allowed
-            item_group = item._eve_type.group
-            if item_group not in allowed_groups:
-                tainted_items[item] = DroneGroupErrorData(
-                    item_group=item_group,
-                    allowed_groups=allowed_groups
-                )
-        if tainted_items:
-            raise RegisterValidationError(tainted_items)
+        return tuple(allowed_groups)
 
     @property
     def restriction_type(self):
@@ -89,35 +89,47 @@ class ItemClassRestrictionRegister(BaseRestrictionRegister):
     def register_item(self, item):
         # Yes, we're tracking all of them
         self.__items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__items.discard(item)
+        if item not in self.__items:
+            return False
+        self.__items.remove(item)
+        return True
 
     def validate(self):
         tainted_items = {}
         for item in self.__items:
-            # Get validator function for class of passed item.
-            # If it is not found or fails, seek for 'right'
-            # item class for the eve type
-            try:
-                validator_func = CLASS_VALIDATORS[type(item)]
-            except KeyError:
-                tainted_items[item] = self.__get_error_data(item)
-            else:
-                if validator_func(item._eve_type) is not True:
-                    tainted_items[item] = self.__get_error_data(item)
+            error_data = self.__check(type(item), item._eve_type)
+            if error_data is not None:
+                tainted_items[item] = error_data
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
-    def __get_error_data(self, item):
+    def check_candidate(self, candidate):
+        return self.__check(type(candidate.item), candidate.eve_type)
+
+    def __check(self, item_class, eve_type):
+        # Get validator function for class of passed item.
+        # If it is not found or fails, seek for 'right'
+        # item class for the eve type
+        try:
+            validator_func = CLASS_VALIDATORS[item_class]
+        except KeyError:
+            return self.__get_error_data(item_class, eve_type)
+        if validator_func(eve_type) is not True:
+            return self.__get_error_data(item_class, eve_type)
+        return None
+
+    def __get_error_data(self, item_class, eve_type):
         expected_classes = []
         # Cycle through our class validator dictionary and
         # seek for acceptable classes for this eve type
-        for item_class, validator_func in CLASS_VALIDATORS.items():
-            if validator_func(item._eve_type) is True:
-                expected_classes.append(item_class)
+        for expected_class, validator_func in CLASS_VALIDATORS.items():
+            if validator_func(eve_type) is True:
+                expected_classes.append(expected_class)
         error_data = ItemClassErrorData(
-            item_class=type(item),
+            item_class=item_class,
             expected_classes=set(expected_classes)
         )
         return error_data
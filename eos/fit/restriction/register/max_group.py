@@ -58,26 +58,29 @@ class MaxGroupRestrictionRegister(BaseRestrictionRegister):
 
     def register_item(self, item):
         if not isinstance(item, TRACKED_ITEM_CLASSES):
-            return
+            return False
         group = item._eve_type.group
         # Ignore items, whose eve type isn't assigned
         # to any group
         if group is None:
-            return
+            return False
         # Having group ID is sufficient condition
         # to enter container of all fitted items
         self.__group_all.add_data(group, item)
         # To enter restriction container, eve type
         # must have restriction attribute
-        if self.__max_group_attr not in item._eve_type.attributes:
-            return
-        self.__group_restricted.add(item)
+        if self.__max_group_attr in item._eve_type.attributes:
+            self.__group_restricted.add(item)
+        return True
 
     def unregister_item(self, item):
-        # Just clear data containers
         group = item._eve_type.group
+        if item not in self.__group_all.get_data(group):
+            return False
+        # Just clear data containers
         self.__group_all.rm_data(group, item)
         self.__group_restricted.discard(item)
+        return True
 
     def validate(self):
         # Container for tainted items
@@ -101,6 +104,34 @@ class MaxGroupRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        if not isinstance(candidate.item, TRACKED_ITEM_CLASSES):
+            return None
+        group = candidate.eve_type.group
+        if group is None:
+            return None
+        group_all = self.__group_all.get(group) or ()
+        group_items = len(group_all) + 1
+        # Candidate is considered invalid not only when its own
+        # restriction is exceeded, but also when it makes other
+        # items of the group invalid
+        restrictions = [
+            item._eve_type.attributes[self.__max_group_attr]
+            for item in self.__group_restricted.intersection(group_all)]
+        candidate_restriction = candidate.eve_type.attributes.get(self.__max_group_attr)
+        if candidate_restriction is not None:
+            restrictions.append(candidate_restriction)
+        if not restrictions:
+            return None
+        max_group_restriction = min(restrictions)
+        if group_items > max_group_restriction:
+            return MaxGroupErrorData(
+                item_group=group,
+                max_group=max_group_restriction,
+                group_items=group_items
+            )
+        return None
+
     @property
     def restriction_type(self):
         return self.__restriction_type
@@ -48,11 +48,15 @@ class ResourceRestrictionRegister(BaseRestrictionRegister):
 
     def register_item(self, item):
         if self.__usage_attr not in item._eve_type.attributes:
-            return
+            return False
         self.__resource_users.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__resource_users.discard(item)
+        if item not in self.__resource_users:
+            return False
+        self.__resource_users.remove(item)
+        return True
 
     def validate(self):
         # Use stats module to get resource use and output
@@ -77,6 +81,22 @@ class ResourceRestrictionRegister(BaseRestrictionRegister):
             )
         raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        # Candidate uses unmodified amount of resource
+        item_use = candidate.eve_type.attributes.get(self.__usage_attr, 0)
+        if item_use <= 0:
+            return None
+        stats = getattr(self.__fit.stats, self.__stat_name)
+        total_use = stats.used + item_use
+        output = stats.output or 0
+        if total_use <= output:
+            return None
+        return ResourceErrorData(
+            total_use=total_use,
+            output=output,
+            item_use=item_use
+        )
+
     @property
     def restriction_type(self):
         return self.__restriction_type
@@ -142,8 +162,14 @@ class DroneBayVolumeRegister(ResourceRestrictionRegister):
             self, fit, 'dronebay', Attribute.volume, Restriction.dronebay_volume)
 
     def register_item(self, item):
-        if isinstance(item, Drone):
-            ResourceRestrictionRegister.register_item(self, item)
+        if not isinstance(item, Drone):
+            return False
+        return ResourceRestrictionRegister.register_item(self, item)
+
+    def check_candidate(self, candidate):
+        if isinstance(candidate.item, Drone):
+            return ResourceRestrictionRegister.check_candidate(self, candidate)
+        return None
 
 
 class DroneBandwidthRegister(ResourceRestrictionRegister):
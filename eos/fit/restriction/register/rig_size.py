@@ -23,6 +23,8 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -49,25 +51,20 @@ class RigSizeRestrictionRegister(BaseRestrictionRegister):
         # Register only items which have attribute,
         # which restricts rig size
         if Attribute.rig_size not in item._eve_type.attributes:
-            return
+            return False
         self.__restricted_items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__restricted_items.discard(item)
+        if item not in self.__restricted_items:
+            return False
+        self.__restricted_items.remove(item)
+        return True
 
     def validate(self):
-        ship_item = self._fit.ship
-        # Do not apply restriction when fit doesn't
-        # have ship
-        try:
-            ship_eve_type = ship_item._eve_type
-        except AttributeError:
-            return
-        # If ship doesn't have restriction attribute,
-        # allow all rigs - skip validation
-        try:
-            allowed_rig_size = ship_eve_type.attributes[Attribute.rig_size]
-        except KeyError:
+        track_volatile_dependency(FIT_COMPOSITION)
+        allowed_rig_size = self.__get_allowed_rig_size()
+        if allowed_rig_size is None:
             return
         tainted_items = {}
         for item in self.__restricted_items:
@@ -82,6 +79,36 @@ class RigSizeRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        item_rig_size = candidate.eve_type.attributes.get(Attribute.rig_size)
+        if item_rig_size is None:
+            return None
+        allowed_rig_size = self.__get_allowed_rig_size()
+        if allowed_rig_size is None:
+            return None
+        if item_rig_size != allowed_rig_size:
+            return RigSizeErrorData(
+                item_size=item_rig_size,
+                allowed_size=allowed_rig_size
+            )
+        return None
+
+    def __get_allowed_rig_size(self):
+        """
+        Get rig size ship allows, or None if rig
+        size is not restricted.
+        """
+        ship_item = self._fit.ship
+        # Do not apply restriction when fit doesn't
+        # have ship
+        try:
+            ship_eve_type = ship_item._eve_type
+        except AttributeError:
+            return None
+        # If ship doesn't have restriction attribute,
+        # allow all rigs
+        return ship_eve_type.attributes.get(Attribute.rig_size)
+
     @property
     def restriction_type(self):
         return Restriction.rig_size
@@ -24,6 +24,8 @@ from collections import namedtuple
 from eos.const.eos import Restriction
 from eos.const.eve import Attribute
 from eos.fit.item import ModuleHigh, ModuleMed, ModuleLow
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -78,6 +80,31 @@ ShipTypeGroupErrorData = namedtuple(
 AllowedData = namedtuple('AllowedData', ('types', 'groups'))
 
 
+def get_allowed_ship_data(eve_type):
+    """
+    Get types and groups of ships eve type can be fitted
+    to, or None if it is not restricted.
+    """
+    # Containers for type IDs and group IDs of ships, to
+    # which item is allowed to fit
+    allowed_types = set()
+    allowed_groups = set()
+    for allowed_container, restriction_attrs in (
+        (allowed_types, TYPE_RESTRICTION_ATTRS),
+        (allowed_groups, GROUP_RESTRICTION_ATTRS)
+    ):
+        # Cycle through IDs of known restriction attributes
+        for restriction_attr in restriction_attrs:
+            allowed_container.add(eve_type.attributes.get(restriction_attr))
+        allowed_container.discard(None)
+    if not allowed_types and not allowed_groups:
+        return None
+    return AllowedData(
+        types=tuple(allowed_types),
+        groups=tuple(allowed_groups)
+    )
+
+
 class ShipTypeGroupRestrictionRegister(BaseRestrictionRegister):
     """
     Implements restriction:
@@ -105,45 +132,24 @@ class ShipTypeGroupRestrictionRegister(BaseRestrictionRegister):
 
     def register_item(self, item):
         if not isinstance(item, TRACKED_ITEM_CLASSES):
-            return
-        # Containers for type IDs and group IDs of ships, to
-        # which item is allowed to fit
-        allowed_types = set()
-        allowed_groups = set()
-        for allowed_container, restriction_attrs in (
-            (allowed_types, TYPE_RESTRICTION_ATTRS),
-            (allowed_groups, GROUP_RESTRICTION_ATTRS)
-        ):
-            # Cycle through IDs of known restriction attributes
-            for restriction_attr in restriction_attrs:
-                allowed_container.add(item._eve_type.attributes.get(restriction_attr))
-            allowed_container.discard(None)
+            return False
+        allowed_data = get_allowed_ship_data(item._eve_type)
         # Ignore non-restricted items
-        if not allowed_types and not allowed_groups:
-            return
+        if allowed_data is None:
+            return False
         # Finally, register items which made it into here
-        self.__restricted_items[item] = AllowedData(
-            types=tuple(allowed_types),
-            groups=tuple(allowed_groups)
-        )
+        self.__restricted_items[item] = allowed_data
+        return True
 
     def unregister_item(self, item):
-        if item in self.__restricted_items:
-            del self.__restricted_items[item]
+        if item not in self.__restricted_items:
+            return False
+        del self.__restricted_items[item]
+        return True
 
     def validate(self):
-        # Get type ID and group ID of ship, if no ship
-        # available, assume they're None; it's safe to set
-        # them to None because our primary data container
-        # with restricted items can't contain None in its
-        # values anyway
-        ship_item = self._fit.ship
-        try:
-            ship_type_id = ship_item._eve_type_id
-            ship_group = ship_item._eve_type.group
-        except AttributeError:
-            ship_type_id = None
-            ship_group = None
+        track_volatile_dependency(FIT_COMPOSITION)
+        ship_type_id, ship_group = self.__get_ship_data()
         # Container for tainted items
         tainted_items = {}
         # Go through all known restricted items
@@ -162,6 +168,36 @@ class ShipTypeGroupRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        if not isinstance(candidate.item, TRACKED_ITEM_CLASSES):
+            return None
+        allowed_data = get_allowed_ship_data(candidate.eve_type)
+        if allowed_data is None:
+            return None
+        ship_type_id, ship_group = self.__get_ship_data()
+        if ship_type_id not in allowed_data.types and ship_group not in allowed_data.groups:
+            return ShipTypeGroupErrorData(
+                ship_type=ship_type_id,
+                ship_group=ship_group,
+                allowed_types=allowed_data.types,
+                allowed_groups=allowed_data.groups
+            )
+        return None
+
+    def __get_ship_data(self):
+        """
+        Get type ID and group ID of ship, if no ship
+        available, assume they're None; it's safe to set
+        them to None because our primary data container
+        with restricted items can't contain None in its
+        values anyway.
+        """
+        ship_item = self._fit.ship
+        try:
+            return ship_item._eve_type_id, ship_item._eve_type.group
+        except AttributeError:
+            return None, None
+
     @property
     def restriction_type(self):
         return Restriction.ship_type_group
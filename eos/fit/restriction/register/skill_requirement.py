@@ -23,6 +23,8 @@ from collections import namedtuple
 
 from eos.const.eos import Restriction
 from eos.fit.item import Rig
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -55,42 +57,62 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
     def register_item(self, item):
         # Items which are not exceptions and which have any
         # skill requirement are tracked
-        if item._eve_type.required_skills and not isinstance(item, EXCEPTIONS):
-            self.__restricted_items.add(item)
+        if not item._eve_type.required_skills or isinstance(item, EXCEPTIONS):
+            return False
+        self.__restricted_items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__restricted_items.discard(item)
+        if item not in self.__restricted_items:
+            return False
+        self.__restricted_items.remove(item)
+        return True
 
     def validate(self):
+        # Skills are looked up in fit container
+        track_volatile_dependency(FIT_COMPOSITION)
         tainted_items = {}
         # Go through restricted items
         for item in self.__restricted_items:
-            # Container for skill requirement errors
-            # for current item
-            skill_requirement_errors = []
-            # Check each skill requirement
-            for required_skill_id in item._eve_type.required_skills:
-                required_skill_level = item._eve_type.required_skills[required_skill_id]
-                # Get skill level with None as fallback value for case
-                # when we don't have such skill in fit
-                try:
-                    skill_level = self._fit.skills[required_skill_id].level
-                except KeyError:
-                    skill_level = None
-                # Last check - if skill level is lower than expected, current item
-                # is tainted; mark it so and move to the next one
-                if skill_level is None or skill_level < required_skill_level:
-                    skill_requirement_error = SkillRequirementErrorData(
-                        skill=required_skill_id,
-                        level=skill_level,
-                        required_level=required_skill_level
-                    )
-                    skill_requirement_errors.append(skill_requirement_error)
+            skill_requirement_errors = self.__check(item._eve_type)
             if skill_requirement_errors:
-                tainted_items[item] = tuple(skill_requirement_errors)
+                tainted_items[item] = skill_requirement_errors
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        if isinstance(candidate.item, EXCEPTIONS):
+            return None
+        return self.__check(candidate.eve_type) or None
+
+    def __check(self, eve_type):
+        """
+        Get tuple with errors for all skill requirements
+        of eve type which are not met.
+        """
+        # Container for skill requirement errors
+        # for current item
+        skill_requirement_errors = []
+        # Check each skill requirement
+        for required_skill_id in eve_type.required_skills:
+            required_skill_level = eve_type.required_skills[required_skill_id]
+            # Get skill level with None as fallback value for case
+            # when we don't have such skill in fit
+            try:
+                skill_level = self._fit.skills[required_skill_id].level
+            except KeyError:
+                skill_level = None
+            # Last check - if skill level is lower than expected, current item
+            # is tainted; mark it so and move to the next one
+            if skill_level is None or skill_level < required_skill_level:
+                skill_requirement_error = SkillRequirementErrorData(
+                    skill=required_skill_id,
+                    level=skill_level,
+                    required_level=required_skill_level
+                )
+                skill_requirement_errors.append(skill_requirement_error)
+        return tuple(skill_requirement_errors)
+
     @property
     def restriction_type(self):
         return Restriction.skill_requirement
@@ -23,7 +23,9 @@ from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 
 from eos.const.eos import Restriction, Slot
-from eos.fit.item import Drone
+from eos.fit.item import Drone, ModuleHigh, ModuleMed, ModuleLow, Rig, Subsystem
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -47,9 +49,13 @@ class SlotAmountRestrictionRegister(BaseRestrictionRegister, metaclass=ABCMeta):
 
     def register_item(self, item):
         self._slot_consumers.add(item)
+        return True
 
     def unregister_item(self, item):
-        self._slot_consumers.discard(item)
+        if item not in self._slot_consumers:
+            return False
+        self._slot_consumers.remove(item)
+        return True
 
     def validate(self):
         # Use stats module to get max and used amount of slots
@@ -69,10 +75,28 @@ class SlotAmountRestrictionRegister(BaseRestrictionRegister, metaclass=ABCMeta):
                 )
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        if not self._takes_slot(candidate):
+            return None
+        stats = getattr(self._fit.stats, self.__stat_name)
+        slots_used = stats.used + 1
+        slots_max = stats.total or 0
+        if slots_used > slots_max:
+            return SlotAmountErrorData(
+                slots_used=slots_used,
+                slots_max_allowed=slots_max
+            )
+        return None
+
     @abstractmethod
     def _get_tainted_items(self, slots_max):
         ...
 
+    @abstractmethod
+    def _takes_slot(self, candidate):
+        """Check if candidate would occupy slot when added to fit."""
+        ...
+
     @property
     def restriction_type(self):
         return self.__restrictionType
@@ -93,11 +117,19 @@ class HighSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'high_slots', Restriction.high_slot)
 
     def register_item(self, item):
-        if item in self._fit.modules.high:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if item not in self._fit.modules.high:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
-        return self._fit.modules.high[slots_max:]
+        rack = self._fit.modules.high
+        # Positions of items can change without any changes
+        # to the register
+        track_volatile_dependency(FIT_COMPOSITION)
+        return rack[slots_max:]
+
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, ModuleHigh)
 
 
 class MediumSlotRegister(SlotAmountRestrictionRegister):
@@ -115,11 +147,19 @@ class MediumSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'med_slots', Restriction.medium_slot)
 
     def register_item(self, item):
-        if item in self._fit.modules.med:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if item not in self._fit.modules.med:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
-        return self._fit.modules.med[slots_max:]
+        rack = self._fit.modules.med
+        # Positions of items can change without any changes
+        # to the register
+        track_volatile_dependency(FIT_COMPOSITION)
+        return rack[slots_max:]
+
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, ModuleMed)
 
 
 class LowSlotRegister(SlotAmountRestrictionRegister):
@@ -137,11 +177,19 @@ class LowSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'low_slots', Restriction.low_slot)
 
     def register_item(self, item):
-        if item in self._fit.modules.low:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if item not in self._fit.modules.low:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
-        return self._fit.modules.low[slots_max:]
+        rack = self._fit.modules.low
+        # Positions of items can change without any changes
+        # to the register
+        track_volatile_dependency(FIT_COMPOSITION)
+        return rack[slots_max:]
+
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, ModuleLow)
 
 
 class RigSlotRegister(SlotAmountRestrictionRegister):
@@ -159,12 +207,16 @@ class RigSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'rig_slots', Restriction.rig_slot)
 
     def register_item(self, item):
-        if item in self._fit.rigs:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if item not in self._fit.rigs:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
         return self._slot_consumers
 
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, Rig)
+
 
 class SubsystemSlotRegister(SlotAmountRestrictionRegister):
     """
@@ -181,12 +233,16 @@ class SubsystemSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'subsystem_slots', Restriction.subsystem_slot)
 
     def register_item(self, item):
-        if item in self._fit.subsystems:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if item not in self._fit.subsystems:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
         return self._slot_consumers
 
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, Subsystem)
+
 
 class TurretSlotRegister(SlotAmountRestrictionRegister):
     """
@@ -203,12 +259,16 @@ class TurretSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'turret_slots', Restriction.turret_slot)
 
     def register_item(self, item):
-        if Slot.turret in item._eve_type.slots:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if Slot.turret not in item._eve_type.slots:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
         return self._slot_consumers
 
+    def _takes_slot(self, candidate):
+        return Slot.turret in candidate.eve_type.slots
+
 
 class LauncherSlotRegister(SlotAmountRestrictionRegister):
     """
@@ -225,12 +285,16 @@ class LauncherSlotRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'launcher_slots', Restriction.launcher_slot)
 
     def register_item(self, item):
-        if Slot.launcher in item._eve_type.slots:
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if Slot.launcher not in item._eve_type.slots:
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
         return self._slot_consumers
 
+    def _takes_slot(self, candidate):
+        return Slot.launcher in candidate.eve_type.slots
+
 
 class LaunchedDroneRegister(SlotAmountRestrictionRegister):
     """
@@ -247,8 +311,12 @@ class LaunchedDroneRegister(SlotAmountRestrictionRegister):
         SlotAmountRestrictionRegister.__init__(self, fit, 'launched_drones', Restriction.launched_drone)
 
     def register_item(self, item):
-        if isinstance(item, Drone):
-            SlotAmountRestrictionRegister.register_item(self, item)
+        if not isinstance(item, Drone):
+            return False
+        return SlotAmountRestrictionRegister.register_item(self, item)
 
     def _get_tainted_items(self, slots_max):
         return self._slot_consumers
+
+    def _takes_slot(self, candidate):
+        return isinstance(candidate.item, Drone)
@@ -53,14 +53,16 @@ class SlotIndexRestrictionRegister(BaseRestrictionRegister):
         # Skip items which don't have index specified
         slot_index = item._eve_type.attributes.get(self.__slot_index_attr)
         if slot_index is None:
-            return
+            return False
         self.__slotted_items.add_data(slot_index, item)
+        return True
 
     def unregister_item(self, item):
         slot_index = item._eve_type.attributes.get(self.__slot_index_attr)
-        if slot_index is None:
-            return
+        if item not in self.__slotted_items.get_data(slot_index):
+            return False
         self.__slotted_items.rm_data(slot_index, item)
+        return True
 
     def validate(self):
         tainted_items = {}
@@ -74,6 +76,14 @@ class SlotIndexRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        slot_index = candidate.eve_type.attributes.get(self.__slot_index_attr)
+        if slot_index is None:
+            return None
+        if self.__slotted_items.get(slot_index):
+            return SlotIndexErrorData(item_slot_index=slot_index)
+        return None
+
     @property
     def restriction_type(self):
         return self.__restriction_type
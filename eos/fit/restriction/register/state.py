@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction, State
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseRestrictionRegister
 from ..exception import RegisterValidationError
 
@@ -45,13 +46,19 @@ class StateRestrictionRegister(BaseRestrictionRegister):
         # We're going to track all items. Typically we track
         # online+ items, as all items can be at least offline
         self.__items.add(item)
+        return True
 
     def unregister_item(self, item):
-        self.__items.discard(item)
+        if item not in self.__items:
+            return False
+        self.__items.remove(item)
+        return True
 
     def validate(self):
         tainted_items = {}
         for item in self.__items:
+            # Item state changes are tracked on per-item basis
+            track_volatile_dependency(item)
             if item.state > item._eve_type.max_state:
                 allowed_states = tuple(filter(lambda s: s <= item._eve_type.max_state, State))
                 tainted_items[item] = StateErrorData(
@@ -61,6 +68,16 @@ class StateRestrictionRegister(BaseRestrictionRegister):
         if tainted_items:
             raise RegisterValidationError(tainted_items)
 
+    def check_candidate(self, candidate):
+        state = candidate.item.state
+        max_state = candidate.eve_type.max_state
+        if state > max_state:
+            return StateErrorData(
+                current_state=state,
+                allowed_states=tuple(filter(lambda s: s <= max_state, State))
+            )
+        return None
+
     @property
     def restriction_type(self):
         return Restriction.state
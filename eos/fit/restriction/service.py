@@ -24,8 +24,10 @@ from itertools import chain
 from eos.const.eos import State
 from eos.fit.messages import ItemAdded, ItemRemoved, ItemStateChanged, EnableServices, DisableServices
 from eos.util.pubsub import BaseSubscriber
+from eos.util.volatile_cache import track_volatile_calculation
 from .exception import RegisterValidationError, ValidationError
 from .register import *
+from .register.base import Candidate
 
 
 class RestrictionService(BaseSubscriber):
@@ -35,12 +37,28 @@ class RestrictionService(BaseSubscriber):
     between fit and restriction registers, managing them and providing
     results to fit.
 
+    Validation results of each register are kept along with keys of
+    the data register has used to produce them (see volatile manager).
+    Register is validated again only when its contents or any of this
+    data changes, thus validation after an edit runs only registers
+    which are affected by it.
+
+    Registers are populated lazily: until fit restrictions are queried
+    for the first time, service only records which items belong to fit.
+    After that, registers are kept current on each fit change.
+
     Required arguments:
     fit -- Fit object to which service is assigned
     """
 
     def __init__(self, fit):
         self.__enabled = False
+        self._fit = fit
+        # Items which belong to fit
+        # Format: {items}
+        self.__items = set()
+        # Flag which tells if items are registered in registers
+        self.__populated = False
         # Set with 'stateless' items. Items are always
         # tracked by these, regardless of state
         # Format: (registers,)
@@ -88,6 +106,13 @@ class RestrictionService(BaseSubscriber):
                 MaxGroupActiveRegister(),
             )
         }
+        # Format: {register: {item: error data}}
+        self.__register_errors = {}
+        # Format: {item: {restriction type: error data}}
+        self.__item_errors = {}
+        # Registers which have to be validated again
+        self.__stale = set(chain(self.__regs_stateless, *self.__regs_stateful.values()))
+        self.__generation = None
         fit._subscribe(self, self._handler_map.keys())
 
     def validate(self, skip_checks):
@@ -103,47 +128,187 @@ class RestrictionService(BaseSubscriber):
         validation, this exception is thrown, with all failure
         data in its arguments.
         """
+        skip_checks = set(skip_checks)
+        self.__update(skip_checks)
         # Container for validation error data
         # Format: {item: {error type: error data}}
         invalid_items = {}
-        # Go through all known registers
-        for register in chain(self.__regs_stateless, *self.__regs_stateful.values()):
-            # Skip check if we're told to do so, based
-            # on exception class assigned to register
-            restriction_type = register.restriction_type
-            if restriction_type in skip_checks:
-                continue
-            # Run validation for current register, if validation
-            # failure exception is raised - add it to container
-            try:
-                register.validate()
-            except RegisterValidationError as e:
-                # All erroneous items should be in 1st argument
-                # of raised exception
-                exception_data = e.args[0]
-                for item in exception_data:
-                    item_error = exception_data[item]
-                    # Fill container for invalid items
-                    item_errors = invalid_items.setdefault(item, {})
-                    item_errors[restriction_type] = item_error
+        for item, item_errors in self.__item_errors.items():
+            item_errors = {r: e for r, e in item_errors.items() if r not in skip_checks}
+            if item_errors:
+                invalid_items[item] = item_errors
         # Raise validation error only if we got any
         # failures
         if invalid_items:
             raise ValidationError(invalid_items)
 
+    def has_violations(self, skip_checks=()):
+        """
+        Check if fit has any restriction violations.
+
+        Optional arguments:
+        skip_checks -- iterable with restriction types, for which
+        checks are skipped
+
+        Return value:
+        True if any of restrictions is violated, else False
+        """
+        skip_checks = set(skip_checks)
+        self.__update(skip_checks)
+        for register, errors in self.__register_errors.items():
+            if errors and register.restriction_type not in skip_checks:
+                return True
+        return False
+
+    def get_item_violations(self, item, skip_checks=()):
+        """
+        Get restrictions violated by item.
+
+        Required arguments:
+        item -- item to get violations for
+
+        Optional arguments:
+        skip_checks -- iterable with restriction types, for which
+        checks are skipped
+
+        Return value:
+        Dictionary in {restriction type: error data} format
+        """
+        skip_checks = set(skip_checks)
+        self.__update(skip_checks)
+        item_errors = self.__item_errors.get(item, {})
+        return {r: e for r, e in item_errors.items() if r not in skip_checks}
+
+    def check_candidate(self, item, container=None, skip_checks=()):
+        """
+        Check if item would violate any restrictions if it was
+        added to fit, without actually adding it. Item is not
+        registered anywhere and its attribute map is not used;
+        restrictions which depend on item attributes are checked
+        against unmodified attribute values of its eve type.
+
+        Required arguments:
+        item -- item which is not assigned to any fit; its class,
+            state and eve type are taken into consideration
+
+        Optional arguments:
+        container -- item which charge would be loaded into; when
+            not specified, charge-related checks are skipped
+        skip_checks -- iterable with restriction types, for which
+            checks are skipped
+
+        Return value:
+        Dictionary in {restriction type: error data} format, empty
+        if item can be added to fit
+
+        Possible exceptions:
+        TypeFetchError -- raised when eve type of item cannot be
+            found in fit source
+        """
+        if not self.__enabled:
+            return {}
+        eve_type = self._fit.source.cache_handler.get_type(item._eve_type_id)
+        candidate = Candidate(item=item, eve_type=eve_type, container=container)
+        self.__populate()
+        skip_checks = set(skip_checks)
+        errors = {}
+        for register in self.__get_candidate_registers(item.state):
+            restriction_type = register.restriction_type
+            if restriction_type in skip_checks:
+                continue
+            error_data = register.check_candidate(candidate)
+            if error_data is not None:
+                errors[restriction_type] = error_data
+        return errors
+
+    def __get_candidate_registers(self, state):
+        yield from self.__regs_stateless
+        for register_state, registers in self.__regs_stateful.items():
+            if register_state <= state:
+                yield from registers
+
+    def _discard_volatile_attr(self, register):
+        """
+        Mark validation results of register as outdated.
+        Called by volatile manager when data used during
+        validation changes.
+        """
+        self.__stale.add(register)
+
+    def __update(self, skip_checks):
+        """
+        Validate registers whose results are outdated, and
+        update violation data. Registers of skipped restriction
+        types are left outdated until they are requested.
+        """
+        self.__populate()
+        volatile_mgr = self._fit._volatile_mgr
+        # Volatile manager forgets everything it tracked when
+        # its generation changes, thus all results are suspect
+        if volatile_mgr._generation != self.__generation:
+            self.__generation = volatile_mgr._generation
+            self.__stale.update(chain(self.__regs_stateless, *self.__regs_stateful.values()))
+        for register in tuple(self.__stale):
+            if register.restriction_type in skip_checks:
+                continue
+            self.__stale.discard(register)
+            errors, dependencies = track_volatile_calculation(self.__validate_register, register)
+            volatile_mgr._track_volatile_attr(self, register, dependencies)
+            self.__set_register_errors(register, errors)
+
+    def __populate(self):
+        """
+        Register all items of fit, if it hasn't been done yet.
+        """
+        if self.__populated:
+            return
+        self.__populated = True
+        for item in self.__items:
+            self.__add_item(item)
+
+    def __validate_register(self, register):
+        try:
+            register.validate()
+        except RegisterValidationError as e:
+            # All erroneous items should be in 1st argument
+            # of raised exception
+            return e.args[0]
+        return {}
+
+    def __set_register_errors(self, register, errors):
+        restriction_type = register.restriction_type
+        item_errors = self.__item_errors
+        for item in self.__register_errors.get(register, ()):
+            errors_of_item = item_errors[item]
+            del errors_of_item[restriction_type]
+            if not errors_of_item:
+                del item_errors[item]
+        if errors:
+            self.__register_errors[register] = errors
+            for item, item_error in errors.items():
+                item_errors.setdefault(item, {})[restriction_type] = item_error
+        else:
+            self.__register_errors.pop(register, None)
+
     # Message handling
     def _handle_item_addition(self, message):
         if not self.__enabled:
             return
-        self.__add_item(message.item)
+        self.__items.add(message.item)
+        if self.__populated:
+            self.__add_item(message.item)
 
     def _handle_item_removal(self, message):
         if not self.__enabled:
             return
-        self.__remove_item(message.item)
+        self.__items.discard(message.item)
+        if self.__populated:
+            self.__remove_item(message.item)
 
     def _handle_item_state_change(self, message):
-        if not self.__enabled:
+        # When registers are not populated, state of item
+        # is taken into account during population
+        if not self.__enabled or not self.__populated:
             return
         item, old_state, new_state = message
         if new_state > old_state:
@@ -159,7 +324,9 @@ class RestrictionService(BaseSubscriber):
         """
         self.__enabled = True
         for item in message.items:
-            self.__add_item(item)
+            self.__items.add(item)
+            if self.__populated:
+                self.__add_item(item)
 
     def _handle_disable_services(self, message):
         """
@@ -167,8 +334,15 @@ class RestrictionService(BaseSubscriber):
         disable it.
         """
         for item in message.items:
-            self.__remove_item(item)
+            self.__items.discard(item)
+            if self.__populated:
+                self.__remove_item(item)
         self.__enabled = False
+        # Service can be disabled for some of items only (e.g. on
+        # partial source switch); registers are filled lazily again
+        # only when all items have been unregistered
+        if not self.__items:
+            self.__populated = False
 
     _handler_map = {
         ItemAdded: _handle_item_addition,
@@ -188,7 +362,7 @@ class RestrictionService(BaseSubscriber):
     # Private methods for message handlers
     def __add_item(self, item):
         for register in self.__regs_stateless:
-            register.register_item(item)
+            self.__register_item(register, item)
         states = set(filter(lambda s: s <= item.state, State))
         self.__enable_states(item, states)
 
@@ -196,7 +370,7 @@ class RestrictionService(BaseSubscriber):
         states = set(filter(lambda s: s <= item.state, State))
         self.__disable_states(item, states)
         for register in self.__regs_stateless:
-            register.unregister_item(item)
+            self.__unregister_item(register, item)
 
     def __enable_states(self, item, states):
         """
@@ -215,7 +389,7 @@ class RestrictionService(BaseSubscriber):
             except KeyError:
                 continue
             for register in registers:
-                register.register_item(item)
+                self.__register_item(register, item)
 
     def __disable_states(self, item, states):
         """
@@ -232,4 +406,12 @@ class RestrictionService(BaseSubscriber):
             except KeyError:
                 continue
             for register in registers:
-                register.unregister_item(item)
+                self.__unregister_item(register, item)
+
+    def __register_item(self, register, item):
+        if register.register_item(item):
+            self.__stale.add(register)
+
+    def __unregister_item(self, register, item):
+        if register.unregister_item(item):
+            self.__stale.add(register)
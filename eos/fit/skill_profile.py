@@ -0,0 +1,197 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Skill requirement checks against multiple character skill profiles
+at once. Skill requirements of all fit items are flattened into
+arrays once, then levels of required skills are gathered from each
+profile and compared with required levels in one pass. When NumPy is
+available, profile levels and comparisons are NumPy arrays; pure
+python fallback does the same with plain sequences.
+"""
+
+
+from array import array
+
+from eos.util.numpy_support import numpy
+from .export import iter_fit_items
+from .restriction.register.skill_requirement import EXCEPTIONS, SkillRequirementErrorData
+from .tuples import SkillProfileCheck
+
+
+# Level stored for skills which are absent from profile
+MISSING_LEVEL = -1
+
+
+class SkillProfile:
+    """
+    Skill levels of a character, stored as dense array indexed
+    by skill type ID.
+
+    Required arguments:
+    levels -- map in {skill type ID: skill level} format
+    """
+
+    def __init__(self, levels):
+        size = max(levels, default=-1) + 1
+        if numpy is not None:
+            dense = numpy.full(size, MISSING_LEVEL, dtype=numpy.int8)
+        else:
+            dense = array('b', (MISSING_LEVEL,)) * size
+        for skill_id, level in levels.items():
+            dense[skill_id] = level
+        self.__levels = dense
+
+    @classmethod
+    def from_fit(cls, fit):
+        """
+        Make profile out of skills assigned to fit. Skills
+        without level are considered to be absent.
+        """
+        levels = {}
+        for skill in fit.skills:
+            level = skill.level
+            if level is not None:
+                levels[skill._eve_type_id] = level
+        return cls(levels)
+
+    @property
+    def levels(self):
+        """Return dense array with skill levels."""
+        return self.__levels
+
+    def get_level(self, skill_id):
+        """
+        Get level of skill, or None if profile doesn't
+        have this skill.
+        """
+        try:
+            level = self.__levels[skill_id]
+        except IndexError:
+            return None
+        if level == MISSING_LEVEL:
+            return None
+        return int(level)
+
+    def _gather(self, skill_ids):
+        """
+        Get levels of skills with passed IDs as NumPy array,
+        with MISSING_LEVEL for absent skills.
+        """
+        levels = self.__levels
+        gathered = numpy.full(len(skill_ids), MISSING_LEVEL, dtype=numpy.int8)
+        known = skill_ids < len(levels)
+        gathered[known] = levels[skill_ids[known]]
+        return gathered
+
+
+def check_skill_profiles(fit, profiles):
+    """
+    Check skill requirements of all fit items against multiple
+    skill profiles. Requirements are interpreted the same way as
+    by skill requirement restriction.
+
+    Required arguments:
+    fit -- fit whose items are checked
+    profiles -- iterable with SkillProfile objects
+
+    Return value:
+    List with SkillProfileCheck(passed, missing) per profile, where
+    missing is dictionary in {item: (SkillRequirementErrorData,)}
+    format with unmet requirements
+    """
+    profiles = list(profiles)
+    items, req_items, req_skills, req_levels = _get_requirements(fit)
+    if numpy is not None:
+        return _check_array(profiles, items, req_items, req_skills, req_levels)
+    return _check_python(profiles, items, req_items, req_skills, req_levels)
+
+
+def _get_requirements(fit):
+    """
+    Flatten skill requirements of fit items into parallel
+    sequences with item index, skill ID and required level.
+    """
+    items = []
+    req_items = []
+    req_skills = []
+    req_levels = []
+    if fit.source is None:
+        return items, req_items, req_skills, req_levels
+    for item in iter_fit_items(fit):
+        if isinstance(item, EXCEPTIONS):
+            continue
+        required_skills = item._eve_type.required_skills
+        if not required_skills:
+            continue
+        item_index = len(items)
+        items.append(item)
+        for skill_id, level in required_skills.items():
+            req_items.append(item_index)
+            req_skills.append(skill_id)
+            req_levels.append(level)
+    return items, req_items, req_skills, req_levels
+
+
+def _check_array(profiles, items, req_items, req_skills, req_levels):
+    req_skills = numpy.array(req_skills, dtype=numpy.int64)
+    req_levels = numpy.array(req_levels, dtype=numpy.int8)
+    if profiles:
+        levels = numpy.stack([profile._gather(req_skills) for profile in profiles])
+    else:
+        levels = numpy.empty((0, len(req_skills)), dtype=numpy.int8)
+    # Profile × requirement matrix of unmet requirements
+    failed = levels < req_levels
+    passed = ~failed.any(axis=1)
+    results = []
+    for profile_index, profile_passed in enumerate(passed):
+        if profile_passed:
+            results.append(SkillProfileCheck(passed=True, missing={}))
+            continue
+        missing = {}
+        for req_index in numpy.flatnonzero(failed[profile_index]):
+            level = int(levels[profile_index, req_index])
+            _add_missing(
+                missing, items[req_items[req_index]], int(req_skills[req_index]),
+                None if level == MISSING_LEVEL else level, int(req_levels[req_index]))
+        results.append(SkillProfileCheck(passed=False, missing=_freeze(missing)))
+    return results
+
+
+def _check_python(profiles, items, req_items, req_skills, req_levels):
+    results = []
+    for profile in profiles:
+        missing = {}
+        for item_index, skill_id, required_level in zip(req_items, req_skills, req_levels):
+            level = profile.get_level(skill_id)
+            if level is None or level < required_level:
+                _add_missing(missing, items[item_index], skill_id, level, required_level)
+        results.append(SkillProfileCheck(passed=not missing, missing=_freeze(missing)))
+    return results
+
+
+def _add_missing(missing, item, skill_id, level, required_level):
+    error_data = SkillRequirementErrorData(skill=skill_id, level=level, required_level=required_level)
+    missing.setdefault(item, []).append(error_data)
+
+
+def _freeze(missing):
+    return {item: tuple(errors) for item, errors in missing.items()}
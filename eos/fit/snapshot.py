@@ -0,0 +1,321 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Compact binary snapshots of fits.
+
+Snapshot keeps everything which is needed to re-create fit: items
+in their containers with eve types, states, charges, skill levels,
+disabled effects and persistent overrides. Optionally it carries
+calculated attribute values as well; they are tied to fingerprint of
+source which has been used to calculate them, and when snapshot is
+restored against source with the same fingerprint, values are put
+back as-is and no recalculation happens.
+
+Layout (little-endian): magic, format version, flags, source
+fingerprint, then single-item containers, module racks and unordered
+containers, in fixed order.
+"""
+
+
+from struct import Struct, error as StructError
+
+from eos.const.eos import State
+from eos.exception import EosError
+from .fit import Fit
+from .item import *
+
+
+MAGIC = b'EOSF'
+VERSION = 1
+# Flag which marks snapshot with calculated attribute values
+FLAG_VALUES = 0x01
+
+SINGLE_ITEMS = (('character', Character), ('ship', Ship), ('stance', Stance), ('effect_beacon', EffectBeacon))
+RACKS = (('high', ModuleHigh), ('med', ModuleMed), ('low', ModuleLow))
+SETS = (
+    ('skills', Skill), ('implants', Implant), ('boosters', Booster),
+    ('subsystems', Subsystem), ('rigs', Rig), ('drones', Drone)
+)
+# Item classes whose state is kept in snapshot; other items are always offline
+STATEFUL = (ModuleHigh, ModuleMed, ModuleLow, Drone)
+
+# Tags of value types
+TAG_NONE = 0
+TAG_INT = 1
+TAG_FLOAT = 2
+
+U8 = Struct('<B')
+U16 = Struct('<H')
+U32 = Struct('<I')
+I64 = Struct('<q')
+F64 = Struct('<d')
+
+
+class SnapshotError(EosError):
+    """
+    Raised when snapshot cannot be made or restored.
+    """
+    pass
+
+
+def dump_snapshot(fit, values=False):
+    """
+    Make binary snapshot of fit.
+
+    Required arguments:
+    fit -- fit to make snapshot of
+
+    Optional arguments:
+    values -- when True, calculated attribute values are included
+        into snapshot
+
+    Return value:
+    Bytes with snapshot
+    """
+    writer = _Writer()
+    writer.raw(MAGIC)
+    writer.u8(VERSION)
+    writer.u8(FLAG_VALUES if values else 0)
+    writer.string(_get_fingerprint(fit.source))
+    for attr_name, _ in SINGLE_ITEMS:
+        writer.item_opt(getattr(fit, attr_name), values)
+    for rack_name, _ in RACKS:
+        rack = getattr(fit.modules, rack_name)
+        writer.u16(len(rack))
+        for module in rack:
+            writer.item_opt(module, values)
+            if module is not None:
+                writer.item_opt(module.charge, values)
+    for attr_name, _ in SETS:
+        container = getattr(fit, attr_name)
+        writer.u16(len(container))
+        for item in container:
+            writer.item(item, values)
+    return writer.getvalue()
+
+
+def load_snapshot(data, source=None, restrictions=True, stats=True):
+    """
+    Re-create fit out of binary snapshot.
+
+    Required arguments:
+    data -- bytes with snapshot
+
+    Optional arguments:
+    source -- source to use for new fit; when it has the same
+        non-empty fingerprint as source snapshot has been made
+        with, calculated values are restored from snapshot (if it
+        has them), otherwise they are calculated anew when requested
+    restrictions -- passed to fit, see Fit
+    stats -- passed to fit, see Fit
+
+    Return value:
+    New fit object
+
+    Possible exceptions:
+    SnapshotError -- raised when data is not a snapshot, or
+        snapshot has unsupported version
+    """
+    reader = _Reader(data)
+    try:
+        if reader.raw(len(MAGIC)) != MAGIC:
+            raise SnapshotError('data is not a fit snapshot')
+        version = reader.u8()
+        if version != VERSION:
+            raise SnapshotError('unsupported snapshot version {}'.format(version))
+        flags = reader.u8()
+        fingerprint = reader.string()
+        fit = Fit(source=source, restrictions=restrictions, stats=stats)
+        # Format: [(item, (values, caps))]
+        values = []
+        for attr_name, item_class in SINGLE_ITEMS:
+            setattr(fit, attr_name, reader.item_opt(item_class, flags, values))
+        for rack_name, item_class in RACKS:
+            rack = getattr(fit.modules, rack_name)
+            for index in range(reader.u16()):
+                module = reader.item_opt(item_class, flags, values)
+                if module is None:
+                    continue
+                module.charge = reader.item_opt(Charge, flags, values)
+                rack.place(index, module)
+        for attr_name, item_class in SETS:
+            container = getattr(fit, attr_name)
+            for _ in range(reader.u16()):
+                container.add(reader.item(item_class, flags, values))
+    except StructError as e:
+        raise SnapshotError('snapshot is truncated') from e
+    # Values are put back only when everything is in place,
+    # as services invalidate values when items are added
+    # Empty fingerprint means that source data version is unknown,
+    # thus values cannot be trusted even if fingerprints are equal
+    if values and fingerprint and fingerprint == _get_fingerprint(fit.source):
+        for item, (item_values, caps) in values:
+            item.attributes._load_values(item_values, caps)
+    return fit
+
+
+def _get_fingerprint(source):
+    if source is None:
+        return ''
+    return source.cache_handler.get_fingerprint() or ''
+
+
+class _Writer:
+
+    def __init__(self):
+        self.__buffer = bytearray()
+
+    def getvalue(self):
+        return bytes(self.__buffer)
+
+    def raw(self, data):
+        self.__buffer += data
+
+    def u8(self, value):
+        self.__buffer += U8.pack(value)
+
+    def u16(self, value):
+        self.__buffer += U16.pack(value)
+
+    def u32(self, value):
+        self.__buffer += U32.pack(value)
+
+    def string(self, value):
+        data = value.encode('utf-8')
+        self.u16(len(data))
+        self.raw(data)
+
+    def value(self, value):
+        if value is None:
+            self.u8(TAG_NONE)
+        elif isinstance(value, int):
+            self.u8(TAG_INT)
+            self.__buffer += I64.pack(value)
+        elif isinstance(value, float):
+            self.u8(TAG_FLOAT)
+            self.__buffer += F64.pack(value)
+        else:
+            raise SnapshotError('value {!r} cannot be stored in snapshot'.format(value))
+
+    def item_opt(self, item, values):
+        if item is None:
+            self.u8(0)
+            return
+        self.u8(1)
+        self.item(item, values)
+
+    def item(self, item, values):
+        self.u32(item._eve_type_id)
+        if isinstance(item, STATEFUL):
+            self.u8(item.state)
+        disabled_effects = sorted(item._disabled_effects)
+        self.u16(len(disabled_effects))
+        for effect_id in disabled_effects:
+            self.u32(effect_id)
+        overrides = [(a, d.value) for a, d in sorted(item.attributes._overrides.items()) if d.persistent]
+        self.u16(len(overrides))
+        for attr, value in overrides:
+            self.u32(attr)
+            self.value(value)
+        if not values:
+            return
+        item_values, caps = item.attributes._dump_values()
+        self.u32(len(item_values))
+        for attr, value in sorted(item_values.items()):
+            self.u32(attr)
+            self.value(value)
+        self.u16(len(caps))
+        for capping_attr, capped_attrs in sorted(caps.items()):
+            self.u32(capping_attr)
+            self.u16(len(capped_attrs))
+            for capped_attr in sorted(capped_attrs):
+                self.u32(capped_attr)
+
+
+class _Reader:
+
+    def __init__(self, data):
+        self.__data = memoryview(data)
+        self.__offset = 0
+
+    def raw(self, length):
+        start = self.__offset
+        if start + length > len(self.__data):
+            raise StructError('not enough data')
+        self.__offset += length
+        return bytes(self.__data[start:self.__offset])
+
+    def __unpack(self, struct):
+        value, = struct.unpack_from(self.__data, self.__offset)
+        self.__offset += struct.size
+        return value
+
+    def u8(self):
+        return self.__unpack(U8)
+
+    def u16(self):
+        return self.__unpack(U16)
+
+    def u32(self):
+        return self.__unpack(U32)
+
+    def string(self):
+        return self.raw(self.u16()).decode('utf-8')
+
+    def value(self):
+        tag = self.u8()
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_INT:
+            return self.__unpack(I64)
+        if tag == TAG_FLOAT:
+            return self.__unpack(F64)
+        raise SnapshotError('unknown value tag {}'.format(tag))
+
+    def item_opt(self, item_class, flags, values):
+        if not self.u8():
+            return None
+        return self.item(item_class, flags, values)
+
+    def item(self, item_class, flags, values):
+        type_id = self.u32()
+        if issubclass(item_class, STATEFUL):
+            item = item_class(type_id, state=State(self.u8()))
+        else:
+            item = item_class(type_id)
+        disabled_effects = [self.u32() for _ in range(self.u16())]
+        if disabled_effects:
+            item._set_effects_status(disabled_effects, False)
+        for _ in range(self.u16()):
+            attr = self.u32()
+            item.attributes._override_set(attr, self.value(), persist=True)
+        if flags & FLAG_VALUES:
+            item_values = {}
+            for _ in range(self.u32()):
+                attr = self.u32()
+                item_values[attr] = self.value()
+            caps = {}
+            for _ in range(self.u16()):
+                capping_attr = self.u32()
+                caps[capping_attr] = {self.u32() for _ in range(self.u16())}
+            values.append((item, (item_values, caps)))
+        return item
@@ -0,0 +1,125 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Comparison of eve data between sources, used to switch fit to other
+source without rebuilding everything. Objects from different sources
+are compared by their contents: eve types by their group, category,
+attribute values and effects, effects by their properties and
+modifiers.
+"""
+
+
+from weakref import WeakKeyDictionary
+
+from eos.data.cache_handler.exception import AttributeFetchError, TypeFetchError
+
+
+EFFECT_FIELDS = (
+    'id', 'category', 'is_offensive', 'is_assistance', 'duration_attribute',
+    'discharge_attribute', 'range_attribute', 'falloff_attribute',
+    'tracking_speed_attribute', 'fitting_usage_chance_attribute', 'build_status'
+)
+ATTRIBUTE_FIELDS = ('id', 'max_attribute', 'default_value', 'high_is_good', 'stackable')
+
+
+# Format: {eve type: content key}
+_type_keys = WeakKeyDictionary()
+
+
+def get_changed_items(items, old_cache_handler, new_cache_handler):
+    """
+    Find items whose eve type data differs between sources.
+
+    Required arguments:
+    items -- iterable with items to check
+    old_cache_handler -- cache handler of source items currently use
+    new_cache_handler -- cache handler of source to switch to
+
+    Return value:
+    Set with items whose eve types differ, or None if metadata of
+    attributes used by items differs, in which case all calculated
+    values are affected
+    """
+    changed = set()
+    attr_ids = set()
+    for item in items:
+        old_type = item._eve_type
+        attr_ids.update(old_type.attributes)
+        attr_ids.update(item.attributes.keys())
+        try:
+            new_type = new_cache_handler.get_type(item._eve_type_id)
+        except TypeFetchError:
+            changed.add(item)
+            continue
+        if get_type_key(old_type) != get_type_key(new_type):
+            changed.add(item)
+    for attr_id in attr_ids:
+        try:
+            old_attr = old_cache_handler.get_attribute(attr_id)
+        except AttributeFetchError:
+            old_attr = None
+        try:
+            new_attr = new_cache_handler.get_attribute(attr_id)
+        except AttributeFetchError:
+            new_attr = None
+        if _get_attribute_key(old_attr) != _get_attribute_key(new_attr):
+            return None
+    return changed
+
+
+def get_type_key(eve_type):
+    """
+    Get tuple which describes contents of eve type; eve
+    types with equal keys behave the same way.
+    """
+    try:
+        return _type_keys[eve_type]
+    except KeyError:
+        pass
+    effects = sorted(eve_type.effects, key=lambda e: e.id)
+    default_effect = eve_type.default_effect
+    key = (
+        eve_type.id, eve_type.group, eve_type.category,
+        tuple(sorted(eve_type.attributes.items())),
+        tuple(_get_effect_key(effect) for effect in effects),
+        None if default_effect is None else default_effect.id
+    )
+    _type_keys[eve_type] = key
+    return key
+
+
+def _get_effect_key(effect):
+    fields = tuple(getattr(effect, name) for name in EFFECT_FIELDS)
+    modifiers = tuple(_get_modifier_key(modifier) for modifier in effect.modifiers)
+    return fields, modifiers
+
+
+def _get_modifier_key(modifier):
+    # Modifiers of different classes may have the same fields
+    # with different meaning, thus class is part of key
+    return type(modifier), tuple(sorted(vars(modifier).items()))
+
+
+def _get_attribute_key(attr):
+    if attr is None:
+        return None
+    return tuple(getattr(attr, name) for name in ATTRIBUTE_FIELDS)
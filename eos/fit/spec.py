@@ -0,0 +1,143 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+Lightweight fit specifications. Spec describes fit contents with
+type IDs, states and skill levels only, thus it is cheap to create,
+compare and send to other processes, and can be turned into fit
+object when needed.
+"""
+
+
+from .fit import Fit
+from .item import *
+from .tuples import DroneSpec, FitSpec, ModuleSpec
+
+
+RACKS = (('high', ModuleHigh), ('med', ModuleMed), ('low', ModuleLow))
+SETS = (('rigs', Rig), ('subsystems', Subsystem), ('implants', Implant), ('boosters', Booster))
+
+
+def build_fit(spec, source=None, restrictions=True, stats=True):
+    """
+    Make new fit out of spec.
+
+    Required arguments:
+    spec -- FitSpec object
+
+    Optional arguments:
+    source -- source to use for new fit
+    restrictions -- passed to fit, see Fit
+    stats -- passed to fit, see Fit
+
+    Return value:
+    New fit object
+    """
+    fit = Fit(source=source, restrictions=restrictions, stats=stats)
+    _fill_fit(fit, spec)
+    return fit
+
+
+def get_fit_spec(fit):
+    """
+    Describe contents of fit as spec.
+
+    Required arguments:
+    fit -- fit to describe
+
+    Return value:
+    FitSpec object
+    """
+    racks = {}
+    for rack_name, _ in RACKS:
+        racks[rack_name] = tuple(_get_module_spec(m) for m in getattr(fit.modules, rack_name))
+    sets = {}
+    for attr_name, _ in SETS:
+        sets[attr_name] = tuple(sorted(i._eve_type_id for i in getattr(fit, attr_name)))
+    drones = tuple(sorted(DroneSpec(d._eve_type_id, d.state) for d in fit.drones))
+    skills = tuple(sorted((s._eve_type_id, s.level) for s in fit.skills))
+    return FitSpec(
+        ship=_get_type_id(fit.ship),
+        stance=_get_type_id(fit.stance),
+        drones=drones,
+        skills=skills,
+        **racks,
+        **sets
+    )
+
+
+def _fill_fit(fit, spec):
+    """
+    Add items described by spec to fit.
+
+    Return value:
+    Dictionary in {item: location} format, where location is tuple
+    which points to item within spec, e.g. ('ship',), ('high', 2),
+    ('high', 2, 'charge') or ('drones', 0); character, which is
+    created by fit itself, is located at ('character',)
+    """
+    locations = {}
+    if fit.character is not None:
+        locations[fit.character] = ('character',)
+    if spec.ship is not None:
+        fit.ship = Ship(spec.ship)
+        locations[fit.ship] = ('ship',)
+    if spec.stance is not None:
+        fit.stance = Stance(spec.stance)
+        locations[fit.stance] = ('stance',)
+    for rack_name, item_class in RACKS:
+        rack = getattr(fit.modules, rack_name)
+        for index, module_spec in enumerate(getattr(spec, rack_name)):
+            if module_spec is None:
+                continue
+            charge = Charge(module_spec.charge) if module_spec.charge is not None else None
+            module = item_class(module_spec.type_id, state=module_spec.state, charge=charge)
+            rack.place(index, module)
+            locations[module] = (rack_name, index)
+            if charge is not None:
+                locations[charge] = (rack_name, index, 'charge')
+    for attr_name, item_class in SETS:
+        container = getattr(fit, attr_name)
+        for index, type_id in enumerate(getattr(spec, attr_name)):
+            item = item_class(type_id)
+            container.add(item)
+            locations[item] = (attr_name, index)
+    for index, drone_spec in enumerate(spec.drones):
+        drone = Drone(drone_spec.type_id, state=drone_spec.state)
+        fit.drones.add(drone)
+        locations[drone] = ('drones', index)
+    for index, (type_id, level) in enumerate(dict(spec.skills).items()):
+        skill = Skill(type_id, level=level)
+        fit.skills.add(skill)
+        locations[skill] = ('skills', index)
+    return locations
+
+
+def _get_type_id(item):
+    if item is None:
+        return None
+    return item._eve_type_id
+
+
+def _get_module_spec(module):
+    if module is None:
+        return None
+    return ModuleSpec(module._eve_type_id, module.state, _get_type_id(module.charge))
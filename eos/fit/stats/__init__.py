@@ -19,4 +19,5 @@
 # ===============================================================================
 
 
+from .exception import StatsDisabledError
 from .service import StatService
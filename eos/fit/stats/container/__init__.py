@@ -20,11 +20,13 @@
 
 
 __all__ = [
+    'Capacitor',
     'ShipResource',
     'CharSlots',
     'ShipSlots'
 ]
 
 
+from .capacitor import Capacitor
 from .ship_resource import ShipResource
 from .slots import CharSlots, ShipSlots
@@ -0,0 +1,93 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eve import Attribute
+from eos.fit.capacitor import simulate_capacitor
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty, track_volatile_dependency
+
+
+class Capacitor(InheritableVolatileMixin):
+    """
+    Class designed to conveniently provide ship
+    capacitor stats. Stability stats are calculated
+    assuming that all active modules are activated
+    at the same time and run continuously.
+    """
+
+    def __init__(self, fit, capacitor_use_register):
+        InheritableVolatileMixin.__init__(self)
+        self._fit = fit
+        self.__register = capacitor_use_register
+
+    @VolatileProperty
+    def capacity(self):
+        return self.__get_ship_attr(Attribute.capacitor_capacity)
+
+    @VolatileProperty
+    def recharge_time(self):
+        """Return capacitor recharge time in seconds."""
+        recharge_ms = self.__get_ship_attr(Attribute.recharge_rate)
+        if recharge_ms is None:
+            return None
+        return recharge_ms / 1000
+
+    @property
+    def stable(self):
+        """
+        Return True if capacitor never runs out, False if it does,
+        None if ship capacitor data is not available.
+        """
+        return self._simulation.stable
+
+    @property
+    def stable_level(self):
+        """
+        Return share of capacity around which stable capacitor
+        oscillates, or None if capacitor is not stable.
+        """
+        return self._simulation.stable_level
+
+    @property
+    def depletion_time(self):
+        """
+        Return time in seconds after which there's not enough
+        capacitor to activate some module, or None if capacitor
+        is stable.
+        """
+        return self._simulation.depletion_time
+
+    @VolatileProperty
+    def _simulation(self):
+        return simulate_capacitor(self.capacity, self.recharge_time, self.__register.get_drains())
+
+    def __get_ship_attr(self, attr):
+        track_volatile_dependency(FIT_COMPOSITION)
+        ship_item = self._fit.ship
+        try:
+            ship_item_attribs = ship_item.attributes
+        except AttributeError:
+            return None
+        else:
+            try:
+                return ship_item_attribs[attr]
+            except KeyError:
+                return None
@@ -19,7 +19,8 @@
 # ===============================================================================
 
 
-from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty, track_volatile_dependency
 
 
 class ShipResource(InheritableVolatileMixin):
@@ -43,6 +44,7 @@ class ShipResource(InheritableVolatileMixin):
         # Get ship's resource output, setting it to None
         # if fitting doesn't have ship assigned,
         # or ship doesn't have resource output attribute
+        track_volatile_dependency(FIT_COMPOSITION)
         ship_item = self._fit.ship
         try:
             ship_item_attribs = ship_item.attributes
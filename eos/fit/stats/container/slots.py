@@ -19,7 +19,8 @@
 # ===============================================================================
 
 
-from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty, track_volatile_dependency
 
 
 class EntitySlots(InheritableVolatileMixin):
@@ -37,6 +38,7 @@ class EntitySlots(InheritableVolatileMixin):
 
     @VolatileProperty
     def used(self):
+        track_volatile_dependency(FIT_COMPOSITION)
         return len(self.__container)
 
     @VolatileProperty
@@ -44,6 +46,7 @@ class EntitySlots(InheritableVolatileMixin):
         # Get amount of provided slots, setting it to None
         # if fitting doesn't have ship assigned,
         # or ship doesn't have slot attribute
+        track_volatile_dependency(FIT_COMPOSITION)
         slot_carrier_item = getattr(self._fit, self.__slot_carrier)
         try:
             slot_carrier_attribs = slot_carrier_item.attributes
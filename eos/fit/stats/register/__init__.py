@@ -20,6 +20,7 @@
 
 
 __all__ = [
+    'CapacitorUseRegister',
     'DamageDealerRegister',
     'CpuUseRegister',
     'PowerGridUseRegister',
@@ -32,6 +33,7 @@ __all__ = [
 ]
 
 
+from .capacitor import CapacitorUseRegister
 from .damage_dealer import DamageDealerRegister
 from .resource_use import (CpuUseRegister, PowerGridUseRegister, CalibrationUseRegister,
     DroneBayVolumeUseRegister, DroneBandwidthUseRegister)
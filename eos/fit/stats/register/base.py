@@ -46,3 +46,11 @@ class BaseStatRegister(metaclass=ABCMeta):
         item -- item to unregister
         """
         ...
+
+    @abstractmethod
+    def __len__(self):
+        """
+        Return amount of registered items. Used to detect
+        changes of register contents.
+        """
+        ...
@@ -0,0 +1,65 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.fit.tuples import CapacitorDrain
+from eos.util.volatile_cache import track_volatile_dependency
+from .base import BaseStatRegister
+
+
+class CapacitorUseRegister(BaseStatRegister):
+    """
+    Class which tracks all items whose default
+    effect uses capacitor.
+    """
+
+    def __init__(self):
+        self.__cap_users = set()
+
+    def register_item(self, item):
+        default_effect = getattr(item._eve_type, 'default_effect', None)
+        if getattr(default_effect, 'discharge_attribute', None) is None:
+            return
+        self.__cap_users.add(item)
+
+    def unregister_item(self, item):
+        self.__cap_users.discard(item)
+
+    def __len__(self):
+        return len(self.__cap_users)
+
+    def get_drains(self):
+        """
+        Return list with capacitor amount used per activation and
+        time between activations for all registered items. Items
+        for which any of these cannot be fetched are skipped.
+        """
+        track_volatile_dependency(self)
+        drains = []
+        for item in self.__cap_users:
+            amount = item.attributes.get(item._eve_type.default_effect.discharge_attribute)
+            cycle_time = getattr(item, 'cycle_time', None)
+            if amount is None or cycle_time is None:
+                continue
+            # Items may have no reactivation attribute, return None or
+            # actual value; make sure we use 0 as fallback in all cases
+            reactivation_time = getattr(item, 'reactivation_delay', 0) or 0
+            drains.append(CapacitorDrain(amount=amount, period=cycle_time + reactivation_time))
+        return drains
@@ -19,32 +19,71 @@
 # ===============================================================================
 
 
+from eos.fit.application import sum_damage
 from eos.fit.item.mixin.damage_dealer import DamageDealerMixin
 from eos.fit.tuples import DamageTypesTotal
+from eos.holder_filter import turret_filter, missile_filter, drone_filter, sentry_drone_filter
+from eos.util.volatile_cache import (
+    track_volatile_dependency, track_volatile_calculation, volatile_calculation_active
+)
 from .base import BaseStatRegister
 
 
+# Item filters for which fit-wide damage stats are maintained
+# incrementally; stats for other filters are calculated on request
+AGGREGATED_FILTERS = (None, turret_filter, missile_filter, drone_filter, sentry_drone_filter)
+
+
 class DamageDealerRegister(BaseStatRegister):
     """
     Class which tracks all items which can potentially
     deal damage, and provides functionality to fetch some
     useful data.
+
+    Required arguments:
+    fit -- fit, to which register is bound
     """
 
-    def __init__(self):
+    def __init__(self, fit):
+        self._fit = fit
         self.__dealers = set()
+        # Format: {(item filter, method name, args, kwargs): aggregate}
+        self.__aggregates = {}
+        self.__generation = None
 
     def register_item(self, item):
-        if isinstance(item, DamageDealerMixin):
-            self.__dealers.add(item)
+        if not isinstance(item, DamageDealerMixin):
+            return
+        self.__dealers.add(item)
+        for aggregate in self.__aggregates.values():
+            aggregate.add_dealer(item)
 
     def unregister_item(self, item):
-        self.__dealers.discard(item)
+        if item not in self.__dealers:
+            return
+        self.__dealers.remove(item)
+        if not self.__dealers:
+            self.__aggregates.clear()
+            return
+        for aggregate in self.__aggregates.values():
+            aggregate.remove_dealer(item)
+
+    def __len__(self):
+        return len(self.__dealers)
+
+    def _clear_aggregates(self):
+        """Forget all the maintained damage stats."""
+        self.__aggregates.clear()
 
     def _collect_damage_stats(self, item_filter, method_name, *args, **kwargs):
         """
         Fetch stats from all registered items.
 
+        Stats for filters listed in AGGREGATED_FILTERS are kept
+        between calls: contribution of each item is remembered,
+        and when inputs of item change, only its contribution is
+        recalculated and fit-wide sum is adjusted by difference.
+
         Required arguments:
         item_filter -- function which is evaluated for each item;
         if true, item's stats are taken into consideration. Can be None.
@@ -57,6 +96,87 @@ class DamageDealerRegister(BaseStatRegister):
         which contain total stats for all items which satisfy passed
         conditions.
         """
+        track_volatile_dependency(self)
+        aggregate = self.__get_aggregate(item_filter, method_name, args, kwargs)
+        if aggregate is None:
+            return self.__calculate_damage_stats(item_filter, method_name, *args, **kwargs)
+        return aggregate.get_stats()
+
+    def _collect_nominal_damage(self):
+        """
+        Fetch nominal volley and dps from all registered items
+        in one pass over items.
+
+        Return value:
+        Tuple with volley and dps objects, both with em, thermal,
+        kinetic, explosive and total attributes
+        """
+        track_volatile_dependency(self)
+        volley_sums = [None, None, None, None]
+        dps_sums = [None, None, None, None]
+        for item in self.__dealers:
+            _add_damage(volley_sums, item.get_nominal_volley())
+            _add_damage(dps_sums, item.get_nominal_dps())
+        return _make_damage_total(*volley_sums), _make_damage_total(*dps_sums)
+
+    def _collect_damage_curves(self, item_filter, method_name, *args, **kwargs):
+        """
+        Fetch per-target stats from all registered items and sum them.
+
+        Required arguments:
+        item_filter -- function which is evaluated for each item;
+        if true, item's stats are taken into consideration. Can be None.
+        method_name, *args, **kwargs -- method name, which will be called
+        for each item to request its per-target damage stats. Args and
+        kwargs are arguments which are passed to this method.
+
+        Return value:
+        Object with em, thermal, kinetic, explosive and total attributes
+        which contain total damage for each target.
+        """
+        track_volatile_dependency(self)
+        return sum_damage(
+            getattr(item, method_name)(*args, **kwargs) for item in self.__dealers
+            if item_filter is None or item_filter(item)
+        )
+
+    def __get_aggregate(self, item_filter, method_name, args, kwargs):
+        """
+        Get aggregate which maintains requested stats, creating
+        it if needed. None is returned when stats cannot be
+        maintained and have to be calculated directly.
+        """
+        # Changes of inputs of item stats are tracked by volatile
+        # manager; without it, aggregates would never be updated
+        try:
+            volatile_mgr = self._fit._volatile_mgr
+        except AttributeError:
+            return None
+        # Volatile properties rely on all the data used to calculate
+        # their value, which is not kept by aggregates
+        if volatile_calculation_active():
+            return None
+        if item_filter not in AGGREGATED_FILTERS:
+            return None
+        key = (item_filter, method_name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        if volatile_mgr._generation != self.__generation:
+            self.__aggregates.clear()
+            self.__generation = volatile_mgr._generation
+        try:
+            return self.__aggregates[key]
+        except KeyError:
+            pass
+        if not self.__dealers:
+            return None
+        aggregate = self.__aggregates[key] = DamageAggregate(
+            volatile_mgr, self.__dealers, item_filter, method_name, args, kwargs)
+        return aggregate
+
+    def __calculate_damage_stats(self, item_filter, method_name, *args, **kwargs):
         em, therm, kin, expl = None, None, None, None
         for item in self.__dealers:
             stat = getattr(item, method_name)(*args, **kwargs)
@@ -86,7 +206,112 @@ class DamageDealerRegister(BaseStatRegister):
             except TypeError:
                 if expl is None:
                     expl = stat.explosive
-        total = (em or 0) + (therm or 0) + (kin or 0) + (expl or 0)
-        if total == 0 and em is None and therm is None and kin is None and expl is None:
-            total = None
-        return DamageTypesTotal(em=em, thermal=therm, kinetic=kin, explosive=expl, total=total)
+        return _make_damage_total(em, therm, kin, expl)
+
+
+class DamageAggregate:
+    """
+    Sum of damage stats of items which pass item filter, which
+    is maintained incrementally. Contribution of each item is
+    stored; when any of inputs of contribution changes, volatile
+    manager lets aggregate know about it, and contribution is
+    recalculated when stats are requested next time.
+
+    Required arguments:
+    volatile_mgr -- volatile manager of fit
+    dealers -- iterable with damage dealers
+    item_filter -- function which is evaluated for each item;
+        if true, item's stats are taken into consideration. Can be None
+    method_name, args, kwargs -- method name, which will be called for
+        each item to request its damage stats, and arguments for it
+    """
+
+    def __init__(self, volatile_mgr, dealers, item_filter, method_name, args, kwargs):
+        self.__volatile_mgr = volatile_mgr
+        self.__item_filter = item_filter
+        self.__method_name = method_name
+        self.__args = args
+        self.__kwargs = kwargs
+        # Format: {dealer: stats}
+        self.__contributions = {}
+        # Dealers whose contributions have to be (re)calculated
+        self.__stale = set()
+        # Sums of damage types and amount of contributions
+        # which have corresponding damage type defined
+        # Format: [em, thermal, kinetic, explosive]
+        self.__sums = [0, 0, 0, 0]
+        self.__counts = [0, 0, 0, 0]
+        for dealer in dealers:
+            self.add_dealer(dealer)
+
+    def add_dealer(self, dealer):
+        item_filter = self.__item_filter
+        if item_filter is not None and not item_filter(dealer):
+            return
+        self.__stale.add(dealer)
+
+    def remove_dealer(self, dealer):
+        self.__stale.discard(dealer)
+        contribution = self.__contributions.pop(dealer, None)
+        if contribution is not None:
+            self.__apply(contribution, -1)
+
+    def get_stats(self):
+        """
+        Update contributions which have been changed,
+        and return aggregated stats.
+        """
+        stale = self.__stale
+        while stale:
+            dealer = stale.pop()
+            contribution = self.__contributions.pop(dealer, None)
+            if contribution is not None:
+                self.__apply(contribution, -1)
+            contribution, dependencies = track_volatile_calculation(
+                getattr(dealer, self.__method_name), *self.__args, **self.__kwargs)
+            self.__volatile_mgr._track_volatile_attr(self, dealer, dependencies | {dealer})
+            self.__contributions[dealer] = contribution
+            self.__apply(contribution, 1)
+        sums = self.__sums
+        counts = self.__counts
+        return _make_damage_total(*(sums[i] if counts[i] else None for i in range(4)))
+
+    def _discard_volatile_attr(self, dealer):
+        """Mark contribution of dealer as outdated."""
+        if dealer in self.__contributions:
+            self.__stale.add(dealer)
+
+    def __apply(self, contribution, sign):
+        sums = self.__sums
+        counts = self.__counts
+        for i, value in enumerate((
+            contribution.em, contribution.thermal,
+            contribution.kinetic, contribution.explosive
+        )):
+            if value is None:
+                continue
+            counts[i] += sign
+            # Start from exact zero when nothing contributes,
+            # to avoid accumulation of float errors
+            if counts[i] == 0:
+                sums[i] = 0
+            else:
+                sums[i] += sign * value
+
+
+def _add_damage(sums, stat):
+    """
+    Add damage stats to list with em, thermal, kinetic and
+    explosive sums, skipping damage types stats do not have.
+    """
+    for i, value in enumerate((stat.em, stat.thermal, stat.kinetic, stat.explosive)):
+        if value is None:
+            continue
+        sums[i] = value if sums[i] is None else sums[i] + value
+
+
+def _make_damage_total(em, therm, kin, expl):
+    total = (em or 0) + (therm or 0) + (kin or 0) + (expl or 0)
+    if total == 0 and em is None and therm is None and kin is None and expl is None:
+        total = None
+    return DamageTypesTotal(em=em, thermal=therm, kinetic=kin, explosive=expl, total=total)
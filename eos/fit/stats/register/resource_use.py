@@ -21,6 +21,7 @@
 
 from eos.const.eve import Attribute
 from eos.fit.item import Drone
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseStatRegister
 
 
@@ -29,29 +30,100 @@ class ResourceUseRegister(BaseStatRegister):
     Class which implements common functionality for all
     registers, which are used to calculate amount of
     resource used.
+
+    Resource use of each item is stored along with running
+    total. When resource use attribute of an item changes,
+    volatile manager lets register know about it, and only
+    use of this item is fetched again when total is requested
+    next time.
+
+    Required arguments:
+    fit -- fit, to which register is bound
+    usage_attr -- ID of attribute which stores resource use
     """
 
-    def __init__(self, usage_attr):
+    def __init__(self, fit, usage_attr):
+        self._fit = fit
         self.__usage_attr = usage_attr
         self.__resource_users = set()
+        # Format: {item: resource use}
+        self.__contributions = {}
+        # Items whose resource use has to be (re)fetched
+        self.__stale = set()
+        self.__total = 0
+        self.__generation = None
 
     def register_item(self, item):
         if self.__usage_attr not in item._eve_type.attributes:
             return
         self.__resource_users.add(item)
+        self.__stale.add(item)
 
     def unregister_item(self, item):
-        self.__resource_users.discard(item)
+        if item not in self.__resource_users:
+            return
+        self.__resource_users.remove(item)
+        self.__stale.discard(item)
+        self.__remove_contribution(item)
+
+    def __len__(self):
+        return len(self.__resource_users)
+
+    def _clear_contributions(self):
+        """Forget resource use of all the items."""
+        self.__contributions.clear()
+        self.__stale.update(self.__resource_users)
+        self.__total = 0
 
     def get_resource_use(self):
-        # Calculate resource consumption of all items on ship
-        return sum(h.attributes[self.__usage_attr] for h in self.__resource_users)
+        track_volatile_dependency(self)
+        volatile_mgr = self._fit._volatile_mgr
+        # Volatile manager forgets everything it tracked when its
+        # generation changes, thus all stored values are suspect
+        if volatile_mgr._generation != self.__generation:
+            self.__generation = volatile_mgr._generation
+            self._clear_contributions()
+        usage_attr = self.__usage_attr
+        stale = self.__stale
+        while stale:
+            item = stale.pop()
+            self.__remove_contribution(item)
+            contribution = item.attributes[usage_attr]
+            # Item itself is tracked as well, so that entry is removed
+            # from volatile manager when item leaves fit
+            volatile_mgr._track_volatile_attr(self, item, ((item, usage_attr), item))
+            self.__contributions[item] = contribution
+            self.__total += contribution
+        return self.__total
+
+    def _discard_volatile_attr(self, item):
+        """
+        Mark resource use of item as outdated. Total
+        itself is volatile data, which is removed from
+        everywhere it has been used.
+        """
+        if item not in self.__contributions:
+            return
+        self.__stale.add(item)
+        self._fit._volatile_mgr._invalidate(self)
+
+    def __remove_contribution(self, item):
+        try:
+            contribution = self.__contributions.pop(item)
+        except KeyError:
+            return
+        # Start from exact zero when nothing contributes,
+        # to avoid accumulation of float errors
+        if not self.__contributions:
+            self.__total = 0
+        else:
+            self.__total -= contribution
 
 
 class CpuUseRegister(ResourceUseRegister):
 
-    def __init__(self):
-        ResourceUseRegister.__init__(self, Attribute.cpu)
+    def __init__(self, fit):
+        ResourceUseRegister.__init__(self, fit, Attribute.cpu)
 
     def get_resource_use(self):
         return round(ResourceUseRegister.get_resource_use(self), 2)
@@ -59,8 +131,8 @@ class CpuUseRegister(ResourceUseRegister):
 
 class PowerGridUseRegister(ResourceUseRegister):
 
-    def __init__(self):
-        ResourceUseRegister.__init__(self, Attribute.power)
+    def __init__(self, fit):
+        ResourceUseRegister.__init__(self, fit, Attribute.power)
 
     def get_resource_use(self):
         return round(ResourceUseRegister.get_resource_use(self), 2)
@@ -68,8 +140,8 @@ class PowerGridUseRegister(ResourceUseRegister):
 
 class CalibrationUseRegister(ResourceUseRegister):
 
-    def __init__(self):
-        ResourceUseRegister.__init__(self, Attribute.upgrade_cost)
+    def __init__(self, fit):
+        ResourceUseRegister.__init__(self, fit, Attribute.upgrade_cost)
 
 
 class DroneBayVolumeUseRegister(ResourceUseRegister):
@@ -78,8 +150,8 @@ class DroneBayVolumeUseRegister(ResourceUseRegister):
     Only items of Drone class are tracked.
     """
 
-    def __init__(self):
-        ResourceUseRegister.__init__(self, Attribute.volume)
+    def __init__(self, fit):
+        ResourceUseRegister.__init__(self, fit, Attribute.volume)
 
     def register_item(self, item):
         if isinstance(item, Drone):
@@ -88,5 +160,5 @@ class DroneBayVolumeUseRegister(ResourceUseRegister):
 
 class DroneBandwidthUseRegister(ResourceUseRegister):
 
-    def __init__(self):
-        ResourceUseRegister.__init__(self, Attribute.drone_bandwidth_used)
+    def __init__(self, fit):
+        ResourceUseRegister.__init__(self, fit, Attribute.drone_bandwidth_used)
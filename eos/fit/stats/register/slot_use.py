@@ -21,6 +21,7 @@
 
 from eos.const.eos import Slot
 from eos.fit.item import Drone
+from eos.util.volatile_cache import track_volatile_dependency
 from .base import BaseStatRegister
 
 
@@ -42,6 +43,7 @@ class SlotUseRegister(BaseStatRegister):
         self.__slot_users.discard(item)
 
     def __len__(self):
+        track_volatile_dependency(self)
         return len(self.__slot_users)
 
 
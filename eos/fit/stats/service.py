@@ -23,10 +23,12 @@ import math
 
 from eos.const.eos import State
 from eos.const.eve import Attribute
+from eos.fit.ehp import get_ehp_matrix
 from eos.fit.messages import ItemAdded, ItemRemoved, ItemStateChanged, EnableServices, DisableServices
-from eos.fit.tuples import DamageTypes, TankingLayers, TankingLayersTotal
+from eos.fit.tuples import DamageTypes, StatSnapshot, TankingLayers, TankingLayersTotal
 from eos.util.pubsub import BaseSubscriber
-from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import InheritableVolatileMixin, VolatileProperty, track_volatile_dependency
 from .container import *
 from .register import *
 
@@ -46,15 +48,25 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         self.__enabled = False
         self._fit = fit
         # Initialize registers
-        cpu_reg = CpuUseRegister()
-        powergrid_reg = PowerGridUseRegister()
-        calibration_reg = CalibrationUseRegister()
-        dronebay_reg = DroneBayVolumeUseRegister()
-        drone_bandwidth_reg = DroneBandwidthUseRegister()
+        cpu_reg = CpuUseRegister(fit)
+        powergrid_reg = PowerGridUseRegister(fit)
+        calibration_reg = CalibrationUseRegister(fit)
+        dronebay_reg = DroneBayVolumeUseRegister(fit)
+        drone_bandwidth_reg = DroneBandwidthUseRegister(fit)
         turret_reg = TurretUseRegister(fit)
         launcher_reg = LauncherUseRegister(fit)
         launched_drone_reg = LaunchedDroneRegister(fit)
-        self._dd_reg = DamageDealerRegister()
+        capacitor_reg = CapacitorUseRegister()
+        self._dd_reg = DamageDealerRegister(fit)
+        # Registers which keep running totals of resource use
+        # Format: (register,)
+        self.__regs_resource = (
+            cpu_reg,
+            powergrid_reg,
+            calibration_reg,
+            dronebay_reg,
+            drone_bandwidth_reg
+        )
         # List of registers which do not rely on item state
         # Format: (register,)
         self.__regs_stateless = (
@@ -75,6 +87,9 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
                 powergrid_reg,
                 drone_bandwidth_reg,
                 launched_drone_reg
+            ),
+            State.active: (
+                capacitor_reg,
             )
         }
         # Initialize sub-containers
@@ -91,6 +106,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         self.turret_slots = ShipSlots(fit, turret_reg, Attribute.turret_slots_left)
         self.launcher_slots = ShipSlots(fit, launcher_reg, Attribute.launcher_slots_left)
         self.launched_drones = CharSlots(fit, launched_drone_reg, Attribute.max_active_drones)
+        self.capacitor = Capacitor(fit, capacitor_reg)
         self._volatile_containers = (
             self.cpu,
             self.powergrid,
@@ -104,7 +120,8 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
             self.subsystem_slots,
             self.turret_slots,
             self.launcher_slots,
-            self.launched_drones
+            self.launched_drones,
+            self.capacitor
         )
         fit._subscribe(self, self._handler_map.keys())
 
@@ -115,6 +132,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         total attributes. If fit has no ship or some data cannot be fetched,
         corresponding attribs will be set to None.
         """
+        track_volatile_dependency(FIT_COMPOSITION)
         ship_item = self._fit.ship
         try:
             hp_data = ship_item.hp
@@ -141,6 +159,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         If fit has no ship or some data cannot be fetched, corresponding attribs
         will be set to None.
         """
+        track_volatile_dependency(FIT_COMPOSITION)
         ship_item = self._fit.ship
         try:
             return ship_item.resistances
@@ -162,6 +181,15 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         except AttributeError:
             return TankingLayersTotal(hull=None, armor=None, shield=None, total=None)
 
+    def get_ehp_matrix(self, damage_profiles):
+        """
+        Same as get_ehp, but takes iterable with multiple damage profiles and
+        returns list with TankingLayersTotal per profile (see eos.fit.ehp). If
+        fit has no ship or some data cannot be fetched, corresponding values
+        will be set to None.
+        """
+        return get_ehp_matrix(self.hp, self.resistances, damage_profiles)
+
     @VolatileProperty
     def worst_case_ehp(self):
         """
@@ -169,6 +197,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         If fit has no ship or some data cannot be fetched, corresponding attribs
         will be set to None.
         """
+        track_volatile_dependency(FIT_COMPOSITION)
         ship_item = self._fit.ship
         try:
             return ship_item.worst_case_ehp
@@ -222,8 +251,52 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         )
         return dps
 
+    def get_volley_vs_target(self, target_data, item_filter=None, target_resistances=None):
+        """
+        Get volley of whole fit applied to targets.
+
+        Required arguments:
+        target_data -- TargetData with distance, transversal, signature
+        radius and velocity of targets; each of these can be number or
+        sequence of numbers, to get whole damage curve or grid in one
+        call (see eos.fit.application).
+
+        Optional arguments:
+        item_filter -- when iterating over fit item, this function is called.
+        If evaluated as True, this item is taken into consideration, else not.
+        If argument is None, all items 'pass filter'. By default None.
+        target_resistances -- resistance profile to calculate effective volley.
+        Profile should contain em, thermal, kinetic and explosive attributes as
+        numbers in range [0..1]. If None, 'raw' volley is calculated. By default None.
+
+        Return value:
+        Object with em, thermal, kinetic, explosive and total attributes,
+        which contain damage for each target.
+        """
+        return self._dd_reg._collect_damage_curves(
+            item_filter,
+            'get_volley_vs_target',
+            target_data,
+            target_resistances=target_resistances
+        )
+
+    def get_dps_vs_target(self, target_data, item_filter=None, target_resistances=None, reload=False):
+        """
+        Same as get_volley_vs_target, but returns damage per second.
+        Takes additional reload argument, which tells if reload should
+        be taken into consideration. By default False.
+        """
+        return self._dd_reg._collect_damage_curves(
+            item_filter,
+            'get_dps_vs_target',
+            target_data,
+            target_resistances=target_resistances,
+            reload=reload
+        )
+
     @VolatileProperty
     def agility_factor(self):
+        track_volatile_dependency(FIT_COMPOSITION)
         ship_item = self._fit.ship
         try:
             ship_attribs = ship_item.attributes
@@ -244,12 +317,57 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         except TypeError:
             return None
 
+    def snapshot(self):
+        """
+        Collect standard set of fit stats at once: ship hp, resistances
+        and worst case EHP, use and output of ship resources, use and
+        amount of slots, nominal volley and dps, agility and capacitor
+        stats. Volley and dps of all damage dealers are fetched in
+        single pass over them.
+
+        Return value:
+        StatSnapshot with flat fields, which contain numbers (or None
+        where stat cannot be calculated) and can be pickled.
+        """
+        values = []
+        hp = self.hp
+        values.extend((hp.hull, hp.armor, hp.shield, hp.total))
+        resistances = self.resistances
+        for layer in (resistances.hull, resistances.armor, resistances.shield):
+            values.extend((layer.em, layer.thermal, layer.kinetic, layer.explosive))
+        worst_case_ehp = self.worst_case_ehp
+        values.extend((worst_case_ehp.hull, worst_case_ehp.armor, worst_case_ehp.shield, worst_case_ehp.total))
+        for resource in (self.cpu, self.powergrid, self.calibration, self.dronebay, self.drone_bandwidth):
+            values.append(resource.used)
+            values.append(resource.output)
+        for slots in (
+            self.high_slots, self.med_slots, self.low_slots, self.rig_slots,
+            self.subsystem_slots, self.turret_slots, self.launcher_slots,
+            self.launched_drones
+        ):
+            values.append(slots.used)
+            values.append(slots.total)
+        for damage in self._dd_reg._collect_nominal_damage():
+            values.extend((damage.em, damage.thermal, damage.kinetic, damage.explosive, damage.total))
+        values.append(self.agility_factor)
+        values.append(self.align_time)
+        capacitor = self.capacitor
+        values.append(capacitor.capacity)
+        values.append(capacitor.recharge_time)
+        values.append(capacitor.stable)
+        values.append(capacitor.stable_level)
+        values.append(capacitor.depletion_time)
+        return StatSnapshot(*values)
+
     def _clear_volatile_attrs(self):
         """
         Clear volatile cache for self and all child objects.
         """
         for container in self._volatile_containers:
             container._clear_volatile_attrs()
+        self._dd_reg._clear_aggregates()
+        for register in self.__regs_resource:
+            register._clear_contributions()
         InheritableVolatileMixin._clear_volatile_attrs(self)
 
     # Message handling
@@ -309,7 +427,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
     # Private methods for message handlers
     def __add_item(self, item):
         for register in self.__regs_stateless:
-            register.register_item(item)
+            self.__register_item(register, item)
         states = set(filter(lambda s: s <= item.state, State))
         self.__enable_states(item, states)
 
@@ -317,7 +435,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
         states = set(filter(lambda s: s <= item.state, State))
         self.__disable_states(item, states)
         for register in self.__regs_stateless:
-            register.unregister_item(item)
+            self.__unregister_item(register, item)
 
     def __enable_states(self, item, states):
         """
@@ -336,7 +454,7 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
             except KeyError:
                 continue
             for register in registers:
-                register.register_item(item)
+                self.__register_item(register, item)
 
     def __disable_states(self, item, states):
         """
@@ -353,4 +471,27 @@ class StatService(InheritableVolatileMixin, BaseSubscriber):
             except KeyError:
                 continue
             for register in registers:
-                register.unregister_item(item)
+                self.__unregister_item(register, item)
+
+    def __register_item(self, register, item):
+        size = len(register)
+        register.register_item(item)
+        if len(register) != size:
+            self.__invalidate_register(register)
+
+    def __unregister_item(self, register, item):
+        size = len(register)
+        register.unregister_item(item)
+        if len(register) != size:
+            self.__invalidate_register(register)
+
+    def __invalidate_register(self, register):
+        """
+        Remove volatile data calculated from contents of
+        passed register, as contents have been changed.
+        """
+        try:
+            volatile_mgr = self._fit._volatile_mgr
+        except AttributeError:
+            return
+        volatile_mgr._invalidate(register)
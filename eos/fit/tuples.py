@@ -21,8 +21,46 @@
 
 from collections import namedtuple
 
+from eos.const.eos import State
+
 
 TankingLayers = namedtuple('TankingLayers', ('hull', 'armor', 'shield'))
 TankingLayersTotal = namedtuple('TankingLayersTotal', ('hull', 'armor', 'shield', 'total'))
 DamageTypes = namedtuple('DamageTypes', ('em', 'thermal', 'kinetic', 'explosive'))
 DamageTypesTotal = namedtuple('DamageTypesTotal', ('em', 'thermal', 'kinetic', 'explosive', 'total'))
+TargetData = namedtuple('TargetData', ('distance', 'transversal', 'signature_radius', 'velocity'))
+CapacitorDrain = namedtuple('CapacitorDrain', ('amount', 'period'))
+CapacitorState = namedtuple('CapacitorState', ('stable', 'stable_level', 'depletion_time'))
+AttributeExport = namedtuple('AttributeExport', ('items', 'data'))
+AttributeColumns = namedtuple('AttributeColumns', ('item_index', 'type_id', 'attr_id', 'value'))
+StatSnapshot = namedtuple('StatSnapshot', (
+    'hp_hull', 'hp_armor', 'hp_shield', 'hp_total',
+    'resist_hull_em', 'resist_hull_thermal', 'resist_hull_kinetic', 'resist_hull_explosive',
+    'resist_armor_em', 'resist_armor_thermal', 'resist_armor_kinetic', 'resist_armor_explosive',
+    'resist_shield_em', 'resist_shield_thermal', 'resist_shield_kinetic', 'resist_shield_explosive',
+    'worst_case_ehp_hull', 'worst_case_ehp_armor', 'worst_case_ehp_shield', 'worst_case_ehp_total',
+    'cpu_used', 'cpu_output', 'powergrid_used', 'powergrid_output',
+    'calibration_used', 'calibration_output', 'dronebay_used', 'dronebay_output',
+    'drone_bandwidth_used', 'drone_bandwidth_output',
+    'high_slots_used', 'high_slots_total', 'med_slots_used', 'med_slots_total',
+    'low_slots_used', 'low_slots_total', 'rig_slots_used', 'rig_slots_total',
+    'subsystem_slots_used', 'subsystem_slots_total', 'turret_slots_used', 'turret_slots_total',
+    'launcher_slots_used', 'launcher_slots_total', 'launched_drones_used', 'launched_drones_total',
+    'volley_em', 'volley_thermal', 'volley_kinetic', 'volley_explosive', 'volley_total',
+    'dps_em', 'dps_thermal', 'dps_kinetic', 'dps_explosive', 'dps_total',
+    'agility_factor', 'align_time',
+    'capacitor_capacity', 'capacitor_recharge_time', 'capacitor_stable',
+    'capacitor_stable_level', 'capacitor_depletion_time'
+))
+SkillProfileCheck = namedtuple('SkillProfileCheck', ('passed', 'missing'))
+ModuleSpec = namedtuple('ModuleSpec', ('type_id', 'state', 'charge'))
+DroneSpec = namedtuple('DroneSpec', ('type_id', 'state'))
+FitSpec = namedtuple('FitSpec', (
+    'ship', 'stance', 'high', 'med', 'low', 'rigs', 'subsystems',
+    'drones', 'implants', 'boosters', 'skills'
+))
+# Spec fields which are not specified are empty
+ModuleSpec.__new__.__defaults__ = (State.offline, None)
+DroneSpec.__new__.__defaults__ = (State.offline,)
+FitSpec.__new__.__defaults__ = (None, None, (), (), (), (), (), (), (), (), ())
+EftFit = namedtuple('EftFit', ('name', 'spec'))
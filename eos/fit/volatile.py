@@ -19,54 +19,137 @@
 # ===============================================================================
 
 
+from itertools import count
+
+from eos.util.keyed_set import KeyedSet
+from eos.util.volatile_cache import InheritableVolatileMixin, CooperativeVolatileMixin
 from .messages import (
     ItemAdded, ItemRemoved, ItemStateChanged, EffectsEnabled, EffectsDisabled,
-    AttrValueChangedOverride, RefreshSource
+    ItemPositionsChanged, AttrValueChanged, AttrValueChangedOverride, RefreshSource
 )
-from eos.util.volatile_cache import InheritableVolatileMixin, CooperativeVolatileMixin
+
+
+# Dependency key which stands for set of items assigned to fit,
+# including items in fit-level single-item containers (e.g. ship),
+# and for positions of items in ordered containers
+FIT_COMPOSITION = 'fit_composition'
+
+# Source of cache generations; shared between all fits, to make sure
+# that values cached on one fit are never considered valid on another
+_generations = count()
 
 
 class FitVolatileManager:
     """
-    Class which tracks on-fit objects with volatile
-    data and clears this data when requested.
+    Class which tracks volatile data on fit objects and
+    clears this data when its inputs change.
+
+    Volatile values report keys of data they were calculated
+    from to manager (see VolatileProperty). Following keys are
+    invalidated on fit changes:
+    item -- when item is added, removed, changes its state or
+        effect statuses, or when charge is loaded into item or
+        unloaded from it
+    (item, attribute ID) -- when value of item attribute changes
+    FIT_COMPOSITION -- when any item is added or removed, or when
+        items are shifted within ordered container
+    Other keys can be invalidated explicitly by services which
+    maintain corresponding data.
+
+    Source switch clears all volatile data. It is done by
+    switching to new cache generation: values stored under
+    older generations are ignored and recalculated when
+    they are requested, so it takes constant time regardless
+    of amount of objects on fit.
 
     Required arguments:
     msg_broker -- object which handles message publication
     and subscriptions
-
-    Optional arguments:
-    volatiles -- iterable with objects which carry volatile
-    attributes, which will be tracked permanently
     """
 
-    def __init__(self, msg_broker, volatiles=()):
+    def __init__(self, msg_broker):
         self.__msg_broker = msg_broker
-        self.__volatile_objects = set()
+        self._generation = next(_generations)
+        self.__reset_dependencies()
         msg_broker._subscribe(self, self._handler_map.keys())
-        for volatile in volatiles:
-            self.__add_volatile_object(volatile)
+
+    def _track_volatile_attr(self, volatile, name, dependencies):
+        """
+        Remember which data cached volatile value relies on.
+        When any of dependencies changes, _discard_volatile_attr()
+        method of object which carries value is called.
+
+        Required arguments:
+        volatile -- object which carries cached value
+        name -- name of volatile attribute, or any other
+            hashable object which identifies value on carrier
+        dependencies -- iterable with keys of data value
+            has been calculated from
+        """
+        entry = (volatile, name)
+        self.__untrack(entry)
+        self.__dependencies[entry] = dependencies
+        for key in dependencies:
+            self.__dependents.add_data(key, entry)
+        self.__tracked_attrs.add_data(volatile, name)
+
+    def _invalidate(self, key):
+        """
+        Remove all cached volatile values which rely
+        on data identified by passed key.
+        """
+        entries = self.__dependents.get(key)
+        if not entries:
+            return
+        for entry in tuple(entries):
+            self.__untrack(entry)
+            volatile, name = entry
+            volatile._discard_volatile_attr(name)
+
+    def _reset(self):
+        """
+        Remove all cached volatile values by switching
+        to new cache generation.
+        """
+        self._generation = next(_generations)
+        self.__reset_dependencies()
 
     # Message handling
     def _handle_item_addition(self, message):
-        self.__add_volatile_object(message.item)
-        self.__clear_volatile_attrs()
+        # Values cached on item before it has been added are
+        # stored under different generation, thus they're
+        # not used
+        self.__invalidate_item(message.item)
+        self._invalidate(FIT_COMPOSITION)
 
     def _handle_item_removal(self, message):
-        self.__clear_volatile_attrs()
-        self.__remove_volatile_object(message.item)
+        item = message.item
+        self.__invalidate_item(item)
+        self._invalidate(FIT_COMPOSITION)
+        self.__clear_item_data(item)
+
+    def _handle_item_changes(self, message):
+        self.__invalidate_item(message.item)
+
+    def _handle_item_positions_change(self, _):
+        self._invalidate(FIT_COMPOSITION)
+
+    def _handle_attr_changes(self, message):
+        self._invalidate((message.item, message.attr))
 
-    def _handle_other_changes(self, _):
-        self.__clear_volatile_attrs()
+    def _handle_source_refresh(self, _):
+        self._reset()
 
     _handler_map = {
         ItemAdded: _handle_item_addition,
         ItemRemoved: _handle_item_removal,
-        ItemStateChanged: _handle_other_changes,
-        EffectsEnabled: _handle_other_changes,
-        EffectsDisabled: _handle_other_changes,
-        AttrValueChangedOverride: _handle_other_changes,
-        RefreshSource: _handle_other_changes
+        ItemStateChanged: _handle_item_changes,
+        EffectsEnabled: _handle_item_changes,
+        EffectsDisabled: _handle_item_changes,
+        ItemPositionsChanged: _handle_item_positions_change,
+        AttrValueChanged: _handle_attr_changes,
+        AttrValueChangedOverride: _handle_attr_changes,
+        RefreshSource: _handle_source_refresh
     }
 
     def _notify(self, message):
@@ -77,24 +160,37 @@ class FitVolatileManager:
         handler(self, message)
 
     # Private methods for message handlers
-    def __add_volatile_object(self, object):
+    def __clear_item_data(self, item):
         """
-        Add passed object to internal storage in case it
-        carries any volatile attributes.
+        Remove volatile data stored on passed item, as item
+        can be changed while it is not attached to fit.
         """
-        if isinstance(object, (InheritableVolatileMixin, CooperativeVolatileMixin)):
-            self.__volatile_objects.add(object)
+        if not isinstance(item, (InheritableVolatileMixin, CooperativeVolatileMixin)):
+            return
+        for name in tuple(self.__tracked_attrs.get(item, ())):
+            self.__untrack((item, name))
+        item._clear_volatile_attrs()
 
-    def __remove_volatile_object(self, object):
-        """
-        Remove passed object from internal storage
-        """
-        self.__volatile_objects.discard(object)
+    def __invalidate_item(self, item):
+        self._invalidate(item)
+        # Charge is considered as part of item it's loaded into
+        container = getattr(item, 'container', None)
+        if container is not None:
+            self._invalidate(container)
 
-    def __clear_volatile_attrs(self):
-        """
-        Go through objects in internal storage and clear
-        volatile attribs stored on them.
-        """
-        for volatile in self.__volatile_objects:
-            volatile._clear_volatile_attrs()
+    def __untrack(self, entry):
+        dependencies = self.__dependencies.pop(entry, None)
+        if dependencies is None:
+            return
+        for key in dependencies:
+            self.__dependents.rm_data(key, entry)
+        volatile, name = entry
+        self.__tracked_attrs.rm_data(volatile, name)
+
+    def __reset_dependencies(self):
+        # Format: {dependency key: {(object, attribute name)}}
+        self.__dependents = KeyedSet()
+        # Format: {(object, attribute name): dependency keys}
+        self.__dependencies = {}
+        # Format: {object: {attribute names}}
+        self.__tracked_attrs = KeyedSet()
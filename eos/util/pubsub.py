@@ -72,6 +72,8 @@ class BaseSubscriber(metaclass=ABCMeta):
     implement methods all subscribers should have.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def _notify(self, message):
         ...
@@ -19,11 +19,76 @@
 # ===============================================================================
 
 
+# Stack of sets, each collecting keys of data read by volatile
+# property which is being calculated at the moment
+_dependency_frames = []
+
+# Marker for values which have never been calculated
+_NO_GENERATION = object()
+
+
+def track_volatile_dependency(key):
+    """
+    Let volatile property which is currently being calculated
+    know that it relies on data identified by passed key. Does
+    nothing when no volatile property is being calculated.
+
+    Required arguments:
+    key -- hashable object which identifies piece of data
+    """
+    if _dependency_frames:
+        _dependency_frames[-1].add(key)
+
+
+def track_volatile_calculation(method, *args, **kwargs):
+    """
+    Call passed function, collecting keys of all the data it
+    reads. Keys are passed further to volatile property which
+    is currently being calculated, if any.
+
+    Required arguments:
+    method -- function to call
+    args, kwargs -- arguments to pass to function
+
+    Return value:
+    Tuple with value returned by function and frozenset with
+    dependency keys
+    """
+    frame = set()
+    _dependency_frames.append(frame)
+    try:
+        value = method(*args, **kwargs)
+    finally:
+        _dependency_frames.pop()
+    dependencies = frozenset(frame)
+    if _dependency_frames:
+        _dependency_frames[-1].update(dependencies)
+    return value, dependencies
+
+
+def volatile_calculation_active():
+    """Return True if volatile property is being calculated."""
+    return bool(_dependency_frames)
+
+
 class VolatileProperty:
     """
-    Caches attribute on instance and adds note
-    about it to special set, which should be added
-    by VolatileMixin.
+    Caches value returned by decorated method in special
+    dictionary on instance, which should be added by
+    VolatileMixin. Cached value is returned until cache
+    is cleared, or until generation of volatile manager of
+    fit instance belongs to changes - this way all volatile
+    data on fit can be discarded at once, without visiting
+    every object which carries it.
+
+    While value is calculated, keys of all the data it reads
+    are collected (see track_volatile_dependency()); instance
+    itself is always considered as dependency. Collected keys
+    are stored along with value and are passed to volatile
+    manager of fit instance belongs to, which allows to remove
+    only values whose inputs have changed. When cached value is
+    used to calculate other volatile value, its dependencies
+    are added to dependencies of that value.
     """
 
     def __init__(self, method):
@@ -32,10 +97,35 @@ class VolatileProperty:
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self.__method(instance)
         name = self.__method.__name__
-        setattr(instance, name, value)
-        instance._volatile_attrs.add(name)
+        volatile_attrs = instance._volatile_attrs
+        # Objects which are not attached to fit have
+        # no generation, their values are valid until
+        # cache is cleared explicitly
+        try:
+            volatile_mgr = instance._fit._volatile_mgr
+        except AttributeError:
+            volatile_mgr = None
+            generation = None
+        else:
+            generation = volatile_mgr._generation
+        try:
+            value, dependencies, value_generation = volatile_attrs[name]
+        except KeyError:
+            value_generation = _NO_GENERATION
+        if value_generation != generation:
+            frame = {instance}
+            _dependency_frames.append(frame)
+            try:
+                value = self.__method(instance)
+            finally:
+                _dependency_frames.pop()
+            dependencies = frozenset(frame)
+            volatile_attrs[name] = (value, dependencies, generation)
+            if volatile_mgr is not None:
+                volatile_mgr._track_volatile_attr(instance, name, dependencies)
+        if _dependency_frames:
+            _dependency_frames[-1].update(dependencies)
         return value
 
 
@@ -47,57 +137,55 @@ class InheritableVolatileMixin:
     inheritance trees.
     """
 
+    __slots__ = ('_volatile_attrs',)
+
     def __init__(self):
-        self._volatile_attrs = set()
+        # Format: {attribute name: (value, dependency keys, generation)}
+        self._volatile_attrs = {}
 
     def _clear_volatile_attrs(self):
         """
         Remove all the cached values which were
         stored since the last cleanup.
         """
-        for attr_name in self._volatile_attrs:
-            try:
-                delattr(self, attr_name)
-            except AttributeError:
-                pass
         self._volatile_attrs.clear()
 
+    def _discard_volatile_attr(self, name):
+        """Remove cached value of single volatile attribute."""
+        self._volatile_attrs.pop(name, None)
+
 
 class CooperativeVolatileMixin:
     """
     Should be added as base class for all
     classes using volatileproperty on them.
     This mixin is to be used in cooperative
-    classes (see super() docs).
+    classes (see super() docs). Mixin does not
+    define slot for cache storage, to be usable
+    in classes with multiple mixins; when used
+    with slotted classes, one of them has to
+    define _volatile_attrs slot.
 
     Cooperative methods:
     __init__
-    _clear_volatile_attrs
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
-        self._volatile_attrs = set()
+        # Format: {attribute name: (value, dependency keys, generation)}
+        self._volatile_attrs = {}
         super().__init__(**kwargs)
 
     def _clear_volatile_attrs(self):
         """
         Remove all the cached values which were
-        stored since the last cleanup.
-
-        Attempt to call next method in MRO, do nothing
-        on failure to find it.
+        stored since the last cleanup. All classes
+        in hierarchy share the same storage, thus
+        there is no need to pass call further.
         """
-        for attr_name in self._volatile_attrs:
-            try:
-                delattr(self, attr_name)
-            except AttributeError:
-                pass
         self._volatile_attrs.clear()
-        # Attempt to call next implementation
-        next_in_mro = super()
-        try:
-            method = next_in_mro._clear_volatile_attrs
-        except AttributeError:
-            pass
-        else:
-            method()
+
+    def _discard_volatile_attr(self, name):
+        """Remove cached value of single volatile attribute."""
+        self._volatile_attrs.pop(name, None)
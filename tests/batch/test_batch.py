@@ -0,0 +1,165 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import os
+
+from eos.batch import BatchError, evaluate
+from eos.const.eos import Restriction, State
+from eos.const.eve import Attribute, Type
+from eos.data.source import Source
+from eos.fit.tuples import FitSpec, ModuleSpec
+from tests.environment import CacheHandler
+from tests.eos_testcase import EosTestCase
+
+
+def make_source():
+    cache_handler = CacheHandler()
+    cache_handler.attribute(attribute_id=Attribute.hi_slots)
+    cache_handler.type(type_id=Type.character_static)
+    cache_handler.type(type_id=1, attributes={Attribute.hi_slots: 1})
+    cache_handler.type(type_id=2)
+    return Source('test', cache_handler)
+
+
+def make_source_broken():
+    raise ValueError('no data')
+
+
+def make_source_crash():
+    os._exit(1)
+
+
+def count_high(fit):
+    return len(fit.modules.high)
+
+
+def count_high_or_crash(fit):
+    # Ship of type 2 kills worker process
+    if fit.ship._eve_type_id == 2:
+        os._exit(1)
+    return len(fit.modules.high)
+
+
+class TestBatch(EosTestCase):
+
+    def make_specs(self, amount):
+        return [FitSpec(ship=1, high=(ModuleSpec(2),) * (i % 3)) for i in range(amount)]
+
+    def test_order(self):
+        specs = self.make_specs(10)
+        # Action
+        results = list(evaluate(
+            iter(specs), validate=False, extract=count_high, workers=0,
+            source_factory=make_source, chunk_size=3))
+        # Verification
+        self.assertEqual([r.index for r in results], list(range(10)))
+        self.assertEqual([r.data for r in results], [i % 3 for i in range(10)])
+        for result in results:
+            self.assertIsNone(result.valid)
+            self.assertIsNone(result.violations)
+            self.assertIsNone(result.stats)
+            self.assertIsNone(result.error)
+
+    def test_violations(self):
+        specs = [FitSpec(ship=1, high=(ModuleSpec(2), ModuleSpec(2)))]
+        # Action
+        result, = evaluate(
+            specs, skip_checks=(Restriction.item_class,), workers=0, source_factory=make_source)
+        # Verification
+        self.assertIs(result.valid, False)
+        self.assertEqual(set(result.violations), {('high', 1)})
+        self.assertEqual(set(result.violations[('high', 1)]), {Restriction.high_slot})
+
+    def test_stats(self):
+        specs = [FitSpec(ship=1, high=(ModuleSpec(2, State.online),))]
+        # Action
+        result, = evaluate(specs, validate=False, stats=True, workers=0, source_factory=make_source)
+        # Verification
+        self.assertEqual(result.stats.high_slots_used, 1)
+        self.assertEqual(result.stats.high_slots_total, 1)
+
+    def test_error(self):
+        specs = self.make_specs(3)
+        specs[1] = FitSpec(ship=1000)
+        # Action
+        results = list(evaluate(specs, workers=0, source_factory=make_source))
+        # Verification
+        self.assertIsNone(results[0].error)
+        self.assertIsNotNone(results[1].error)
+        self.assertIsNone(results[1].valid)
+        self.assertIsNone(results[2].error)
+
+    def test_progress(self):
+        progress = []
+        # Action
+        list(evaluate(
+            self.make_specs(5), validate=False, workers=0, source_factory=make_source,
+            chunk_size=2, progress=progress.append))
+        # Verification
+        self.assertEqual([p.done for p in progress], [2, 4, 5])
+        self.assertEqual(progress[-1].failed, 0)
+
+    def test_workers(self):
+        specs = self.make_specs(20)
+        # Action
+        results = list(evaluate(
+            specs, extract=count_high, workers=2, source_factory=make_source, chunk_size=3))
+        # Verification
+        self.assertEqual([r.index for r in results], list(range(20)))
+        self.assertEqual([r.data for r in results], [i % 3 for i in range(20)])
+        self.assertEqual([r.error for r in results], [None] * 20)
+
+    def test_worker_crash(self):
+        specs = self.make_specs(12)
+        specs[7] = FitSpec(ship=2)
+        progress = []
+        # Action
+        results = list(evaluate(
+            specs, validate=False, extract=count_high_or_crash, workers=2,
+            source_factory=make_source, chunk_size=3, progress=progress.append))
+        # Verification
+        self.assertEqual([r.index for r in results], list(range(12)))
+        failed = [r for r in results if r.error is not None]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].index, 7)
+        self.assertIsNone(failed[0].data)
+        expected = [i % 3 for i in range(12)]
+        expected[7] = None
+        self.assertEqual([r.data for r in results], expected)
+        self.assertEqual(progress[-1].done, 12)
+        self.assertEqual(progress[-1].failed, 1)
+
+    def test_source_factory_error(self):
+        for workers in (0, 2):
+            results = evaluate(
+                self.make_specs(12), workers=workers, source_factory=make_source_broken, chunk_size=4)
+            # Action
+            with self.assertRaises(BatchError) as cm:
+                list(results)
+            # Verification
+            self.assertIn('ValueError: no data', cm.exception.args[0])
+
+    def test_worker_start_failure(self):
+        # Pool which breaks right away should not be blamed on specs
+        results = evaluate(
+            self.make_specs(12), workers=2, source_factory=make_source_crash, chunk_size=4)
+        with self.assertRaises(BatchError):
+            list(results)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Measure memory consumed by fit object model. Script builds
+fits with synthetic data (character with full set of skills,
+ship, charged modules, drones), calculates all attributes on
+all items and reports amount of memory taken per fit.
+"""
+
+
+import argparse
+import gc
+import os.path
+import sys
+import tracemalloc
+
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# As script is in subdirectory, add root dir to python syspath
+sys.path.insert(0, os.path.abspath(os.path.join(script_dir, '..', '..')))
+
+
+from eos.const.eos import State
+from eos.const.eve import Type
+from eos.data.source import Source
+from eos.fit import Fit
+from eos.fit.item import Charge, Drone, ModuleHigh, ModuleLow, ModuleMed, Ship, Skill
+from tests.environment import CacheHandler
+
+
+ATTR_AMOUNT = 20
+SKILL_ID_OFFSET = 10000
+
+
+def make_source(skill_amount):
+    cache_handler = CacheHandler()
+    for attr_id in range(1, ATTR_AMOUNT + 1):
+        cache_handler.attribute(attribute_id=attr_id)
+    attributes = {attr_id: float(attr_id) for attr_id in range(1, ATTR_AMOUNT + 1)}
+    cache_handler.type(type_id=Type.character_static, attributes=attributes)
+    for type_id in range(1, 6):
+        cache_handler.type(type_id=type_id, attributes=attributes)
+    for type_id in range(SKILL_ID_OFFSET, SKILL_ID_OFFSET + skill_amount):
+        cache_handler.type(type_id=type_id, attributes=attributes)
+    return Source('benchmark', cache_handler)
+
+
+def make_fit(source, skill_amount):
+    fit = Fit(source=source)
+    fit.ship = Ship(1)
+    for type_id in range(SKILL_ID_OFFSET, SKILL_ID_OFFSET + skill_amount):
+        fit.skills.add(Skill(type_id, level=5))
+    for _ in range(8):
+        fit.modules.high.append(ModuleHigh(2, state=State.active, charge=Charge(3)))
+        fit.modules.med.append(ModuleMed(2, state=State.active))
+        fit.modules.low.append(ModuleLow(2, state=State.online))
+    for _ in range(5):
+        fit.drones.add(Drone(4, state=State.active))
+    return fit
+
+
+def calculate_all(fit):
+    items = [fit.character, fit.ship]
+    items.extend(fit.skills)
+    items.extend(fit.modules.items())
+    items.extend(module.charge for module in fit.modules.high)
+    items.extend(fit.drones)
+    for item in items:
+        for attr_id in range(1, ATTR_AMOUNT + 1):
+            item.attributes[attr_id]
+
+
+def measure(fit_amount, skill_amount):
+    source = make_source(skill_amount)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fits = []
+    for _ in range(fit_amount):
+        fit = make_fit(source, skill_amount)
+        calculate_all(fit)
+        fits.append(fit)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / fit_amount
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Measure memory taken by fits')
+    parser.add_argument('--fits', type=int, default=20, help='amount of fits to build')
+    parser.add_argument('--skills', type=int, default=400, help='amount of skills per fit')
+    args = parser.parse_args()
+    bytes_per_fit = measure(args.fits, args.skills)
+    print('{} fits, {} skills each: {:.0f} bytes per fit'.format(args.fits, args.skills, bytes_per_fit))
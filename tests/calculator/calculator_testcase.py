@@ -39,6 +39,7 @@ class CalculatorTestCase(EosTestCase):
     def assert_calculator_buffers_empty(self, fit):
         entry_num = self._get_object_buffer_entry_amount(fit._calculator._CalculationService__affections)
         entry_num += len(fit._calculator._CalculationService__subscribed_affectors)
+        entry_num += len(fit._calculator._CalculationService__attr_dependent_affectors)
         if entry_num > 0:
             plu = 'y' if entry_num == 1 else 'ies'
             msg = '{} entr{} in buffers: buffers must be empty'.format(entry_num, plu)
@@ -0,0 +1,108 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State, ModifierTargetFilter, ModifierDomain, ModifierOperator
+from eos.const.eve import EffectCategory
+from eos.data.cache_object.modifier import DogmaModifier
+from tests.calculator.calculator_testcase import CalculatorTestCase
+from tests.calculator.environment import IndependentItem
+
+
+class TestGetMany(CalculatorTestCase):
+    """Test bulk attribute fetching"""
+
+    def setUp(self):
+        super().setUp()
+        self.src_attr = self.ch.attribute(attribute_id=1)
+        self.tgt_attr1 = self.ch.attribute(attribute_id=2)
+        self.tgt_attr2 = self.ch.attribute(attribute_id=3)
+        self.plain_attr = self.ch.attribute(attribute_id=4)
+        modifiers = []
+        for tgt_attr in (self.tgt_attr1, self.tgt_attr2):
+            modifier = DogmaModifier()
+            modifier.state = State.offline
+            modifier.tgt_filter = ModifierTargetFilter.item
+            modifier.tgt_domain = ModifierDomain.self
+            modifier.tgt_attr = tgt_attr.id
+            modifier.operator = ModifierOperator.post_mul
+            modifier.src_attr = self.src_attr.id
+            modifiers.append(modifier)
+        effect = self.ch.effect(effect_id=1, category=EffectCategory.passive)
+        effect.modifiers = tuple(modifiers)
+        self.item = IndependentItem(self.ch.type(type_id=1, effects=(effect,), attributes={
+            self.src_attr.id: 2, self.tgt_attr1.id: 10, self.tgt_attr2.id: 20, self.plain_attr.id: 50
+        }))
+
+    def test_values(self):
+        self.fit.items.add(self.item)
+        # Action
+        values = self.item.attributes.get_many((self.tgt_attr1.id, self.tgt_attr2.id, self.plain_attr.id))
+        # Verification
+        self.assertEqual(len(values), 3)
+        self.assertAlmostEqual(values[self.tgt_attr1.id], 20)
+        self.assertAlmostEqual(values[self.tgt_attr2.id], 40)
+        self.assertAlmostEqual(values[self.plain_attr.id], 50)
+        # Values should be stored as if they were fetched one by one
+        self.assertAlmostEqual(self.item.attributes._MutableAttributeMap__modified_attributes[self.tgt_attr1.id], 20)
+        # Cleanup
+        self.fit.items.remove(self.item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_override_and_stored(self):
+        self.fit.items.add(self.item)
+        self.item.attributes._override_set(self.tgt_attr1.id, 100)
+        self.item.attributes._MutableAttributeMap__modified_attributes[self.plain_attr.id] = 60
+        # Action
+        values = self.item.attributes.get_many((self.tgt_attr1.id, self.plain_attr.id))
+        # Verification
+        self.assertEqual(values, {self.tgt_attr1.id: 100, self.plain_attr.id: 60})
+        # Cleanup
+        self.fit.items.remove(self.item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_modification_change(self):
+        self.fit.items.add(self.item)
+        self.item.attributes.get_many((self.tgt_attr1.id, self.tgt_attr2.id))
+        # Action
+        self.item.attributes._override_set(self.src_attr.id, 3)
+        values = self.item.attributes.get_many((self.tgt_attr1.id, self.tgt_attr2.id))
+        # Verification
+        self.assertAlmostEqual(values[self.tgt_attr1.id], 30)
+        self.assertAlmostEqual(values[self.tgt_attr2.id], 60)
+        # Cleanup
+        self.fit.items.remove(self.item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_unavailable(self):
+        self.fit.items.add(self.item)
+        # Action
+        values = self.item.attributes.get_many((self.plain_attr.id, 1008))
+        # Verification
+        self.assertEqual(values, {self.plain_attr.id: 50})
+        # Cleanup
+        self.fit.items.remove(self.item)
+        # Attempt to fetch non-existent attribute generates
+        # error, which is not related to this test
+        self.assertEqual(len(self.log), 1)
+        self.assert_calculator_buffers_empty(self.fit)
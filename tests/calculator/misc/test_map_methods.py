@@ -85,3 +85,27 @@ class TestMapMethods(CalculatorTestCase):
         self.fit.items.remove(self.item)
         self.assertEqual(len(self.log), 0)
         self.assert_calculator_buffers_empty(self.fit)
+
+    def test_keys_refresh(self):
+        # Cached keys should be refreshed when attribute
+        # which was not known before is calculated
+        attr4 = self.ch.attribute(attribute_id=4, default_value=100)
+        self.assertCountEqual(self.item.attributes.keys(), (self.attr1.id, self.attr2.id, self.attr3.id))
+        self.assertEqual(self.item.attributes[attr4.id], 100)
+        self.assertCountEqual(
+            self.item.attributes.keys(), (self.attr1.id, self.attr2.id, self.attr3.id, attr4.id))
+        self.assertEqual(len(self.item.attributes), 4)
+        self.assertTrue(attr4.id in self.item.attributes)
+        self.fit.items.remove(self.item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_keys_override(self):
+        self.assertCountEqual(self.item.attributes.keys(), (self.attr1.id, self.attr2.id, self.attr3.id))
+        self.item.attributes._override_set(1008, 5)
+        self.assertCountEqual(self.item.attributes.keys(), (self.attr1.id, self.attr2.id, self.attr3.id, 1008))
+        self.item.attributes._override_del(1008)
+        self.assertCountEqual(self.item.attributes.keys(), (self.attr1.id, self.attr2.id, self.attr3.id))
+        self.fit.items.remove(self.item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_calculator_buffers_empty(self.fit)
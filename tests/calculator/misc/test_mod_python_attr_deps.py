@@ -0,0 +1,156 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+
+from eos.const.eos import State, ModifierTargetFilter, ModifierDomain, ModifierOperator
+from eos.const.eve import EffectCategory
+from eos.data.cache_object.modifier import DogmaModifier, ModificationCalculationError
+from eos.data.cache_object.modifier.python import BasePythonModifier
+from tests.calculator.calculator_testcase import CalculatorTestCase
+from tests.calculator.environment import IndependentItem
+
+
+class TestModifierPythonAttrDependencies(CalculatorTestCase):
+    """Python modifiers which declare attributes they depend on."""
+
+    def setUp(self):
+        super().setUp()
+        self.attr1 = attr1 = self.ch.attribute(attribute_id=1)
+        self.attr2 = attr2 = self.ch.attribute(attribute_id=2)
+        self.attr3 = attr3 = self.ch.attribute(attribute_id=3)
+        self.calls = calls = []
+
+        class TestPythonModifier(BasePythonModifier):
+
+            def __init__(self):
+                BasePythonModifier.__init__(
+                    self, state=State.online, tgt_filter=ModifierTargetFilter.item,
+                    tgt_domain=ModifierDomain.self, tgt_filter_extra_arg=None,
+                    tgt_attr=attr1.id
+                )
+
+            def get_modification(self, carrier_item, fit):
+                calls.append(carrier_item)
+                try:
+                    carrier_mul = carrier_item.attributes[attr2.id]
+                    ship_mul = fit.ship.attributes[attr3.id]
+                except (AttributeError, KeyError) as e:
+                    raise ModificationCalculationError from e
+                return ModifierOperator.post_mul, carrier_mul * ship_mul
+
+            @property
+            def revise_attrs(self):
+                return ((ModifierDomain.self, attr2.id), (ModifierDomain.ship, attr3.id))
+
+        python_effect = self.ch.effect(
+            effect_id=1, category=EffectCategory.online, modifiers=(TestPythonModifier(),)
+        )
+        self.ship_type = self.ch.type(type_id=1, attributes={attr3.id: 3})
+        self.fit.ship = IndependentItem(self.ship_type)
+        self.eve_type = self.ch.type(type_id=2, effects=(python_effect,), attributes={attr1.id: 100, attr2.id: 2})
+        self.item = IndependentItem(self.eve_type)
+
+    def test_carrier_attr_change(self):
+        attr4 = self.ch.attribute(attribute_id=4)
+        dogma_modifier = DogmaModifier(
+            state=State.active,
+            tgt_filter=ModifierTargetFilter.item,
+            tgt_domain=ModifierDomain.self,
+            tgt_attr=self.attr2.id,
+            operator=ModifierOperator.post_mul,
+            src_attr=attr4.id
+        )
+        dogma_effect = self.ch.effect(effect_id=2, category=EffectCategory.active, modifiers=(dogma_modifier,))
+        item = self.item
+        self.eve_type.effects = (*self.eve_type.effects, dogma_effect)
+        self.eve_type.attributes[attr4.id] = 5
+        self.fit.items.add(item)
+        item.state = State.online
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 600)
+        # Action
+        item.state = State.active
+        # Verification
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 3000)
+        # Misc
+        self.fit.items.remove(item)
+        self.fit.ship = None
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_ship_attr_change(self):
+        attr4 = self.ch.attribute(attribute_id=4)
+        dogma_modifier = DogmaModifier(
+            state=State.active,
+            tgt_filter=ModifierTargetFilter.item,
+            tgt_domain=ModifierDomain.self,
+            tgt_attr=self.attr3.id,
+            operator=ModifierOperator.post_mul,
+            src_attr=attr4.id
+        )
+        dogma_effect = self.ch.effect(effect_id=2, category=EffectCategory.active, modifiers=(dogma_modifier,))
+        ship_item = self.fit.ship
+        self.ship_type.effects = (dogma_effect,)
+        self.ship_type.attributes[attr4.id] = 2
+        item = self.item
+        self.fit.items.add(ship_item)
+        self.fit.items.add(item)
+        item.state = State.online
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 600)
+        # Action
+        ship_item.state = State.active
+        # Verification
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 1200)
+        # Misc
+        self.fit.items.remove(item)
+        self.fit.items.remove(ship_item)
+        self.fit.ship = None
+        self.assert_calculator_buffers_empty(self.fit)
+
+    def test_unrelated_attr_change(self):
+        attr4 = self.ch.attribute(attribute_id=4)
+        attr5 = self.ch.attribute(attribute_id=5)
+        dogma_modifier = DogmaModifier(
+            state=State.active,
+            tgt_filter=ModifierTargetFilter.item,
+            tgt_domain=ModifierDomain.self,
+            tgt_attr=attr5.id,
+            operator=ModifierOperator.post_mul,
+            src_attr=attr4.id
+        )
+        dogma_effect = self.ch.effect(effect_id=2, category=EffectCategory.active, modifiers=(dogma_modifier,))
+        item = self.item
+        self.eve_type.effects = (*self.eve_type.effects, dogma_effect)
+        self.eve_type.attributes[attr4.id] = 5
+        self.eve_type.attributes[attr5.id] = 7
+        self.fit.items.add(item)
+        item.state = State.online
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 600)
+        self.assertAlmostEqual(item.attributes[attr5.id], 7)
+        del self.calls[:]
+        # Action
+        item.state = State.active
+        # Verification
+        self.assertAlmostEqual(item.attributes[attr5.id], 35)
+        self.assertAlmostEqual(item.attributes[self.attr1.id], 600)
+        self.assertEqual(len(self.calls), 0)
+        # Misc
+        self.fit.items.remove(item)
+        self.fit.ship = None
+        self.assert_calculator_buffers_empty(self.fit)
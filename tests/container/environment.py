@@ -25,7 +25,7 @@ from eos.const.eos import State
 from eos.fit.container import ItemDescriptorOnFit
 from eos.fit.item import Ship
 from eos.fit.item.mixin.state import MutableStateMixin
-from eos.fit.messages import ItemAdded, ItemRemoved
+from eos.fit.messages import ItemAdded, ItemRemoved, ItemPositionsChanged
 
 
 class Item(MutableStateMixin):
@@ -66,9 +66,13 @@ class Fit:
         self.test.assertIn(message.item, self.test_items)
         self.test_items.remove(message.item)
 
+    def handle_positions_change(self, message):
+        pass
+
     handler_map = {
         ItemAdded: handle_add_item,
-        ItemRemoved: handle_remove_item
+        ItemRemoved: handle_remove_item,
+        ItemPositionsChanged: handle_positions_change
     }
 
     def _publish(self, message):
@@ -23,7 +23,7 @@ from unittest.mock import Mock
 
 from eos.const.eos import State
 from eos.fit.container import ItemList
-from eos.fit.messages import ItemAdded, ItemRemoved
+from eos.fit.messages import ItemAdded, ItemRemoved, ItemPositionsChanged
 from tests.container.environment import Fit, Item, OtherItem
 from tests.container.container_testcase import ContainerTestCase
 
@@ -203,10 +203,16 @@ class TestContainerOrderedInsert(ContainerTestCase):
         item2 = Mock(_fit=None, state=State.offline, spec_set=Item(1))
         fit.container.append(item1)
         fit.container.append(item2)
+        shifts = []
+        fit._message_assertions[ItemPositionsChanged] = lambda f, m: shifts.append(m.container)
         # Action
         with self.fit_assertions(fit):
             fit.container.insert(1, None)
         # Verification
+        # Items are shifted without any item messages, thus
+        # it has to be reported separately
+        self.assertEqual(shifts, [fit.container])
+        del fit._message_assertions[ItemPositionsChanged]
         self.assertIs(len(fit.container), 3)
         self.assertIs(fit.container[0], item1)
         self.assertIsNone(fit.container[1])
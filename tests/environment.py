@@ -29,6 +29,7 @@ class CacheHandler:
         self.__type_data = {}
         self.__attribute_data = {}
         self.__effect_data = {}
+        self.fingerprint = 'test_fingerprint'
 
     def type(self, **kwargs):
         eve_type = Type(**kwargs)
@@ -57,6 +58,12 @@ class CacheHandler:
         except KeyError:
             raise TypeFetchError(type_id)
 
+    def get_type_ids(self):
+        return list(self.__type_data)
+
+    def get_fingerprint(self):
+        return self.fingerprint
+
     def get_attribute(self, attr):
         try:
             return self.__attribute_data[attr]
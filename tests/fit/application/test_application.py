@@ -0,0 +1,141 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import patch
+
+from eos.fit import application
+from eos.fit.application import (
+    make_target_grid, turret_chance_to_hit, turret_damage_multiplier,
+    missile_damage_multiplier, unreduced_damage_multiplier, apply_damage_multiplier, sum_damage
+)
+from eos.fit.tuples import DamageTypes, TargetData
+from eos.util.numpy_support import numpy
+from tests.eos_testcase import EosTestCase
+
+
+class ApplicationTests:
+    """
+    Tests which are run against both NumPy-based
+    and pure python implementations.
+    """
+
+    def to_list(self, values):
+        return [float(v) for v in values]
+
+    def test_turret_in_optimal_stationary(self):
+        target = TargetData(distance=5000, transversal=0, signature_radius=100, velocity=0)
+        chance = turret_chance_to_hit(target, 10000, 5000, 0.1, 40000)
+        self.assertIsInstance(chance, float)
+        self.assertAlmostEqual(chance, 1)
+
+    def test_turret_falloff(self):
+        target = TargetData(distance=[10000, 15000, 20000], transversal=0, signature_radius=100, velocity=0)
+        chances = turret_chance_to_hit(target, 10000, 5000, 0.1, 40000)
+        self.assertEqual(len(chances), 3)
+        for chance, expected in zip(self.to_list(chances), (1, 0.5, 0.0625)):
+            self.assertAlmostEqual(chance, expected)
+
+    def test_turret_tracking(self):
+        # Angular velocity 0.025 rad/s, with 40000 sig balance against 400 m
+        # signature gives tracking term of 2.5 / 0.1 * 0.01 = 0.25; squared
+        # it is 0.0625
+        target = TargetData(distance=[1000, 2000], transversal=[25, 0], signature_radius=400, velocity=0)
+        chances = self.to_list(turret_chance_to_hit(target, 10000, 5000, 0.1, 40000))
+        self.assertAlmostEqual(chances[0], 0.5 ** (0.025 * 40000 / (0.1 * 400)) ** 2)
+        self.assertAlmostEqual(chances[1], 1)
+
+    def test_turret_zero_divisors(self):
+        target = TargetData(distance=[0, 20000], transversal=[100, 0], signature_radius=0, velocity=0)
+        chances = self.to_list(turret_chance_to_hit(target, 10000, 0, 0.1, 40000))
+        self.assertAlmostEqual(chances[0], 1)
+        self.assertAlmostEqual(chances[1], 0)
+
+    def test_turret_damage_multiplier(self):
+        multipliers = self.to_list(turret_damage_multiplier([0, 0.005, 0.5, 1]))
+        self.assertAlmostEqual(multipliers[0], 0)
+        self.assertAlmostEqual(multipliers[1], 0.015)
+        self.assertAlmostEqual(multipliers[2], 0.03 + 0.49 * (0.255 + 0.49))
+        self.assertAlmostEqual(multipliers[3], 0.03 + 0.99 * (0.505 + 0.49))
+
+    def test_missile(self):
+        target = TargetData(
+            distance=[1000, 1000, 1000, 50000], transversal=0,
+            signature_radius=[200, 50, 200, 200], velocity=[0, 0, 500, 0])
+        multipliers = self.to_list(missile_damage_multiplier(target, 40000, 100, 100, 0.5))
+        self.assertAlmostEqual(multipliers[0], 1)
+        self.assertAlmostEqual(multipliers[1], 0.5)
+        self.assertAlmostEqual(multipliers[2], (200 * 100 / (100 * 500)) ** 0.5)
+        self.assertAlmostEqual(multipliers[3], 0)
+
+    def test_unreduced(self):
+        target = TargetData(distance=[1, 2, 3], transversal=0, signature_radius=0, velocity=0)
+        self.assertEqual(self.to_list(unreduced_damage_multiplier(target)), [1, 1, 1])
+
+    def test_grid(self):
+        grid = make_target_grid(distance=[1000, 2000], transversal=[0, 10, 20], signature_radius=100)
+        self.assertEqual(self.to_list(grid.distance), [1000] * 3 + [2000] * 3)
+        self.assertEqual(self.to_list(grid.transversal), [0, 10, 20] * 2)
+        self.assertEqual(self.to_list(grid.signature_radius), [100] * 6)
+        self.assertEqual(self.to_list(grid.velocity), [0] * 6)
+
+    def test_damage_sum(self):
+        damage1 = apply_damage_multiplier(
+            DamageTypes(em=10, thermal=None, kinetic=2, explosive=None), [1, 0.5])
+        damage2 = apply_damage_multiplier(
+            DamageTypes(em=None, thermal=None, kinetic=4, explosive=None), [0.5, 0])
+        total = sum_damage((damage1, damage2))
+        self.assertEqual(self.to_list(total.em), [10, 5])
+        self.assertIsNone(total.thermal)
+        self.assertEqual(self.to_list(total.kinetic), [4, 1])
+        self.assertIsNone(total.explosive)
+        self.assertEqual(self.to_list(total.total), [14, 6])
+
+    def test_damage_sum_empty(self):
+        total = sum_damage(())
+        self.assertIsNone(total.em)
+        self.assertIsNone(total.total)
+
+
+class TestApplicationPython(ApplicationTests, EosTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(application, 'numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_length_mismatch(self):
+        target = TargetData(distance=[1, 2], transversal=[1, 2, 3], signature_radius=0, velocity=0)
+        with self.assertRaises(ValueError):
+            turret_chance_to_hit(target, 10000, 5000, 0.1, 40000)
+
+
+if numpy is not None:
+
+    class TestApplicationNumpy(ApplicationTests, EosTestCase):
+
+        def test_grid_shape(self):
+            target = TargetData(
+                distance=numpy.linspace(0, 50000, 11)[:, None],
+                transversal=numpy.linspace(0, 500, 6)[None, :],
+                signature_radius=100, velocity=0)
+            chances = turret_chance_to_hit(target, 10000, 5000, 0.1, 40000)
+            self.assertEqual(chances.shape, (11, 6))
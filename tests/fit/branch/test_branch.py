@@ -0,0 +1,232 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.fit.item import Charge, Implant, ModuleHigh, Ship, Skill
+from eos.fit.messages import ItemAdded, ItemRemoved
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+class TestFitBranch(FitTestCase):
+
+    def test_discard_rack(self):
+        fit = Fit()
+        module1 = ModuleHigh(1)
+        module2 = ModuleHigh(2)
+        module3 = ModuleHigh(3)
+        fit.modules.high.append(module1)
+        fit.modules.high.place(2, module2)
+        branch = fit.branch()
+        fit.modules.high.free(module1)
+        fit.modules.high.insert(0, module3)
+        # Action
+        branch.discard()
+        # Verification
+        self.assertEqual(list(fit.modules.high), [module1, None, module2])
+        self.assertIsNone(module3._fit)
+        self.assertFalse(branch.active)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_untouched(self):
+        fit = Fit()
+        module = ModuleHigh(1)
+        implant = Implant(2)
+        fit.modules.high.append(module)
+        fit.implants.add(implant)
+        branch = fit.branch()
+        messages_before = len(fit.message_store)
+        # Action
+        branch.discard()
+        # Verification
+        self.assertEqual(len(fit.message_store) - messages_before, 0)
+        # Cleanup
+        fit.modules.high.clear()
+        fit.implants.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_set(self):
+        fit = Fit()
+        implant1 = Implant(1)
+        implant2 = Implant(2)
+        fit.implants.add(implant1)
+        branch = fit.branch()
+        fit.implants.remove(implant1)
+        fit.implants.add(implant2)
+        # Action
+        branch.discard()
+        # Verification
+        self.assertEqual(set(fit.implants), {implant1})
+        self.assertIs(implant1._fit, fit)
+        self.assertIsNone(implant2._fit)
+        # Cleanup
+        fit.implants.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_restricted_set(self):
+        fit = Fit()
+        skill1 = Skill(1, level=3)
+        skill2 = Skill(1, level=5)
+        fit.skills.add(skill1)
+        branch = fit.branch()
+        fit.skills.remove(skill1)
+        fit.skills.add(skill2)
+        # Action
+        branch.discard()
+        # Verification
+        self.assertEqual(set(fit.skills), {skill1})
+        # Cleanup
+        fit.skills.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_skill_level(self):
+        fit = Fit()
+        skill = Skill(1, level=3)
+        fit.skills.add(skill)
+        branch = fit.branch()
+        skill.level = 5
+        # Action
+        branch.discard()
+        # Verification
+        self.assertEqual(skill.level, 3)
+        # Cleanup
+        fit.skills.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_single(self):
+        fit = Fit()
+        ship1 = Ship(1)
+        ship2 = Ship(2)
+        fit.ship = ship1
+        branch = fit.branch()
+        fit.ship = ship2
+        # Action
+        branch.discard()
+        # Verification
+        self.assertIs(fit.ship, ship1)
+        self.assertIsNone(ship2._fit)
+        # Cleanup
+        fit.ship = None
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_charge(self):
+        fit = Fit()
+        charge1 = Charge(1)
+        charge2 = Charge(2)
+        module = ModuleHigh(3, charge=charge1)
+        fit.modules.high.append(module)
+        branch = fit.branch()
+        module.charge = charge2
+        # Action
+        branch.discard()
+        # Verification
+        self.assertIs(module.charge, charge1)
+        self.assertIs(charge1._fit, fit)
+        self.assertIsNone(charge2._fit)
+        self.assertIsNone(charge2.container)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_state(self):
+        fit = Fit()
+        module = ModuleHigh(1, state=State.online)
+        fit.modules.high.append(module)
+        branch = fit.branch()
+        module.state = State.active
+        module.state = State.overload
+        # Action
+        branch.discard()
+        # Verification
+        self.assertIs(module.state, State.online)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_discard_removed_item_state(self):
+        fit = Fit()
+        module = ModuleHigh(1, state=State.online)
+        fit.modules.high.append(module)
+        branch = fit.branch()
+        module.state = State.offline
+        fit.modules.high.remove(module)
+        # Action
+        branch.discard()
+        # Verification
+        self.assertIs(module.state, State.online)
+        self.assertIs(module._fit, fit)
+        # Re-added item should be brought back with its original state
+        self.assertIs(fit.message_store[-1].item, module)
+        self.assertIsInstance(fit.message_store[-1], ItemAdded)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_commit(self):
+        fit = Fit()
+        module1 = ModuleHigh(1)
+        module2 = ModuleHigh(2)
+        fit.modules.high.append(module1)
+        branch = fit.branch()
+        fit.modules.high.free(module1)
+        fit.modules.high.place(0, module2)
+        # Action
+        branch.commit()
+        branch.discard()
+        # Verification
+        self.assertEqual(list(fit.modules.high), [module2])
+        self.assertFalse(branch.active)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_context_manager(self):
+        fit = Fit()
+        module1 = ModuleHigh(1)
+        module2 = ModuleHigh(2)
+        fit.modules.high.append(module1)
+        # Action
+        with fit.branch():
+            fit.modules.high.remove(module1)
+            fit.modules.high.append(module2)
+            self.assertEqual(list(fit.modules.high), [module2])
+        # Verification
+        self.assertEqual(list(fit.modules.high), [module1])
+        self.assertIsInstance(fit.message_store[-2], ItemRemoved)
+        self.assertIs(fit.message_store[-2].item, module2)
+        # Cleanup
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_context_manager_commit(self):
+        fit = Fit()
+        implant = Implant(1)
+        # Action
+        with fit.branch() as branch:
+            fit.implants.add(implant)
+            branch.commit()
+        # Verification
+        self.assertEqual(set(fit.implants), {implant})
+        # Cleanup
+        fit.implants.clear()
+        self.assert_fit_buffers_empty(fit)
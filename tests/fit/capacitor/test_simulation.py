@@ -0,0 +1,131 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import patch
+
+from eos.fit import capacitor
+from eos.fit.capacitor import simulate_capacitor
+from eos.fit.tuples import CapacitorDrain
+from tests.eos_testcase import EosTestCase
+
+
+class TestCapacitorSimulation(EosTestCase):
+
+    def test_no_drains(self):
+        state = simulate_capacitor(1000, 100, ())
+        self.assertIs(state.stable, True)
+        self.assertAlmostEqual(state.stable_level, 1)
+        self.assertIsNone(state.depletion_time)
+
+    def test_no_capacitor_data(self):
+        state = simulate_capacitor(None, 100, (CapacitorDrain(amount=10, period=5),))
+        self.assertIsNone(state.stable)
+        self.assertIsNone(state.stable_level)
+        self.assertIsNone(state.depletion_time)
+
+    def test_stable_matches_steady_state(self):
+        # Frequent small activations are close to continuous drain,
+        # for which steady state level is known: with drain rate of
+        # 24 and peak recharge rate of 25, capacitor stays at 36%
+        state = simulate_capacitor(1000, 100, (CapacitorDrain(amount=2.4, period=0.1),))
+        self.assertIs(state.stable, True)
+        self.assertAlmostEqual(state.stable_level, 0.36, places=2)
+        self.assertIsNone(state.depletion_time)
+
+    def test_stable_multiple(self):
+        drains = (
+            CapacitorDrain(amount=10, period=5),
+            CapacitorDrain(amount=15, period=4.5),
+            CapacitorDrain(amount=10, period=10)
+        )
+        state = simulate_capacitor(1500, 400, drains)
+        self.assertIs(state.stable, True)
+        self.assertGreater(state.stable_level, 0.25)
+        self.assertLess(state.stable_level, 1)
+
+    def test_stable_unaligned(self):
+        # Least common multiple of periods is too long to be used
+        drains = (
+            CapacitorDrain(amount=10, period=5.121),
+            CapacitorDrain(amount=15, period=4.503),
+            CapacitorDrain(amount=10, period=10.007)
+        )
+        state = simulate_capacitor(1500, 400, drains)
+        self.assertIs(state.stable, True)
+        self.assertGreater(state.stable_level, 0.25)
+        self.assertLess(state.stable_level, 1)
+
+    def test_unaligned_converges_early(self):
+        # Mixed periods should not make simulation run until time
+        # limit, which takes about 10000 activations here
+        drains = (
+            CapacitorDrain(amount=10, period=5.121),
+            CapacitorDrain(amount=15, period=4.503),
+            CapacitorDrain(amount=10, period=10.007)
+        )
+        with patch.object(capacitor, '_recharge', wraps=capacitor._recharge) as recharge:
+            state = simulate_capacitor(1500, 400, drains)
+        self.assertIs(state.stable, True)
+        self.assertLess(recharge.call_count, 2000)
+
+    def test_unstable(self):
+        state = simulate_capacitor(1000, 100, (CapacitorDrain(amount=30, period=1),))
+        self.assertIs(state.stable, False)
+        self.assertIsNone(state.stable_level)
+        self.assertAlmostEqual(state.depletion_time, 102)
+
+    def test_unstable_under_peak_rate(self):
+        # Average drain is below peak recharge rate, but single
+        # activation takes too much capacitor
+        state = simulate_capacitor(1000, 100, (CapacitorDrain(amount=900, period=40),))
+        self.assertIs(state.stable, False)
+        self.assertAlmostEqual(state.depletion_time, 40)
+
+    def test_activation_over_capacity(self):
+        state = simulate_capacitor(1000, 100, (CapacitorDrain(amount=1001, period=40),))
+        self.assertIs(state.stable, False)
+        self.assertAlmostEqual(state.depletion_time, 0)
+
+    def test_same_period_merged(self):
+        # Drains with the same period activate at the same time
+        merged = simulate_capacitor(1000, 100, (CapacitorDrain(amount=30, period=1),))
+        split = simulate_capacitor(1000, 100, (
+            CapacitorDrain(amount=10, period=1),
+            CapacitorDrain(amount=20, period=1)
+        ))
+        self.assertEqual(merged, split)
+
+    def test_injection(self):
+        drains = (
+            CapacitorDrain(amount=30, period=1),
+            CapacitorDrain(amount=-400, period=12)
+        )
+        state = simulate_capacitor(1000, 100, drains)
+        self.assertIs(state.stable, True)
+
+    def test_ignored_drains(self):
+        drains = (
+            CapacitorDrain(amount=0, period=1),
+            CapacitorDrain(amount=100, period=0)
+        )
+        state = simulate_capacitor(1000, 100, drains)
+        self.assertIs(state.stable, True)
+        self.assertAlmostEqual(state.stable_level, 1)
@@ -0,0 +1,139 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.fit.item import Charge, Drone, Implant, ModuleHigh, ModuleLow, Ship, Skill
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+class TestFitClone(FitTestCase):
+
+    def test_containers(self):
+        fit = Fit()
+        ship = Ship(1)
+        implant = Implant(2)
+        drone = Drone(3, state=State.active)
+        module1 = ModuleHigh(4, state=State.active)
+        module2 = ModuleLow(5)
+        fit.ship = ship
+        fit.implants.add(implant)
+        fit.drones.add(drone)
+        fit.modules.high.place(1, module1)
+        fit.modules.low.append(module2)
+        # Action
+        clone = fit.clone()
+        # Verification
+        self.assertIsNot(clone.ship, ship)
+        self.assertEqual(clone.ship._eve_type_id, 1)
+        self.assertIs(clone.ship._fit, clone)
+        self.assertEqual(len(clone.implants), 1)
+        clone_implant = next(iter(clone.implants))
+        self.assertIsNot(clone_implant, implant)
+        self.assertEqual(clone_implant._eve_type_id, 2)
+        clone_drone = next(iter(clone.drones))
+        self.assertIs(clone_drone.state, State.active)
+        self.assertEqual(len(clone.modules.high), 2)
+        self.assertIsNone(clone.modules.high[0])
+        self.assertIsNot(clone.modules.high[1], module1)
+        self.assertEqual(clone.modules.high[1]._eve_type_id, 4)
+        self.assertIs(clone.modules.high[1].state, State.active)
+        self.assertEqual(clone.modules.low[0]._eve_type_id, 5)
+        self.assertIsNone(clone.character)
+        # Original fit should stay intact
+        self.assertIs(fit.ship, ship)
+        self.assertIs(ship._fit, fit)
+        self.assertIs(fit.modules.high[1], module1)
+        # Cleanup
+        for f in (fit, clone):
+            f.ship = None
+            f.implants.clear()
+            f.drones.clear()
+            f.modules.high.clear()
+            f.modules.low.clear()
+            self.assert_fit_buffers_empty(f)
+
+    def test_charge(self):
+        fit = Fit()
+        charge = Charge(1)
+        module = ModuleHigh(2, charge=charge)
+        fit.modules.high.append(module)
+        # Action
+        clone = fit.clone()
+        # Verification
+        clone_module = clone.modules.high[0]
+        clone_charge = clone_module.charge
+        self.assertIsNot(clone_charge, charge)
+        self.assertEqual(clone_charge._eve_type_id, 1)
+        self.assertIs(clone_charge.container, clone_module)
+        self.assertIs(clone_charge._fit, clone)
+        self.assertIs(charge.container, module)
+        self.assertIs(charge._fit, fit)
+        # Cleanup
+        fit.modules.high.clear()
+        clone.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+        self.assert_fit_buffers_empty(clone)
+
+    def test_attributes(self):
+        fit = Fit()
+        skill = Skill(1, level=3)
+        module = ModuleHigh(2)
+        fit.skills.add(skill)
+        fit.modules.high.append(module)
+        module.attributes._MutableAttributeMap__modified_attributes[5] = 8.5
+        module.attributes._cap_set(6, 5)
+        # Action
+        clone = fit.clone()
+        # Verification
+        clone_skill = next(iter(clone.skills))
+        self.assertEqual(clone_skill.level, 3)
+        clone_attributes = clone.modules.high[0].attributes
+        self.assertEqual(clone_attributes._MutableAttributeMap__modified_attributes, {5: 8.5})
+        self.assertEqual(clone_attributes._cap_map, {6: {5}})
+        # Changes to copy should not affect original
+        clone_skill.level = 5
+        clone_attributes._cap_del(6, 5)
+        self.assertEqual(skill.level, 3)
+        self.assertEqual(module.attributes._cap_map, {6: {5}})
+        # Cleanup
+        for f in (fit, clone):
+            f.skills.clear()
+            f.modules.high.clear()
+            self.assert_fit_buffers_empty(f)
+
+    def test_effect_status(self):
+        fit = Fit()
+        module = ModuleHigh(1)
+        module._set_effects_status((11,), False)
+        fit.modules.high.append(module)
+        # Action
+        clone = fit.clone()
+        # Verification
+        clone_module = clone.modules.high[0]
+        self.assertEqual(clone_module._BaseItemMixin__disabled_effects, {11})
+        clone_module._set_effects_status((11,), True)
+        self.assertEqual(module._BaseItemMixin__disabled_effects, {11})
+        # Cleanup
+        fit.modules.high.clear()
+        clone.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+        self.assert_fit_buffers_empty(clone)
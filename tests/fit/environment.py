@@ -34,7 +34,7 @@ class Item:
 
 class Fit(FitBase):
 
-    def __init__(self, source=None, message_assertions=None):
+    def __init__(self, source=None, message_assertions=None, **kwargs):
         self._message_assertions = message_assertions
         self.assertions_enabled = False
         self.message_store = []
@@ -46,7 +46,7 @@ class Fit(FitBase):
         with ExitStack() as stack:
             for mgr in ctx_managers:
                 stack.enter_context(mgr)
-            FitBase.__init__(self, source=source)
+            FitBase.__init__(self, source=source, **kwargs)
         self.character = None
 
     def _publish(self, message):
@@ -0,0 +1,92 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest import skipIf
+
+from eos.fit.item import Charge, ModuleHigh, Ship, Skill
+from eos.util.numpy_support import numpy
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+class TestFitAttributeExport(FitTestCase):
+
+    def make_fit(self):
+        fit = Fit()
+        self.ship = Ship(1)
+        self.skill = Skill(2, level=4)
+        self.charge = Charge(3)
+        self.module = ModuleHigh(4, charge=self.charge)
+        fit.ship = self.ship
+        fit.skills.add(self.skill)
+        fit.modules.high.append(self.module)
+        self.ship.attributes._MutableAttributeMap__modified_attributes.update({10: 1.5, 11: 2.5})
+        self.module.attributes._MutableAttributeMap__modified_attributes.update({10: 3.5})
+        return fit
+
+    def cleanup(self, fit):
+        fit.ship = None
+        fit.skills.clear()
+        fit.modules.high.clear()
+        self.assert_fit_buffers_empty(fit)
+
+    def test_columns(self):
+        fit = self.make_fit()
+        # Action
+        items, columns = fit.export_attributes((10, 11))
+        # Verification
+        self.assertEqual(items, (self.ship, self.skill, self.module, self.charge))
+        rows = set(zip(columns.item_index, columns.type_id, columns.attr_id, columns.value))
+        self.assertEqual(rows, {(0, 1, 10, 1.5), (0, 1, 11, 2.5), (2, 4, 10, 3.5)})
+        self.assertEqual(columns.value.typecode, 'd')
+        # Cleanup
+        self.cleanup(fit)
+
+    def test_all_attributes(self):
+        fit = self.make_fit()
+        # Action
+        items, columns = fit.export_attributes()
+        # Verification
+        rows = set(zip(columns.item_index, columns.type_id, columns.attr_id, columns.value))
+        self.assertEqual(rows, {(0, 1, 10, 1.5), (0, 1, 11, 2.5), (1, 2, 280, 4), (2, 4, 10, 3.5)})
+        # Cleanup
+        self.cleanup(fit)
+
+    @skipIf(numpy is None, 'NumPy is not available')
+    def test_structured(self):
+        fit = self.make_fit()
+        # Action
+        items, data = fit.export_attributes((10, 11), structured=True)
+        # Verification
+        self.assertEqual(data.dtype.names, ('item_index', 'type_id', 'attr_id', 'value'))
+        self.assertEqual(len(data), 3)
+        self.assertAlmostEqual(data['value'].sum(), 7.5)
+        # Cleanup
+        self.cleanup(fit)
+
+    @skipIf(numpy is not None, 'NumPy is available')
+    def test_structured_no_numpy(self):
+        fit = self.make_fit()
+        # Action
+        with self.assertRaises(ImportError):
+            fit.export_attributes((10, 11), structured=True)
+        # Cleanup
+        self.cleanup(fit)
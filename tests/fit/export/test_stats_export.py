@@ -0,0 +1,81 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from math import isnan
+from unittest import skipIf
+from unittest.mock import Mock
+
+from eos.fit.export import export_stats
+from eos.fit.stats import StatsDisabledError
+from eos.fit.tuples import StatSnapshot
+from eos.util.numpy_support import numpy
+from tests.eos_testcase import EosTestCase
+
+
+class TestFitStatsExport(EosTestCase):
+
+    def make_fit(self, **values):
+        fields = dict.fromkeys(StatSnapshot._fields)
+        fields.update(values)
+        fit = Mock()
+        fit.stats.snapshot.return_value = StatSnapshot(**fields)
+        return fit
+
+    def test_columns(self):
+        fits = (
+            self.make_fit(cpu_used=10, hp_total=100, capacitor_stable=True),
+            self.make_fit(cpu_used=20.5, capacitor_stable=False)
+        )
+        # Action
+        columns = export_stats(fits)
+        # Verification
+        self.assertIsInstance(columns, StatSnapshot)
+        self.assertEqual(list(columns.cpu_used), [10, 20.5])
+        self.assertEqual(columns.hp_total[0], 100)
+        self.assertTrue(isnan(columns.hp_total[1]))
+        self.assertEqual(list(columns.capacitor_stable), [1, 0])
+        self.assertEqual(columns.cpu_used.typecode, 'd')
+
+    def test_no_fits(self):
+        columns = export_stats(())
+        self.assertEqual(len(columns), len(StatSnapshot._fields))
+        self.assertEqual(len(columns.cpu_used), 0)
+
+    def test_stats_disabled(self):
+        fits = (self.make_fit(cpu_used=10), Mock(stats=None))
+        with self.assertRaises(StatsDisabledError):
+            export_stats(fits)
+
+    @skipIf(numpy is None, 'NumPy is not available')
+    def test_structured(self):
+        fits = (self.make_fit(cpu_used=10), self.make_fit(cpu_used=20.5))
+        # Action
+        data = export_stats(fits, structured=True)
+        # Verification
+        self.assertEqual(data.dtype.names, StatSnapshot._fields)
+        self.assertEqual(len(data), 2)
+        self.assertAlmostEqual(data['cpu_used'].sum(), 30.5)
+        self.assertTrue(numpy.isnan(data['hp_total']).all())
+
+    @skipIf(numpy is not None, 'NumPy is available')
+    def test_structured_no_numpy(self):
+        with self.assertRaises(ImportError):
+            export_stats((self.make_fit(),), structured=True)
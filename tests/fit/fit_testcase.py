@@ -37,12 +37,7 @@ class FitTestCase(EosTestCase):
         item_num = 0
         item_num += self._get_object_buffer_entry_amount(
             fit, ignore=('message_store', '_message_assertions', '_MessageBroker__subscribers'))
-        # As volatile manager always has one entry added to it
-        # (stats service), make sure it's ignored for calculation
-        # purposes
-        fit._volatile_mgr._FitVolatileManager__volatile_objects.remove(fit.stats)
         item_num += self._get_object_buffer_entry_amount(fit._volatile_mgr)
-        fit._volatile_mgr._FitVolatileManager__volatile_objects.add(fit.stats)
         if item_num > 0:
             plu = 'y' if item_num == 1 else 'ies'
             msg = '{} entr{} in buffers: buffers must be empty'.format(item_num, plu)
@@ -0,0 +1,81 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eve import Attribute, Category, Effect, EffectCategory, Group
+from eos.data.source import Source
+from tests.eos_testcase import EosTestCase
+
+
+class FormatTestCase(EosTestCase):
+    """
+    Additional functionality provided:
+
+    self.source -- source with types of all kinds, which
+        are available as self.ship, self.high etc.
+    self.type_ids -- map in {type name: type ID} format
+    self.type_names -- map in {type ID: type name} format
+    """
+
+    def setUp(self):
+        super().setUp()
+        ch = self.ch
+        for attr_id in (
+            Attribute.charge_group_1, Attribute.capacity, Attribute.volume,
+            Attribute.implantness, Attribute.boosterness
+        ):
+            ch.attribute(attribute_id=attr_id)
+        online = ch.effect(effect_id=Effect.online, category=EffectCategory.online)
+
+        def slot_effect(effect_id):
+            return ch.effect(effect_id=effect_id, category=EffectCategory.passive)
+
+        hi_power = slot_effect(Effect.hi_power)
+        med_power = slot_effect(Effect.med_power)
+        lo_power = slot_effect(Effect.lo_power)
+        rig_slot = slot_effect(Effect.rig_slot)
+        subsystem = slot_effect(Effect.subsystem)
+        self.ship = ch.type(type_id=1, category=Category.ship).id
+        self.stance = ch.type(type_id=2, group=Group.ship_modifier).id
+        self.high = ch.type(
+            type_id=10, category=Category.module, effects=(hi_power, online),
+            attributes={Attribute.charge_group_1: 50, Attribute.capacity: 1}).id
+        self.high_passive = ch.type(type_id=11, category=Category.module, effects=(hi_power,)).id
+        self.med = ch.type(type_id=12, category=Category.module, effects=(med_power, online)).id
+        self.low = ch.type(type_id=13, category=Category.module, effects=(lo_power, online)).id
+        self.rig = ch.type(type_id=14, category=Category.module, effects=(rig_slot,)).id
+        self.subsystem = ch.type(type_id=15, category=Category.subsystem, effects=(subsystem,)).id
+        self.charge = ch.type(type_id=20, group=50, category=Category.charge, attributes={Attribute.volume: 1}).id
+        self.charge_other = ch.type(type_id=21, group=51, category=Category.charge).id
+        self.drone = ch.type(type_id=30, category=Category.drone).id
+        self.implant = ch.type(
+            type_id=40, category=Category.implant, attributes={Attribute.implantness: 1}).id
+        self.booster = ch.type(
+            type_id=41, category=Category.implant, attributes={Attribute.boosterness: 1}).id
+        self.skill = ch.type(type_id=50, category=Category.skill).id
+        self.source = Source('test', ch)
+        self.type_names = {
+            self.ship: 'Rifter', self.stance: 'Sharpshooter Mode', self.high: 'Autocannon',
+            self.high_passive: 'Salvager', self.med: 'Afterburner', self.low: 'Gyrostabilizer',
+            self.rig: 'Burst Aerator', self.subsystem: 'Core', self.charge: 'EMP S',
+            self.charge_other: 'Scourge Rocket', self.drone: 'Warrior II', self.implant: 'Snake Alpha',
+            self.booster: 'Blue Pill', self.skill: 'Gunnery'
+        }
+        self.type_ids = {name: type_id for type_id, name in self.type_names.items()}
@@ -0,0 +1,141 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.fit.format import FitFormatError, iter_dna, make_dna, parse_dna
+from eos.fit.tuples import DroneSpec, FitSpec, ModuleSpec
+from .format_testcase import FormatTestCase
+
+
+class TestDna(FormatTestCase):
+
+    def test_parse(self):
+        dna = '1:15;1:10;2:12;1:13;1:14;1:20;200:30;3:40;1::'
+        # Action
+        spec = parse_dna(dna, self.source)
+        # Verification
+        self.assertEqual(spec, FitSpec(
+            ship=self.ship,
+            high=(ModuleSpec(self.high, State.online, self.charge),) * 2,
+            med=(ModuleSpec(self.med, State.online),),
+            low=(ModuleSpec(self.low, State.online),),
+            rigs=(self.rig,),
+            subsystems=(self.subsystem,),
+            drones=(DroneSpec(self.drone),) * 3,
+            implants=(self.implant,)
+        ))
+
+    def test_parse_module_state(self):
+        spec = parse_dna('1:11;1::', self.source)
+        self.assertEqual(spec.high, (ModuleSpec(self.high_passive, State.offline),))
+
+    def test_parse_incompatible_charge(self):
+        spec = parse_dna('1:10;1:21;10::', self.source)
+        self.assertEqual(spec.high, (ModuleSpec(self.high, State.online),))
+
+    def test_parse_stance(self):
+        spec = parse_dna('1:2;1::', self.source)
+        self.assertEqual(spec.stance, self.stance)
+
+    def test_parse_cargo(self):
+        spec = parse_dna('1:20_;100::', self.source)
+        self.assertEqual(spec, FitSpec(ship=self.ship))
+
+    def test_parse_not_ship(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('10:12;1::', self.source)
+
+    def test_parse_unfittable(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:50;1::', self.source)
+
+    def test_parse_unknown(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:1000;1::', self.source)
+
+    def test_parse_malformed(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:abc;1::', self.source)
+
+    def test_parse_amount_over_limit(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:10;9::', self.source)
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:30;999999999::', self.source)
+
+    def test_parse_amount_over_limit_split(self):
+        # Limit applies to whole rack, not to single entry
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:10;5:11;4::', self.source)
+
+    def test_parse_amount_not_positive(self):
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:10;0::', self.source)
+        with self.assertRaises(FitFormatError):
+            parse_dna('1:30;-2::', self.source)
+
+    def test_make(self):
+        spec = FitSpec(
+            ship=self.ship,
+            high=(ModuleSpec(self.high, State.active, self.charge), None, ModuleSpec(self.high)),
+            low=(ModuleSpec(self.low),),
+            rigs=(self.rig,),
+            subsystems=(self.subsystem,),
+            drones=(DroneSpec(self.drone), DroneSpec(self.drone, State.active)),
+            implants=(self.implant,)
+        )
+        self.assertEqual(make_dna(spec), '1:15;1:10;2:13;1:14;1:20;1:30;2::')
+
+    def test_round_trip(self):
+        dna = '1:15;1:10;2:12;1:13;1:14;1:20;2:30;3::'
+        self.assertEqual(make_dna(parse_dna(dna, self.source)), dna)
+
+    def test_iter(self):
+        lines = ['1:10;1::\n', '\n', '1:1000;1::\n', '1:12;2::\n']
+        errors = []
+        # Action
+        specs = list(iter_dna(iter(lines), self.source, on_error=lambda *args: errors.append(args)))
+        # Verification
+        self.assertEqual(len(specs), 2)
+        self.assertEqual(specs[0].high, (ModuleSpec(self.high, State.online),))
+        self.assertEqual(specs[1].med, (ModuleSpec(self.med, State.online),) * 2)
+        self.assertEqual(len(errors), 1)
+        line_number, line, error = errors[0]
+        self.assertEqual(line_number, 3)
+        self.assertEqual(line, '1:1000;1::')
+        self.assertIsInstance(error, FitFormatError)
+
+    def test_iter_bad_amount(self):
+        lines = ['1:10;999999999::', '1:30;-1::', '1:12;2::']
+        errors = []
+        # Action
+        specs = list(iter_dna(lines, self.source, on_error=lambda *args: errors.append(args)))
+        # Verification
+        self.assertEqual(len(specs), 1)
+        self.assertEqual(specs[0].med, (ModuleSpec(self.med, State.online),) * 2)
+        self.assertEqual([error[0] for error in errors], [1, 2])
+        for _, _, error in errors:
+            self.assertIsInstance(error, FitFormatError)
+
+    def test_iter_raise(self):
+        specs = iter_dna(['1:1000;1::'], self.source)
+        with self.assertRaises(FitFormatError):
+            list(specs)
@@ -0,0 +1,117 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.fit.format import FitFormatError, make_eft, parse_eft
+from eos.fit.tuples import DroneSpec, FitSpec, ModuleSpec
+from .format_testcase import FormatTestCase
+
+
+EFT = '''[Rifter, My Fit]
+Gyrostabilizer
+[Empty Low slot]
+Gyrostabilizer /offline
+
+Afterburner
+
+Autocannon, EMP S
+[Empty High slot]
+Salvager
+
+Burst Aerator
+
+Core
+
+Warrior II x2
+
+Snake Alpha
+
+Blue Pill'''
+
+
+class TestEft(FormatTestCase):
+
+    def test_parse(self):
+        eft_fit = parse_eft(EFT, self.source, self.type_ids)
+        self.assertEqual(eft_fit.name, 'My Fit')
+        self.assertEqual(eft_fit.spec, FitSpec(
+            ship=self.ship,
+            high=(ModuleSpec(self.high, State.online, self.charge), None, ModuleSpec(self.high_passive)),
+            med=(ModuleSpec(self.med, State.online),),
+            low=(ModuleSpec(self.low, State.online), None, ModuleSpec(self.low, State.offline)),
+            rigs=(self.rig,),
+            subsystems=(self.subsystem,),
+            drones=(DroneSpec(self.drone),) * 2,
+            implants=(self.implant,),
+            boosters=(self.booster,)
+        ))
+
+    def test_parse_cargo(self):
+        eft_fit = parse_eft('[Rifter, Cargo]\nEMP S x100\nAutocannon x2', self.source, self.type_ids)
+        self.assertEqual(eft_fit.spec, FitSpec(ship=self.ship))
+
+    def test_parse_stance(self):
+        eft_fit = parse_eft('[Rifter, Stance]\nSharpshooter Mode', self.source, self.type_ids)
+        self.assertEqual(eft_fit.spec.stance, self.stance)
+
+    def test_parse_no_header(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('Autocannon', self.source, self.type_ids)
+
+    def test_parse_unknown_name(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('[Rifter, Fit]\nDoomsday', self.source, self.type_ids)
+
+    def test_parse_not_ship(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('[Autocannon, Fit]', self.source, self.type_ids)
+
+    def test_parse_drone_amount_over_limit(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('[Rifter, Fit]\nWarrior II x999999999', self.source, self.type_ids)
+
+    def test_parse_drone_amount_zero(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('[Rifter, Fit]\nWarrior II x0', self.source, self.type_ids)
+
+    def test_parse_rack_over_limit(self):
+        with self.assertRaises(FitFormatError):
+            parse_eft('[Rifter, Fit]\n' + '\n'.join(['Autocannon'] * 9), self.source, self.type_ids)
+
+    def test_make(self):
+        spec = FitSpec(
+            ship=self.ship,
+            high=(ModuleSpec(self.high, State.active, self.charge),),
+            low=(None, ModuleSpec(self.low, State.offline)),
+            drones=(DroneSpec(self.drone),) * 3
+        )
+        self.assertEqual(
+            make_eft(spec, self.type_names, name='Fit'),
+            '[Rifter, Fit]\n[Empty Low slot]\nGyrostabilizer /offline\n\nAutocannon, EMP S\n\nWarrior II x3')
+
+    def test_make_unknown_name(self):
+        with self.assertRaises(FitFormatError):
+            make_eft(FitSpec(ship=1000), self.type_names)
+
+    def test_round_trip(self):
+        eft_fit = parse_eft(EFT, self.source, self.type_ids)
+        eft = make_eft(eft_fit.spec, self.type_names, name=eft_fit.name)
+        self.assertEqual(parse_eft(eft, self.source, self.type_ids), eft_fit)
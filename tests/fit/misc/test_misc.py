@@ -21,6 +21,13 @@
 
 from unittest.mock import call
 
+from eos.const.eve import Attribute, Type
+from eos.data.source import Source
+from eos.fit import Fit as EosFit
+from eos.fit.item import ModuleHigh, Ship
+from eos.fit.restriction import RestrictionsDisabledError, ValidationError
+
+from tests.environment import CacheHandler
 from tests.fit.fit_testcase import FitTestCase
 from tests.fit.environment import Fit
 
@@ -34,3 +41,52 @@ class TestMiscellanea(FitTestCase):
         rs_calls_after = len(fit._restriction.mock_calls)
         self.assertEqual(rs_calls_after - rs_calls_before, 1)
         self.assertEqual(fit._restriction.mock_calls[-1], call.validate(()))
+
+    def test_restrictions_disabled(self):
+        fit = Fit(restrictions=False)
+        self.assertIsNone(fit._restriction)
+        self.assertIsNotNone(fit.stats)
+        self.assertRaises(RestrictionsDisabledError, fit.validate)
+        self.assertRaises(RestrictionsDisabledError, fit.has_violations)
+
+    def test_stats_disabled(self):
+        fit = Fit(restrictions=False, stats=False)
+        self.assertIsNone(fit.stats)
+        self.assertIsNone(fit._restriction)
+
+    def test_stats_disabled_restrictions_enabled(self):
+        # Restriction checks use stats, thus such profile is rejected
+        self.assertRaises(ValueError, Fit, stats=False)
+        self.assertRaises(ValueError, Fit, restrictions=True, stats=False)
+
+    def make_source(self):
+        cache_handler = CacheHandler()
+        cache_handler.attribute(attribute_id=Attribute.hi_slots)
+        cache_handler.type(type_id=Type.character_static)
+        cache_handler.type(type_id=1, attributes={Attribute.hi_slots: 1})
+        cache_handler.type(type_id=2)
+        return Source('test', cache_handler)
+
+    def fill_fit(self, fit):
+        fit.ship = Ship(1)
+        fit.modules.high.append(ModuleHigh(2))
+        fit.modules.high.append(ModuleHigh(2))
+
+    def test_validation_real_services(self):
+        # Slot amount register takes slot amounts from stats
+        fit = EosFit(source=self.make_source())
+        self.fill_fit(fit)
+        self.assertRaises(ValidationError, fit.validate)
+        self.assertIs(fit.has_violations(), True)
+
+    def test_validation_stats_disabled_real_services(self):
+        fit = EosFit(source=self.make_source(), restrictions=False, stats=False)
+        self.fill_fit(fit)
+        self.assertRaises(RestrictionsDisabledError, fit.validate)
+        self.assertRaises(RestrictionsDisabledError, fit.has_violations)
+
+    def test_profile_clone(self):
+        fit = Fit(restrictions=False, stats=False)
+        fit_clone = fit.clone()
+        self.assertIsNone(fit_clone._restriction)
+        self.assertIsNone(fit_clone.stats)
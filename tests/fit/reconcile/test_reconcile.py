@@ -0,0 +1,134 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from random import Random
+
+from eos.const.eos import State
+from eos.fit.item import Charge, Drone, Implant, ModuleHigh, Rig, Ship, Skill
+from eos.fit.spec import _fill_fit, get_fit_spec
+from eos.fit.tuples import DroneSpec, FitSpec, ModuleSpec
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+class TestFitApplySpec(FitTestCase):
+
+    def test_keeps_matching(self):
+        fit = Fit()
+        ship = Ship(1)
+        charge = Charge(3)
+        module = ModuleHigh(2, state=State.online, charge=charge)
+        rig = Rig(4)
+        drone = Drone(5, state=State.offline)
+        skill = Skill(6, level=1)
+        fit.ship = ship
+        fit.modules.high.place(1, module)
+        fit.rigs.add(rig)
+        fit.drones.add(drone)
+        fit.skills.add(skill)
+        spec = FitSpec(
+            ship=1,
+            high=(None, ModuleSpec(2, State.active, 3)),
+            rigs=(4,),
+            drones=(DroneSpec(5, State.active),),
+            skills={6: 5}
+        )
+        # Action
+        fit.apply_spec(spec)
+        # Verification
+        self.assertIs(fit.ship, ship)
+        self.assertIs(fit.modules.high[1], module)
+        self.assertIs(module.state, State.active)
+        self.assertIs(module.charge, charge)
+        self.assertIs(next(iter(fit.rigs)), rig)
+        self.assertIs(next(iter(fit.drones)), drone)
+        self.assertIs(drone.state, State.active)
+        self.assertIs(next(iter(fit.skills)), skill)
+        self.assertEqual(skill.level, 5)
+        self.assertEqual(get_fit_spec(fit), get_fit_spec(self.make_fit(spec)))
+
+    def test_replaces_differing(self):
+        fit = Fit()
+        ship = Ship(1)
+        module = ModuleHigh(2, charge=Charge(3))
+        implant = Implant(4)
+        fit.ship = ship
+        fit.modules.high.append(module)
+        fit.modules.high.append(ModuleHigh(2))
+        fit.implants.add(implant)
+        fit.skills.add(Skill(6, level=1))
+        spec = FitSpec(ship=7, high=(ModuleSpec(8), None, ModuleSpec(2, charge=9)), implants=(4, 4))
+        # Action
+        fit.apply_spec(spec)
+        # Verification
+        self.assertIsNot(fit.ship, ship)
+        self.assertIsNone(ship._fit)
+        self.assertIsNone(module._fit)
+        self.assertEqual(fit.modules.high[0]._eve_type_id, 8)
+        self.assertIsNone(fit.modules.high[1])
+        self.assertEqual(fit.modules.high[2].charge._eve_type_id, 9)
+        self.assertIn(implant, fit.implants)
+        self.assertEqual(len(fit.implants), 2)
+        self.assertEqual(len(fit.skills), 0)
+        self.assertEqual(get_fit_spec(fit), get_fit_spec(self.make_fit(spec)))
+
+    def test_clears(self):
+        fit = self.make_fit(FitSpec(
+            ship=1, stance=2, high=(ModuleSpec(3, charge=4),), rigs=(5,),
+            drones=(DroneSpec(6),), boosters=(7,), skills={8: 1}))
+        # Action
+        fit.apply_spec(FitSpec())
+        # Verification
+        self.assertEqual(get_fit_spec(fit), FitSpec())
+        fit.character = None
+        self.assert_fit_buffers_empty(fit)
+
+    def test_random(self):
+        random = Random(0)
+        fit = Fit()
+
+        def random_module():
+            if random.random() < 0.3:
+                return None
+            return ModuleSpec(
+                random.choice((1, 2)), random.choice((State.offline, State.online, State.active)),
+                random.choice((None, 10, 11)))
+
+        for _ in range(50):
+            spec = FitSpec(
+                ship=random.choice((None, 20, 21)),
+                high=tuple(random_module() for _ in range(random.randrange(5))),
+                low=tuple(random_module() for _ in range(random.randrange(3))),
+                rigs=tuple(random.choice((30, 31)) for _ in range(random.randrange(3))),
+                drones=tuple(
+                    DroneSpec(random.choice((40, 41)), random.choice((State.offline, State.active)))
+                    for _ in range(random.randrange(5))),
+                skills={s: random.randrange(6) for s in random.sample((50, 51, 52), random.randrange(4))}
+            )
+            # Action
+            fit.apply_spec(spec)
+            # Verification
+            self.assertEqual(get_fit_spec(fit), get_fit_spec(self.make_fit(spec)))
+
+    def make_fit(self, spec):
+        fit = Fit()
+        _fill_fit(fit, spec)
+        return fit
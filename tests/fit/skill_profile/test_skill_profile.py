@@ -0,0 +1,145 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock, patch
+
+from eos import ModuleHigh, Implant, Rig
+from eos.fit import skill_profile
+from eos.fit.restriction.register.skill_requirement import SkillRequirementErrorData
+from eos.fit.skill_profile import SkillProfile, check_skill_profiles
+from eos.util.numpy_support import numpy
+from tests.eos_testcase import EosTestCase
+
+
+class SkillProfileTests:
+    """
+    Tests which are run against both NumPy-based
+    and pure python implementations.
+    """
+
+    def make_fit(self, *items):
+        fit = Mock()
+        fit.character = fit.ship = fit.stance = fit.effect_beacon = None
+        fit.skills = []
+        fit.implants = [i for i in items if isinstance(i, Implant)]
+        fit.boosters = []
+        fit.subsystems = []
+        fit.rigs = [i for i in items if isinstance(i, Rig)]
+        fit.modules.items.return_value = [i for i in items if isinstance(i, ModuleHigh)]
+        fit.drones = []
+        return fit
+
+    def make_item(self, item_class, required_skills):
+        item = Mock(spec=item_class)
+        item._eve_type.required_skills = required_skills
+        item.charge = None
+        return item
+
+    def test_profile_level(self):
+        profile = SkillProfile({50: 3, 10: 0})
+        self.assertEqual(profile.get_level(50), 3)
+        self.assertEqual(profile.get_level(10), 0)
+        self.assertIsNone(profile.get_level(20))
+        self.assertIsNone(profile.get_level(500))
+
+    def test_profile_empty(self):
+        profile = SkillProfile({})
+        self.assertIsNone(profile.get_level(0))
+
+    def test_pass(self):
+        item = self.make_item(ModuleHigh, {50: 3})
+        fit = self.make_fit(item)
+        results = check_skill_profiles(fit, [SkillProfile({50: 3}), SkillProfile({50: 5})])
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIs(result.passed, True)
+            self.assertEqual(result.missing, {})
+
+    def test_fail_level(self):
+        item = self.make_item(ModuleHigh, {50: 3, 48: 1})
+        fit = self.make_fit(item)
+        result, = check_skill_profiles(fit, [SkillProfile({50: 2, 48: 1})])
+        self.assertIs(result.passed, False)
+        self.assertEqual(result.missing, {item: (SkillRequirementErrorData(skill=50, level=2, required_level=3),)})
+
+    def test_fail_absent(self):
+        item = self.make_item(ModuleHigh, {50: 3})
+        fit = self.make_fit(item)
+        result, = check_skill_profiles(fit, [SkillProfile({48: 5})])
+        self.assertIs(result.passed, False)
+        self.assertEqual(result.missing, {item: (SkillRequirementErrorData(skill=50, level=None, required_level=3),)})
+
+    def test_multiple_profiles(self):
+        item1 = self.make_item(ModuleHigh, {50: 3})
+        item2 = self.make_item(Implant, {48: 1})
+        fit = self.make_fit(item1, item2)
+        results = check_skill_profiles(fit, [
+            SkillProfile({50: 5, 48: 1}),
+            SkillProfile({50: 5}),
+            SkillProfile({50: 1, 48: 0})
+        ])
+        self.assertIs(results[0].passed, True)
+        self.assertIs(results[1].passed, False)
+        self.assertEqual(results[1].missing, {item2: (SkillRequirementErrorData(skill=48, level=None, required_level=1),)})
+        self.assertIs(results[2].passed, False)
+        self.assertEqual(results[2].missing, {
+            item1: (SkillRequirementErrorData(skill=50, level=1, required_level=3),),
+            item2: (SkillRequirementErrorData(skill=48, level=0, required_level=1),)
+        })
+
+    def test_rig_exception(self):
+        item = self.make_item(Rig, {50: 3})
+        fit = self.make_fit(item)
+        result, = check_skill_profiles(fit, [SkillProfile({})])
+        self.assertIs(result.passed, True)
+
+    def test_no_requirements(self):
+        item = self.make_item(ModuleHigh, {})
+        fit = self.make_fit(item)
+        result, = check_skill_profiles(fit, [SkillProfile({})])
+        self.assertIs(result.passed, True)
+
+    def test_no_source(self):
+        item = self.make_item(ModuleHigh, {50: 3})
+        fit = self.make_fit(item)
+        fit.source = None
+        result, = check_skill_profiles(fit, [SkillProfile({})])
+        self.assertIs(result.passed, True)
+
+    def test_no_profiles(self):
+        item = self.make_item(ModuleHigh, {50: 3})
+        fit = self.make_fit(item)
+        self.assertEqual(check_skill_profiles(fit, []), [])
+
+
+class TestSkillProfilePython(SkillProfileTests, EosTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(skill_profile, 'numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if numpy is not None:
+
+    class TestSkillProfileNumpy(SkillProfileTests, EosTestCase):
+        pass
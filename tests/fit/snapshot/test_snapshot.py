@@ -0,0 +1,150 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import patch
+
+from eos.const.eos import State
+from eos.const.eve import EffectCategory, Type
+from eos.data.source import Source
+from eos.fit.item import Booster, Charge, Drone, Implant, ModuleHigh, ModuleLow, Rig, Ship, Skill
+from eos.fit.snapshot import SnapshotError, dump_snapshot, load_snapshot
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+@patch('eos.fit.snapshot.Fit', new=Fit)
+class TestFitSnapshot(FitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.effect = self.ch.effect(effect_id=1, category=EffectCategory.passive)
+        for type_id in range(1, 10):
+            self.ch.type(type_id=type_id, effects=(self.effect,))
+        self.ch.type(type_id=Type.character_static)
+        self.source = Source('test', self.ch)
+
+    def make_fit(self):
+        fit = Fit(source=self.source)
+        fit.ship = Ship(1)
+        fit.modules.high.place(1, ModuleHigh(2, state=State.active, charge=Charge(3)))
+        fit.modules.low.append(ModuleLow(4, state=State.online))
+        fit.rigs.add(Rig(5))
+        fit.drones.add(Drone(6, state=State.active))
+        fit.implants.add(Implant(7))
+        fit.boosters.add(Booster(8))
+        fit.skills.add(Skill(9, level=3))
+        return fit
+
+    def test_containers(self):
+        fit = self.make_fit()
+        # Action
+        restored = load_snapshot(dump_snapshot(fit), source=self.source)
+        # Verification
+        self.assertIsNot(restored, fit)
+        self.assertEqual(restored.ship._eve_type_id, 1)
+        self.assertIsNone(restored.stance)
+        self.assertEqual(len(restored.modules.high), 2)
+        self.assertIsNone(restored.modules.high[0])
+        module = restored.modules.high[1]
+        self.assertEqual(module._eve_type_id, 2)
+        self.assertIs(module.state, State.active)
+        self.assertEqual(module.charge._eve_type_id, 3)
+        self.assertIs(restored.modules.low[0].state, State.online)
+        self.assertIsNone(restored.modules.low[0].charge)
+        self.assertEqual([i._eve_type_id for i in restored.rigs], [5])
+        drone = next(iter(restored.drones))
+        self.assertEqual(drone._eve_type_id, 6)
+        self.assertIs(drone.state, State.active)
+        self.assertEqual([i._eve_type_id for i in restored.implants], [7])
+        self.assertEqual([i._eve_type_id for i in restored.boosters], [8])
+        skill = next(iter(restored.skills))
+        self.assertEqual(skill._eve_type_id, 9)
+        self.assertEqual(skill.level, 3)
+
+    def test_effects_overrides(self):
+        fit = self.make_fit()
+        fit.ship._set_effects_status((self.effect.id,), False)
+        fit.ship.attributes._override_set(100, 5.5, persist=True)
+        fit.ship.attributes._override_set(101, 6.5)
+        # Action
+        restored = load_snapshot(dump_snapshot(fit), source=self.source)
+        # Verification
+        self.assertEqual(restored.ship._disabled_effects, {self.effect.id})
+        overrides = restored.ship.attributes._overrides
+        self.assertEqual(set(overrides), {100})
+        self.assertEqual(overrides[100].value, 5.5)
+        self.assertIs(overrides[100].persistent, True)
+
+    def test_values(self):
+        fit = self.make_fit()
+        fit.ship.attributes._load_values({100: 1.5, 101: 2}, {102: {100}})
+        data = dump_snapshot(fit, values=True)
+        # Action
+        restored = load_snapshot(data, source=self.source)
+        # Verification
+        self.assertEqual(restored.ship.attributes._dump_values(), ({100: 1.5, 101: 2}, {102: {100}}))
+
+    def test_values_fingerprint_mismatch(self):
+        fit = self.make_fit()
+        fit.ship.attributes._load_values({100: 1.5}, {})
+        data = dump_snapshot(fit, values=True)
+        self.ch.fingerprint = 'other_fingerprint'
+        # Action
+        restored = load_snapshot(data, source=self.source)
+        # Verification
+        self.assertEqual(restored.ship.attributes._dump_values(), ({}, {}))
+        self.assertEqual(restored.ship._eve_type_id, 1)
+
+    def test_values_fingerprint_empty(self):
+        # Sources without fingerprint are indistinguishable,
+        # thus values should not be restored
+        self.ch.fingerprint = None
+        fit = self.make_fit()
+        fit.ship.attributes._load_values({100: 1.5}, {})
+        data = dump_snapshot(fit, values=True)
+        # Action
+        restored = load_snapshot(data, source=self.source)
+        # Verification
+        self.assertEqual(restored.ship.attributes._dump_values(), ({}, {}))
+        self.assertEqual(restored.ship._eve_type_id, 1)
+
+    def test_no_values(self):
+        fit = self.make_fit()
+        fit.ship.attributes._load_values({100: 1.5}, {})
+        # Action
+        restored = load_snapshot(dump_snapshot(fit), source=self.source)
+        # Verification
+        self.assertEqual(restored.ship.attributes._dump_values(), ({}, {}))
+
+    def test_not_snapshot(self):
+        with self.assertRaises(SnapshotError):
+            load_snapshot(b'junk data', source=self.source)
+
+    def test_version(self):
+        data = bytearray(dump_snapshot(self.make_fit()))
+        data[4] = 99
+        with self.assertRaises(SnapshotError):
+            load_snapshot(bytes(data), source=self.source)
+
+    def test_truncated(self):
+        data = dump_snapshot(self.make_fit())
+        with self.assertRaises(SnapshotError):
+            load_snapshot(data[:-3], source=self.source)
@@ -0,0 +1,183 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import patch
+
+from eos.const.eos import ModifierDomain, ModifierOperator, ModifierTargetFilter, State
+from eos.const.eve import EffectCategory, Type
+from eos.data.cache_object.modifier import DogmaModifier
+from eos.data.source import Source
+from eos.fit import Fit as EosFit
+from eos.fit.item import Drone, Implant, ModuleHigh, Ship
+from eos.fit.messages import EnableServices, DisableServices, RefreshSource
+from tests.environment import CacheHandler
+from tests.eos_testcase import EosTestCase
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+@patch('eos.fit.fit.SourceManager')
+class FitSourceSwitchDiff(FitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.ch2 = CacheHandler()
+        for ch, drone_value in ((self.ch, 5), (self.ch2, 7)):
+            ch.attribute(attribute_id=100)
+            effect = ch.effect(effect_id=1, category=EffectCategory.passive)
+            ch.type(type_id=Type.character_static)
+            ch.type(type_id=1, attributes={100: 10})
+            ch.type(type_id=2, attributes={100: 2}, effects=(effect,))
+            ch.type(type_id=3, attributes={100: drone_value})
+        self.source1 = Source('src1', self.ch)
+        self.source2 = Source('src2', self.ch2)
+
+    def make_fit(self):
+        fit = Fit(source=self.source1)
+        fit.ship = Ship(1)
+        fit.modules.high.append(ModuleHigh(2))
+        fit.drones.add(Drone(3))
+        return fit
+
+    def get_messages(self, fit, action):
+        messages_before = len(fit.message_store)
+        action()
+        return fit.message_store[messages_before:]
+
+    def test_changed(self, source_mgr):
+        fit = self.make_fit()
+        ship = fit.ship
+        module = fit.modules.high[0]
+        drone = next(iter(fit.drones))
+        old_ship_type = ship._eve_type
+        # Action
+        messages = self.get_messages(fit, lambda: fit.switch_source(self.source2))
+        # Verification
+        self.assertIs(fit.source, self.source2)
+        self.assertEqual([type(m) for m in messages], [DisableServices, EnableServices])
+        self.assertEqual(set(messages[0].items), {drone})
+        self.assertEqual(set(messages[1].items), {drone})
+        self.assertIs(ship._eve_type, old_ship_type)
+        self.assertIs(drone._eve_type, self.ch2.get_type(3))
+        self.assertIsNot(module._eve_type, self.ch2.get_type(2))
+        # Cleanup
+        fit.ship = None
+        fit.modules.high.clear()
+        fit.drones.clear()
+        fit.source = None
+        self.assert_fit_buffers_empty(fit)
+
+    def test_unchanged(self, source_mgr):
+        fit = self.make_fit()
+        self.ch2.get_type(3).attributes[100] = 5
+        # Action
+        messages = self.get_messages(fit, lambda: fit.switch_source(self.source2))
+        # Verification
+        self.assertIs(fit.source, self.source2)
+        self.assertEqual(messages, [])
+        # Cleanup
+        fit.ship = None
+        fit.modules.high.clear()
+        fit.drones.clear()
+        fit.source = None
+        self.assert_fit_buffers_empty(fit)
+
+    def test_attribute_metadata(self, source_mgr):
+        fit = self.make_fit()
+        self.ch2.get_attribute(100).stackable = True
+        # Action
+        messages = self.get_messages(fit, lambda: fit.switch_source(self.source2))
+        # Verification
+        self.assertIs(fit.source, self.source2)
+        self.assertEqual([type(m) for m in messages], [DisableServices, RefreshSource, EnableServices])
+        self.assertIs(fit.ship._eve_type, self.ch2.get_type(1))
+        # Cleanup
+        fit.ship = None
+        fit.modules.high.clear()
+        fit.drones.clear()
+        fit.source = None
+        self.assert_fit_buffers_empty(fit)
+
+    def test_from_none(self, source_mgr):
+        source_mgr.default = None
+        fit = Fit(source=None)
+        fit.ship = Ship(1)
+        # Action
+        messages = self.get_messages(fit, lambda: fit.switch_source(self.source2))
+        # Verification
+        self.assertEqual([type(m) for m in messages], [RefreshSource, EnableServices])
+        self.assertIs(fit.ship._eve_type, self.ch2.get_type(1))
+        # Cleanup
+        fit.ship = None
+        fit.source = None
+        self.assert_fit_buffers_empty(fit)
+
+
+class FitSourceSwitchDiffValues(EosTestCase):
+    """Check calculated values on fit with real services"""
+
+    def make_source(self, alias, bonus):
+        cache_handler = CacheHandler()
+        cache_handler.attribute(attribute_id=100)
+        cache_handler.attribute(attribute_id=101)
+        modifier = DogmaModifier()
+        modifier.state = State.offline
+        modifier.tgt_filter = ModifierTargetFilter.item
+        modifier.tgt_domain = ModifierDomain.ship
+        modifier.tgt_attr = 100
+        modifier.operator = ModifierOperator.post_percent
+        modifier.src_attr = 101
+        effect = cache_handler.effect(effect_id=1, category=EffectCategory.passive)
+        effect.modifiers = (modifier,)
+        cache_handler.type(type_id=Type.character_static)
+        cache_handler.type(type_id=1, attributes={100: 100})
+        cache_handler.type(type_id=2, attributes={100: 2})
+        cache_handler.type(type_id=3, attributes={101: bonus}, effects=(effect,))
+        return Source(alias, cache_handler)
+
+    def test_changed_modifier_source(self):
+        source1 = self.make_source('src1', 10)
+        source2 = self.make_source('src2', 50)
+        fit = EosFit(source=source1, restrictions=False, stats=False)
+        fit.ship = Ship(1)
+        module = ModuleHigh(2, state=State.online)
+        fit.modules.high.append(module)
+        implant = Implant(3)
+        fit.implants.add(implant)
+        self.assertAlmostEqual(fit.ship.attributes[100], 110)
+        self.assertAlmostEqual(module.attributes[100], 2)
+        ship_type = fit.ship._eve_type
+        module_values = module.attributes._dump_values()
+        # Action
+        fit.switch_source(source2)
+        # Verification
+        # Module is not affected by changes, thus its values are kept
+        self.assertEqual(module.attributes._dump_values(), module_values)
+        self.assertAlmostEqual(fit.ship.attributes[100], 150)
+        self.assertAlmostEqual(module.attributes[100], 2)
+        self.assertIs(fit.ship._eve_type, ship_type)
+        self.assertIs(implant._eve_type, source2.cache_handler.get_type(3))
+        # Action
+        fit.switch_source(source1)
+        # Verification
+        self.assertAlmostEqual(fit.ship.attributes[100], 110)
+        self.assertAlmostEqual(module.attributes[100], 2)
+        self.assertEqual(len(self.log), 0)
@@ -0,0 +1,113 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.fit.item import Charge, Drone, Implant, ModuleHigh, ModuleMed, Rig, Ship, Skill
+from eos.fit.spec import _fill_fit, get_fit_spec
+from eos.fit.tuples import DroneSpec, FitSpec, ModuleSpec
+from tests.fit.environment import Fit
+from tests.fit.fit_testcase import FitTestCase
+
+
+class TestFitSpec(FitTestCase):
+
+    def test_fill(self):
+        fit = Fit()
+        spec = FitSpec(
+            ship=1,
+            high=(None, ModuleSpec(2, State.active, 3)),
+            med=(ModuleSpec(4),),
+            rigs=(5,),
+            drones=(DroneSpec(6, State.online), DroneSpec(6)),
+            implants=(7,),
+            skills={8: 5}
+        )
+        # Action
+        locations = _fill_fit(fit, spec)
+        # Verification
+        self.assertIsInstance(fit.ship, Ship)
+        self.assertEqual(fit.ship._eve_type_id, 1)
+        self.assertIsNone(fit.stance)
+        self.assertEqual(len(fit.modules.high), 2)
+        self.assertIsNone(fit.modules.high[0])
+        module = fit.modules.high[1]
+        self.assertIsInstance(module, ModuleHigh)
+        self.assertEqual(module._eve_type_id, 2)
+        self.assertIs(module.state, State.active)
+        self.assertIsInstance(module.charge, Charge)
+        self.assertEqual(module.charge._eve_type_id, 3)
+        self.assertIsInstance(fit.modules.med[0], ModuleMed)
+        self.assertIs(fit.modules.med[0].state, State.offline)
+        self.assertIsNone(fit.modules.med[0].charge)
+        self.assertEqual(len(fit.modules.low), 0)
+        rig = next(iter(fit.rigs))
+        self.assertIsInstance(rig, Rig)
+        self.assertEqual(len(fit.drones), 2)
+        self.assertEqual(sorted(d.state for d in fit.drones), [State.offline, State.online])
+        implant = next(iter(fit.implants))
+        self.assertIsInstance(implant, Implant)
+        skill = next(iter(fit.skills))
+        self.assertIsInstance(skill, Skill)
+        self.assertEqual(skill.level, 5)
+        self.assertEqual(locations[fit.ship], ('ship',))
+        self.assertEqual(locations[module], ('high', 1))
+        self.assertEqual(locations[module.charge], ('high', 1, 'charge'))
+        self.assertEqual(locations[fit.modules.med[0]], ('med', 0))
+        self.assertEqual(locations[rig], ('rigs', 0))
+        self.assertEqual(locations[implant], ('implants', 0))
+        self.assertEqual(locations[skill], ('skills', 0))
+        self.assertEqual(sorted(locations[d] for d in fit.drones), [('drones', 0), ('drones', 1)])
+
+    def test_get_spec(self):
+        fit = Fit()
+        fit.ship = Ship(1)
+        fit.modules.high.place(1, ModuleHigh(2, state=State.online, charge=Charge(3)))
+        fit.drones.add(Drone(4, state=State.active))
+        fit.implants.add(Implant(5))
+        fit.skills.add(Skill(6, level=3))
+        # Action
+        spec = get_fit_spec(fit)
+        # Verification
+        self.assertEqual(spec, FitSpec(
+            ship=1,
+            high=(None, ModuleSpec(2, State.online, 3)),
+            drones=(DroneSpec(4, State.active),),
+            implants=(5,),
+            skills=((6, 3),)
+        ))
+
+    def test_round_trip(self):
+        spec = FitSpec(
+            ship=1,
+            stance=2,
+            high=(ModuleSpec(3, State.overload, 4), None, ModuleSpec(3)),
+            low=(ModuleSpec(5, State.online),),
+            subsystems=(6, 7),
+            boosters=(8,),
+            drones=(DroneSpec(9), DroneSpec(9, State.active)),
+            skills=((10, 1), (11, 4))
+        )
+        fit = Fit()
+        _fill_fit(fit, spec)
+        # Action
+        result = get_fit_spec(fit)
+        # Verification
+        self.assertEqual(result, spec)
@@ -23,200 +23,305 @@ from unittest.mock import Mock, call
 
 from eos.fit.messages import (
     ItemAdded, ItemRemoved, ItemStateChanged, EffectsEnabled, EffectsDisabled,
-    AttrValueChangedOverride, RefreshSource
+    ItemPositionsChanged, AttrValueChanged, AttrValueChangedOverride, RefreshSource
+)
+from eos.fit.volatile import FIT_COMPOSITION
+from eos.util.volatile_cache import (
+    InheritableVolatileMixin, CooperativeVolatileMixin, VolatileProperty, track_volatile_dependency
 )
-from eos.util.volatile_cache import InheritableVolatileMixin, CooperativeVolatileMixin
 from tests.fit.environment import Fit
 from tests.fit.fit_testcase import FitTestCase
 
 
+class VolatileCarrier(InheritableVolatileMixin):
+    """
+    Object with volatile property which reads passed
+    dependencies, and which counts its calculations.
+    """
+
+    def __init__(self, fit, dependencies, nested=None):
+        InheritableVolatileMixin.__init__(self)
+        self._fit = fit
+        self.dependencies = dependencies
+        self.nested = nested
+        self.calculations = 0
+
+    @VolatileProperty
+    def value(self):
+        for key in self.dependencies:
+            track_volatile_dependency(key)
+        if self.nested is not None:
+            self.nested.value
+        self.calculations += 1
+        return self.calculations
+
+
+class CooperativeVolatileCarrier(CooperativeVolatileMixin):
+    """
+    Cooperative object with volatile property which
+    counts its calculations.
+    """
+
+    def __init__(self, fit):
+        super().__init__()
+        self._fit = fit
+        self.calculations = 0
+
+    @VolatileProperty
+    def value(self):
+        self.calculations += 1
+        return self.calculations
+
+
 class TestVolatileData(FitTestCase):
 
-    def test_carrier_builtin(self):
+    def read_all(self, *carriers):
+        for carrier in carriers:
+            self.assertEqual(carrier.value, 1)
+
+    def test_message_refresh_source(self):
         # Setup
         fit = Fit()
+        item = Mock(spec=InheritableVolatileMixin)
+        carrier_inheritable = VolatileCarrier(fit, ())
+        carrier_cooperative = CooperativeVolatileCarrier(fit)
+        fit._publish(ItemAdded(item))
+        fit._publish(ItemAdded(carrier_inheritable))
+        fit._publish(ItemAdded(carrier_cooperative))
+        self.read_all(carrier_inheritable, carrier_cooperative)
+        item_calls_before = len(item.mock_calls)
         ss_calls_before = len(fit.stats.mock_calls)
         # Action
         fit._publish(RefreshSource())
         # Verification
+        self.assertEqual(carrier_inheritable.value, 2)
+        self.assertEqual(carrier_cooperative.value, 2)
+        # Objects are not visited when everything is cleared
+        item_calls_after = len(item.mock_calls)
+        self.assertEqual(item_calls_after - item_calls_before, 0)
         ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(ss_calls_after - ss_calls_before, 0)
         # Cleanup
+        fit._publish(ItemRemoved(item))
+        fit._publish(ItemRemoved(carrier_inheritable))
+        fit._publish(ItemRemoved(carrier_cooperative))
         self.assert_fit_buffers_empty(fit)
 
-    def test_carrier_inheritable(self):
+    def test_value_calculated_without_fit(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
+        carrier = VolatileCarrier(None, ())
+        self.read_all(carrier)
         # Action
-        fit._publish(RefreshSource())
+        carrier._fit = fit
+        fit._publish(ItemAdded(carrier))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(carrier.value, 2)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
 
-    def test_carrier_cooperative(self):
+    def test_message_item_added(self):
         # Setup
-        item = Mock(spec=CooperativeVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
+        item = Mock(spec=InheritableVolatileMixin)
+        carrier_composition = VolatileCarrier(fit, (FIT_COMPOSITION,))
+        carrier_item = VolatileCarrier(fit, (item,))
+        carrier_other = VolatileCarrier(fit, ((item, 1),))
+        fit._publish(ItemAdded(carrier_composition))
+        fit._publish(ItemAdded(carrier_item))
+        fit._publish(ItemAdded(carrier_other))
+        self.read_all(carrier_composition, carrier_item, carrier_other)
         # Action
-        fit._publish(RefreshSource())
+        fit._publish(ItemAdded(item))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(carrier_composition.value, 2)
+        self.assertEqual(carrier_item.value, 2)
+        self.assertEqual(carrier_other.value, 1)
+        self.assertEqual(len(item.mock_calls), 0)
         # Cleanup
         fit._publish(ItemRemoved(item))
+        fit._publish(ItemRemoved(carrier_composition))
+        fit._publish(ItemRemoved(carrier_item))
+        fit._publish(ItemRemoved(carrier_other))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_item_added(self):
+    def test_message_item_removed(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
-        item_other = Mock()
         fit = Fit()
+        item = Mock(spec=InheritableVolatileMixin)
+        carrier_composition = VolatileCarrier(fit, (FIT_COMPOSITION,))
+        carrier_item = VolatileCarrier(fit, (item,))
+        carrier_other = VolatileCarrier(fit, ((item, 1),))
         fit._publish(ItemAdded(item))
+        fit._publish(ItemAdded(carrier_composition))
+        fit._publish(ItemAdded(carrier_item))
+        fit._publish(ItemAdded(carrier_other))
+        self.read_all(carrier_composition, carrier_item, carrier_other)
         item_calls_before = len(item.mock_calls)
-        ss_calls_before = len(fit.stats.mock_calls)
         # Action
-        fit._publish(ItemAdded(item_other))
+        fit._publish(ItemRemoved(item))
         # Verification
+        self.assertEqual(carrier_composition.value, 2)
+        self.assertEqual(carrier_item.value, 2)
+        self.assertEqual(carrier_other.value, 1)
         item_calls_after = len(item.mock_calls)
-        ss_calls_after = len(fit.stats.mock_calls)
         self.assertEqual(item_calls_after - item_calls_before, 1)
         self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
         # Cleanup
-        fit._publish(ItemRemoved(item))
-        fit._publish(ItemRemoved(item_other))
+        fit._publish(ItemRemoved(carrier_composition))
+        fit._publish(ItemRemoved(carrier_item))
+        fit._publish(ItemRemoved(carrier_other))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_item_removed(self):
+    def test_message_item_removed_own_data(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
-        item_other = Mock()
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        fit._publish(ItemAdded(item_other))
-        item_calls_before = len(item.mock_calls)
-        ss_calls_before = len(fit.stats.mock_calls)
+        carrier = VolatileCarrier(fit, ())
+        fit._publish(ItemAdded(carrier))
+        self.read_all(carrier)
         # Action
-        fit._publish(ItemRemoved(item_other))
+        fit._publish(ItemRemoved(carrier))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(len(carrier._volatile_attrs), 0)
         # Cleanup
-        fit._publish(ItemRemoved(item))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_item_state_changed(self):
+    def test_message_charge_added(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
-        ss_calls_before = len(fit.stats.mock_calls)
+        container = Mock()
+        charge = Mock(spec_set=('container',), container=container)
+        carrier = VolatileCarrier(fit, (container,))
+        fit._publish(ItemAdded(carrier))
+        self.read_all(carrier)
         # Action
-        fit._publish(ItemStateChanged(None, None, None))
+        fit._publish(ItemAdded(charge))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(carrier.value, 2)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        fit._publish(ItemRemoved(charge))
+        fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
 
+    def test_message_item_state_changed(self):
+        self._test_item_message(lambda item: ItemStateChanged(item, None, None))
+
     def test_message_effects_enabled(self):
+        self._test_item_message(lambda item: EffectsEnabled(item, None))
+
+    def test_message_effects_disabled(self):
+        self._test_item_message(lambda item: EffectsDisabled(item, None))
+
+    def test_message_item_positions_changed(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
-        ss_calls_before = len(fit.stats.mock_calls)
+        item = Mock()
+        carrier_composition = VolatileCarrier(fit, (FIT_COMPOSITION,))
+        carrier_item = VolatileCarrier(fit, (item,))
+        carriers = (carrier_composition, carrier_item)
+        for carrier in carriers:
+            fit._publish(ItemAdded(carrier))
+        self.read_all(*carriers)
         # Action
-        fit._publish(EffectsEnabled(None, None))
+        fit._publish(ItemPositionsChanged(Mock()))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(carrier_composition.value, 2)
+        self.assertEqual(carrier_item.value, 1)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        for carrier in carriers:
+            fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_effects_disabled(self):
+    def test_message_attr_changed(self):
+        self._test_attr_message(AttrValueChanged)
+
+    def test_message_override(self):
+        self._test_attr_message(AttrValueChangedOverride)
+
+    def _test_item_message(self, message_factory):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
+        item = Mock()
+        item_other = Mock()
+        carrier_composition = VolatileCarrier(fit, (FIT_COMPOSITION,))
+        carrier_item = VolatileCarrier(fit, (item,))
+        carrier_attr = VolatileCarrier(fit, ((item, 1),))
+        carrier_other = VolatileCarrier(fit, (item_other,))
+        carriers = (carrier_composition, carrier_item, carrier_attr, carrier_other)
+        for carrier in carriers:
+            fit._publish(ItemAdded(carrier))
+        self.read_all(*carriers)
         ss_calls_before = len(fit.stats.mock_calls)
         # Action
-        fit._publish(EffectsDisabled(None, None))
+        fit._publish(message_factory(item))
         # Verification
-        item_calls_after = len(item.mock_calls)
+        self.assertEqual(carrier_composition.value, 1)
+        self.assertEqual(carrier_item.value, 2)
+        self.assertEqual(carrier_attr.value, 1)
+        self.assertEqual(carrier_other.value, 1)
         ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(ss_calls_after - ss_calls_before, 0)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        for carrier in carriers:
+            fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_override(self):
+    def _test_attr_message(self, message_type):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
+        item = Mock()
+        carrier_item = VolatileCarrier(fit, (item,))
+        carrier_attr = VolatileCarrier(fit, ((item, 1),))
+        carrier_attr_other = VolatileCarrier(fit, ((item, 2),))
+        carriers = (carrier_item, carrier_attr, carrier_attr_other)
+        for carrier in carriers:
+            fit._publish(ItemAdded(carrier))
+        self.read_all(*carriers)
         ss_calls_before = len(fit.stats.mock_calls)
         # Action
-        fit._publish(AttrValueChangedOverride(None, None))
+        fit._publish(message_type(item, 1))
         # Verification
-        item_calls_after = len(item.mock_calls)
+        self.assertEqual(carrier_item.value, 1)
+        self.assertEqual(carrier_attr.value, 2)
+        self.assertEqual(carrier_attr_other.value, 1)
         ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(ss_calls_after - ss_calls_before, 0)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        for carrier in carriers:
+            fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
 
-    def test_message_refresh_source(self):
+    def test_nested_dependencies(self):
         # Setup
-        item = Mock(spec=InheritableVolatileMixin)
         fit = Fit()
-        fit._publish(ItemAdded(item))
-        item_calls_before = len(item.mock_calls)
-        ss_calls_before = len(fit.stats.mock_calls)
+        item = Mock()
+        carrier_inner = VolatileCarrier(fit, ((item, 1),))
+        carrier_outer = VolatileCarrier(fit, (), nested=carrier_inner)
+        fit._publish(ItemAdded(carrier_inner))
+        fit._publish(ItemAdded(carrier_outer))
+        self.read_all(carrier_outer)
         # Action
-        fit._publish(RefreshSource())
+        fit._publish(AttrValueChanged(item, 1))
         # Verification
-        item_calls_after = len(item.mock_calls)
-        ss_calls_after = len(fit.stats.mock_calls)
-        self.assertEqual(item_calls_after - item_calls_before, 1)
-        self.assertEqual(item.mock_calls[-1], call._clear_volatile_attrs())
-        self.assertEqual(ss_calls_after - ss_calls_before, 1)
-        self.assertEqual(fit.stats.mock_calls[-1], call._clear_volatile_attrs())
+        self.assertEqual(carrier_outer.value, 2)
+        self.assertEqual(carrier_inner.value, 2)
         # Cleanup
-        fit._publish(ItemRemoved(item))
+        fit._publish(ItemRemoved(carrier_outer))
+        fit._publish(ItemRemoved(carrier_inner))
+        self.assert_fit_buffers_empty(fit)
+
+    def test_explicit_invalidation(self):
+        # Setup
+        fit = Fit()
+        key = object()
+        carrier = VolatileCarrier(fit, (key,))
+        fit._publish(ItemAdded(carrier))
+        self.read_all(carrier)
+        # Action
+        fit._volatile_mgr._invalidate(key)
+        # Verification
+        self.assertEqual(carrier.value, 2)
+        # Cleanup
+        fit._publish(ItemRemoved(carrier))
         self.assert_fit_buffers_empty(fit)
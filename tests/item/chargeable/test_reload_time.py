@@ -32,7 +32,6 @@ class TestItemMixinChargeReloadTime(ItemMixinTestCase):
         super().setUp()
         self.item = ModuleHigh(type_id=None)
         self.item._eve_type = Mock()
-        self.item._clear_volatile_attrs = Mock()
         self.item.attributes = {}
 
     def test_generic(self):
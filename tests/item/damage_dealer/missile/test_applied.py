@@ -0,0 +1,85 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.const.eve import Attribute, Effect
+from eos.fit.item.mixin.damage_dealer import DamageDealerMixin
+from eos.fit.tuples import TargetData
+from tests.item.item_testcase import ItemMixinTestCase
+
+
+class TestItemMixinDamageMissileApplied(ItemMixinTestCase):
+
+    def setUp(self):
+        super().setUp()
+        mixin = self.instantiate_mixin(DamageDealerMixin, type_id=None)
+        mixin._eve_type = Mock()
+        mixin._eve_type.default_effect.id = Effect.use_missiles
+        mixin._eve_type.default_effect._state = State.active
+        mixin.attributes = {}
+        mixin.state = State.active
+        mixin.cycle_time = 0.5
+        mixin.reactivation_delay = None
+        mixin.charge = Mock()
+        mixin.charge._eve_type.default_effect.id = Effect.missile_launching
+        mixin.charge.attributes = {
+            Attribute.em_damage: 10,
+            Attribute.thermal_damage: 0,
+            Attribute.kinetic_damage: 0,
+            Attribute.explosive_damage: 0,
+            Attribute.max_velocity: 4000,
+            Attribute.explosion_delay: 10000,
+            Attribute.aoe_cloud_size: 100,
+            Attribute.aoe_velocity: 100,
+            Attribute.aoe_damage_reduction_factor: 0.5
+        }
+        mixin.charged_cycles = 20
+        mixin.reload_time = 10
+        self.mixin = mixin
+
+    def test_volley(self):
+        target = TargetData(
+            distance=[1000, 1000, 1000, 50000], transversal=0,
+            signature_radius=[200, 50, 200, 200], velocity=[0, 0, 500, 0])
+        volley = self.mixin.get_volley_vs_target(target)
+        self.assertAlmostEqual(volley.em[0], 10)
+        self.assertAlmostEqual(volley.em[1], 5)
+        self.assertAlmostEqual(volley.em[2], 10 * 0.4 ** 0.5)
+        self.assertAlmostEqual(volley.em[3], 0)
+
+    def test_dps(self):
+        target = TargetData(distance=1000, transversal=0, signature_radius=50, velocity=0)
+        dps = self.mixin.get_dps_vs_target(target, reload=False)
+        self.assertAlmostEqual(dps.em, 10)
+        self.assertAlmostEqual(dps.total, 10)
+
+    def test_no_chance_to_hit(self):
+        target = TargetData(distance=1000, transversal=0, signature_radius=50, velocity=0)
+        self.assertIsNone(self.mixin.get_chance_to_hit(target))
+
+    def test_no_explosion_data(self):
+        del self.mixin.charge.attributes[Attribute.aoe_velocity]
+        target = TargetData(distance=[1000, 50000], transversal=0, signature_radius=50, velocity=0)
+        volley = self.mixin.get_volley_vs_target(target)
+        self.assertAlmostEqual(volley.em[0], 10)
+        self.assertAlmostEqual(volley.em[1], 10)
@@ -0,0 +1,103 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.const.eve import Attribute, Effect
+from eos.fit.item.mixin.damage_dealer import DamageDealerMixin
+from eos.fit.tuples import TargetData
+from tests.item.item_testcase import ItemMixinTestCase
+
+
+class TestItemMixinDamageTurretApplied(ItemMixinTestCase):
+
+    def setUp(self):
+        super().setUp()
+        mixin = self.instantiate_mixin(DamageDealerMixin, type_id=None)
+        mixin._eve_type = Mock()
+        mixin._eve_type.default_effect.id = Effect.projectile_fired
+        mixin._eve_type.default_effect._state = State.active
+        mixin.attributes = {
+            Attribute.damage_multiplier: 2,
+            Attribute.max_range: 10000,
+            Attribute.falloff: 5000,
+            Attribute.tracking_speed: 0.1,
+            Attribute.optimal_sig_radius: 40000
+        }
+        mixin.state = State.active
+        mixin.cycle_time = 0.5
+        mixin.reactivation_delay = None
+        mixin.charge = Mock()
+        mixin.charge.attributes = {
+            Attribute.em_damage: 5,
+            Attribute.thermal_damage: 0,
+            Attribute.kinetic_damage: 10,
+            Attribute.explosive_damage: 0
+        }
+        mixin.charged_cycles = 10
+        mixin.reload_time = 5
+        self.mixin = mixin
+
+    def test_chance_to_hit(self):
+        target = TargetData(distance=[5000, 15000], transversal=0, signature_radius=100, velocity=0)
+        chances = self.mixin.get_chance_to_hit(target)
+        self.assertAlmostEqual(chances[0], 1)
+        self.assertAlmostEqual(chances[1], 0.5)
+
+    def test_volley(self):
+        target = TargetData(distance=[5000, 15000, 100000], transversal=0, signature_radius=100, velocity=0)
+        volley = self.mixin.get_volley_vs_target(target)
+        self.assertAlmostEqual(volley.em[0], 10 * 1.01505)
+        self.assertAlmostEqual(volley.em[1], 10 * (0.03 + 0.49 * (0.255 + 0.49)))
+        self.assertAlmostEqual(volley.em[2], 0)
+        self.assertAlmostEqual(volley.total[0], 30 * 1.01505)
+
+    def test_dps_resisted(self):
+        target = TargetData(distance=5000, transversal=0, signature_radius=100, velocity=0)
+        resistances = Mock(em=0.5, thermal=0, kinetic=0, explosive=0)
+        dps = self.mixin.get_dps_vs_target(target, target_resistances=resistances, reload=False)
+        self.assertAlmostEqual(dps.em, 10 * 1.01505)
+        self.assertAlmostEqual(dps.kinetic, 40 * 1.01505)
+        self.assertAlmostEqual(dps.total, 50 * 1.01505)
+
+    def test_dps_reload_default(self):
+        # Reload is ignored by default, same as for nominal DPS
+        target = TargetData(distance=5000, transversal=0, signature_radius=100, velocity=0)
+        dps = self.mixin.get_dps_vs_target(target)
+        self.assertAlmostEqual(dps.total, self.mixin.get_nominal_dps().total * 1.01505)
+        reload_dps = self.mixin.get_dps_vs_target(target, reload=True)
+        self.assertLess(reload_dps.total, dps.total)
+
+    def test_no_tracking(self):
+        del self.mixin.attributes[Attribute.tracking_speed]
+        target = TargetData(distance=[5000, 100000], transversal=0, signature_radius=100, velocity=0)
+        self.assertIsNone(self.mixin.get_chance_to_hit(target))
+        volley = self.mixin.get_volley_vs_target(target)
+        self.assertAlmostEqual(volley.em[0], 10)
+        self.assertAlmostEqual(volley.em[1], 10)
+
+    def test_insufficient_state(self):
+        self.mixin.state = State.online
+        target = TargetData(distance=[5000, 15000], transversal=0, signature_radius=100, velocity=0)
+        volley = self.mixin.get_volley_vs_target(target)
+        self.assertIsNone(volley.em)
+        self.assertIsNone(volley.total)
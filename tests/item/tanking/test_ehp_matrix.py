@@ -0,0 +1,111 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock, patch
+
+from eos.fit import ehp
+from eos.fit.item.mixin.tanking import BufferTankingMixin
+from eos.fit.tuples import TankingLayersTotal
+from eos.util.numpy_support import numpy
+from tests.item.item_testcase import ItemMixinTestCase
+
+
+class EhpMatrixTests:
+
+    def setUp(self):
+        super().setUp()
+        mixin = self.instantiate_mixin(BufferTankingMixin, type_id=None)
+        mixin.hp = Mock(hull=10, armor=50, shield=600)
+        mixin.resistances = Mock()
+        mixin.resistances.hull = Mock(em=0.1, thermal=0.2, kinetic=0.3, explosive=0.4)
+        mixin.resistances.armor = Mock(em=0.6, thermal=0.4, kinetic=0.2, explosive=0.1)
+        mixin.resistances.shield = Mock(em=0, thermal=0.2, kinetic=0.4, explosive=0.5)
+        mixin.attributes = {}
+        self.mixin = mixin
+        self.profiles = (
+            Mock(em=25, thermal=6, kinetic=8.333, explosive=1),
+            Mock(em=1, thermal=1, kinetic=1, explosive=1),
+            Mock(em=0, thermal=0, kinetic=0, explosive=3)
+        )
+
+    def test_matches_single_profile(self):
+        mixin = self.mixin
+        rows = mixin.get_ehp_matrix(self.profiles)
+        self.assertEqual(len(rows), 3)
+        for row, profile in zip(rows, self.profiles):
+            expected = mixin.get_ehp(profile)
+            self.assertIsInstance(row, TankingLayersTotal)
+            self.assertAlmostEqual(row.hull, expected.hull)
+            self.assertAlmostEqual(row.armor, expected.armor)
+            self.assertAlmostEqual(row.shield, expected.shield)
+            self.assertAlmostEqual(row.total, expected.total)
+
+    def test_missing_layer(self):
+        mixin = self.mixin
+        mixin.hp = Mock(hull=None, armor=0, shield=600)
+        mixin.resistances.shield = Mock(em=None, thermal=0.5, kinetic=0.5, explosive=0.5)
+        rows = mixin.get_ehp_matrix(self.profiles[1:2])
+        self.assertIsNone(rows[0].hull)
+        self.assertAlmostEqual(rows[0].armor, 0)
+        self.assertAlmostEqual(rows[0].shield, 600 / 0.625)
+        self.assertAlmostEqual(rows[0].total, 600 / 0.625)
+
+    def test_no_hp(self):
+        mixin = self.mixin
+        mixin.hp = Mock(hull=None, armor=None, shield=None)
+        rows = mixin.get_ehp_matrix(self.profiles[1:2])
+        self.assertEqual(rows, [TankingLayersTotal(hull=None, armor=None, shield=None, total=None)])
+
+    def test_no_profiles(self):
+        self.assertEqual(self.mixin.get_ehp_matrix(()), [])
+
+    def test_zero_profile(self):
+        profiles = (self.profiles[0], Mock(em=0, thermal=0, kinetic=0, explosive=0))
+        with self.assertRaises(ValueError):
+            self.mixin.get_ehp_matrix(profiles)
+
+
+class TestItemMixinTankingEhpMatrixPython(EhpMatrixTests, ItemMixinTestCase):
+
+    def setUp(self):
+        patcher = patch.object(ehp, 'numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if numpy is not None:
+
+    class TestItemMixinTankingEhpMatrixNumpy(EhpMatrixTests, ItemMixinTestCase):
+
+        def test_same_as_python(self):
+            self.mixin.hp = Mock(hull=None, armor=0, shield=600)
+            rows = self.mixin.get_ehp_matrix(self.profiles)
+            with patch.object(ehp, 'numpy', None):
+                expected = self.mixin.get_ehp_matrix(self.profiles)
+            self.assertEqual(len(rows), len(expected))
+            for row, expected_row in zip(rows, expected):
+                self.assertIsInstance(row, TankingLayersTotal)
+                self.assertIsNone(row.hull)
+                self.assertIsNone(expected_row.hull)
+                self.assertAlmostEqual(row.armor, expected_row.armor)
+                self.assertAlmostEqual(row.shield, expected_row.shield)
+                self.assertAlmostEqual(row.total, expected_row.total)
@@ -19,8 +19,6 @@
 # ===============================================================================
 
 
-from unittest.mock import Mock
-
 from eos.const.eve import Attribute
 from eos.fit.container import ItemSet
 from eos.fit.item import Ship
@@ -32,7 +30,6 @@ class TestItemMixinTankingHp(ItemMixinTestCase):
     def setUp(self):
         super().setUp()
         self.item = Ship(type_id=None)
-        self.item._clear_volatile_attrs = Mock()
         self.item.attributes = {}
 
     def make_fit(self, *args, **kwargs):
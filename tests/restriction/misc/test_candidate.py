@@ -0,0 +1,142 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import Restriction, State
+from eos.const.eve import Attribute
+from eos.fit.item import Charge, Drone, ModuleHigh
+from tests.restriction.restriction_testcase import RestrictionTestCase
+
+
+class TestCandidate(RestrictionTestCase):
+    """Check that items can be checked without adding them to fit"""
+
+    def setUp(self):
+        super().setUp()
+        self.fit.source.cache_handler = self.ch
+
+    def get_candidate_error(self, item, restriction, container=None):
+        skip_checks = set(Restriction).difference((restriction,))
+        errors = self.rs.check_candidate(item, container, skip_checks)
+        self.assertLessEqual(set(errors), {restriction})
+        return errors.get(restriction)
+
+    def test_pass(self):
+        self.ch.type(type_id=1, attributes={Attribute.cpu: 10})
+        self.fit.stats.cpu.used = 20
+        self.fit.stats.cpu.output = 40
+        item = ModuleHigh(1, state=State.online)
+        self.assertIsNone(self.get_candidate_error(item, Restriction.cpu))
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_resource(self):
+        self.ch.type(type_id=1, attributes={Attribute.cpu: 30})
+        self.fit.stats.cpu.used = 20
+        self.fit.stats.cpu.output = 40
+        item = ModuleHigh(1, state=State.online)
+        restriction_error = self.get_candidate_error(item, Restriction.cpu)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.output, 40)
+        self.assertEqual(restriction_error.total_use, 50)
+        self.assertEqual(restriction_error.item_use, 30)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_pass_resource_state(self):
+        # CPU is used only by online items
+        self.ch.type(type_id=1, attributes={Attribute.cpu: 30})
+        self.fit.stats.cpu.used = 20
+        self.fit.stats.cpu.output = 40
+        item = ModuleHigh(1, state=State.offline)
+        self.assertIsNone(self.get_candidate_error(item, Restriction.cpu))
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_state(self):
+        eve_type = self.ch.type(type_id=1)
+        eve_type.max_state = State.online
+        item = ModuleHigh(1, state=State.active)
+        restriction_error = self.get_candidate_error(item, Restriction.state)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.current_state, State.active)
+        self.assertCountEqual(restriction_error.allowed_states, (State.offline, State.online))
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_slot_amount(self):
+        self.ch.type(type_id=1)
+        self.fit.stats.high_slots.used = 2
+        self.fit.stats.high_slots.total = 2
+        restriction_error = self.get_candidate_error(ModuleHigh(1), Restriction.high_slot)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.slots_used, 3)
+        self.assertEqual(restriction_error.slots_max_allowed, 2)
+        # Drones do not take high slots
+        self.assertIsNone(self.get_candidate_error(Drone(1), Restriction.high_slot))
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_max_group(self):
+        eve_type = self.ch.type(type_id=1, group=6, attributes={Attribute.max_group_fitted: 1})
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.offline)
+        self.add_item(item)
+        restriction_error = self.get_candidate_error(ModuleHigh(1), Restriction.max_group_fitted)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.item_group, 6)
+        self.assertEqual(restriction_error.max_group, 1)
+        self.assertEqual(restriction_error.group_items, 2)
+        # Candidate is not registered
+        restriction_error = self.get_restriction_error(item, Restriction.max_group_fitted)
+        self.assertIsNone(restriction_error)
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_max_group_other(self):
+        # Candidate without restriction should fail if it
+        # violates restriction of item on fit
+        eve_type = self.ch.type(type_id=1, group=6, attributes={Attribute.max_group_fitted: 1})
+        self.ch.type(type_id=2, group=6)
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.offline)
+        self.add_item(item)
+        restriction_error = self.get_candidate_error(ModuleHigh(2), Restriction.max_group_fitted)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.max_group, 1)
+        self.assertEqual(restriction_error.group_items, 2)
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_fail_charge(self):
+        self.ch.type(type_id=1, attributes={Attribute.charge_size: 2})
+        container_eve_type = self.ch.type(type_id=2, attributes={Attribute.charge_size: 3})
+        container = self.make_item_mock(ModuleHigh, container_eve_type, state=State.offline)
+        container.charge = None
+        self.add_item(container)
+        restriction_error = self.get_candidate_error(Charge(1), Restriction.charge_size, container)
+        self.assertIsNotNone(restriction_error)
+        self.assertEqual(restriction_error.allowed_size, 3)
+        self.assertEqual(restriction_error.item_size, 2)
+        # Without container, charge is not checked
+        self.assertIsNone(self.get_candidate_error(Charge(1), Restriction.charge_size))
+        self.remove_item(container)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
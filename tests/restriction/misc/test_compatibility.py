@@ -0,0 +1,99 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eve import Attribute, Category, Effect, EffectCategory
+from eos.fit.restriction import CompatibilityIndex
+from tests.eos_testcase import EosTestCase
+
+
+class TestCompatibility(EosTestCase):
+    """Check functionality of source-level compatibility index"""
+
+    def setUp(self):
+        super().setUp()
+        self.hi_power = self.ch.effect(effect_id=Effect.hi_power, category=EffectCategory.passive)
+        self.rig_slot = self.ch.effect(effect_id=Effect.rig_slot, category=EffectCategory.passive)
+
+    def make_module(self, type_id, attributes):
+        return self.ch.type(
+            type_id=type_id, category=Category.module,
+            attributes=attributes, effects=(self.hi_power,))
+
+    def make_charge(self, type_id, group, attributes):
+        return self.ch.type(type_id=type_id, group=group, category=Category.charge, attributes=attributes)
+
+    def test_ship_type_group(self):
+        self.ch.type(type_id=1, group=10, category=Category.ship)
+        self.ch.type(type_id=2, group=11, category=Category.ship)
+        self.make_module(100, {})
+        self.make_module(101, {Attribute.can_fit_ship_type_1: 1})
+        self.make_module(102, {Attribute.can_fit_ship_group_3: 11})
+        self.make_module(103, {Attribute.can_fit_ship_type_2: 2, Attribute.can_fit_ship_group_1: 10})
+        index = CompatibilityIndex(self.ch)
+        self.assertEqual(index.get_ship_modules(1), {100, 101, 103})
+        self.assertEqual(index.get_ship_modules(2), {100, 102, 103})
+        self.assertEqual(len(self.log), 0)
+
+    def test_capital(self):
+        self.ch.type(type_id=1, category=Category.ship)
+        self.ch.type(type_id=2, category=Category.ship, attributes={Attribute.is_capital_size: 1})
+        self.make_module(100, {Attribute.volume: 3500})
+        self.make_module(101, {Attribute.volume: 4000})
+        index = CompatibilityIndex(self.ch)
+        self.assertEqual(index.get_ship_modules(1), {100})
+        self.assertEqual(index.get_ship_modules(2), {100, 101})
+        self.assertEqual(len(self.log), 0)
+
+    def test_rig_size(self):
+        self.ch.type(type_id=1, category=Category.ship, attributes={Attribute.rig_size: 1})
+        self.ch.type(type_id=2, category=Category.ship)
+        for type_id, attributes in ((100, {Attribute.rig_size: 1}), (101, {Attribute.rig_size: 2}), (102, {})):
+            self.ch.type(type_id=type_id, category=Category.module, attributes=attributes, effects=(self.rig_slot,))
+        index = CompatibilityIndex(self.ch)
+        self.assertEqual(index.get_ship_modules(1), {100, 102})
+        self.assertEqual(index.get_ship_modules(2), {100, 101, 102})
+        self.assertEqual(len(self.log), 0)
+
+    def test_charges(self):
+        self.make_module(1, {
+            Attribute.charge_group_1: 20, Attribute.charge_group_2: 21,
+            Attribute.charge_size: 2, Attribute.capacity: 1})
+        self.make_module(2, {Attribute.capacity: 1})
+        self.make_charge(100, 20, {Attribute.charge_size: 2, Attribute.volume: 1})
+        self.make_charge(101, 21, {Attribute.charge_size: 2, Attribute.volume: 0.5})
+        # Wrong size
+        self.make_charge(102, 20, {Attribute.charge_size: 1, Attribute.volume: 1})
+        # Too big
+        self.make_charge(103, 20, {Attribute.charge_size: 2, Attribute.volume: 2})
+        # Wrong group
+        self.make_charge(104, 22, {Attribute.charge_size: 2, Attribute.volume: 1})
+        index = CompatibilityIndex(self.ch)
+        self.assertEqual(index.get_module_charges(1), {100, 101})
+        # Modules without charge groups take no charges
+        self.assertEqual(index.get_module_charges(2), set())
+        self.assertEqual(len(self.log), 0)
+
+    def test_query_cached(self):
+        self.ch.type(type_id=1, category=Category.ship)
+        self.make_module(100, {})
+        index = CompatibilityIndex(self.ch)
+        self.assertIs(index.get_ship_modules(1), index.get_ship_modules(1))
+        self.assertEqual(len(self.log), 0)
@@ -0,0 +1,133 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import Restriction, State
+from eos.fit.item import ModuleHigh
+from eos.fit.messages import RefreshSource
+from eos.fit.restriction.register import MaxGroupFittedRegister
+from eos.fit.volatile import FitVolatileManager
+from tests.restriction.restriction_testcase import RestrictionTestCase
+
+
+class TestIncremental(RestrictionTestCase):
+    """Check that validation results are kept current incrementally"""
+
+    def setUp(self):
+        super().setUp()
+        self.fit._volatile_mgr = FitVolatileManager(Mock())
+        self.eve_type = self.ch.type(type_id=1)
+        self.eve_type.max_state = State.active
+        self.skip_checks = set(Restriction).difference((Restriction.state,))
+
+    def make_item(self, state):
+        return self.make_item_mock(ModuleHigh, self.eve_type, state=state)
+
+    def test_result_cached(self):
+        item = self.make_item(State.overload)
+        self.add_item(item)
+        self.assertIsNotNone(self.get_restriction_error(item, Restriction.state))
+        # Change is not reported to volatile manager, thus
+        # cached result should be used
+        item.state = State.active
+        self.assertIsNotNone(self.get_restriction_error(item, Restriction.state))
+        self.fit._volatile_mgr._invalidate(object())
+        self.assertIsNotNone(self.get_restriction_error(item, Restriction.state))
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_result_updated_dependency(self):
+        item = self.make_item(State.overload)
+        self.add_item(item)
+        self.assertIsNotNone(self.get_restriction_error(item, Restriction.state))
+        item.state = State.active
+        self.fit._volatile_mgr._invalidate(item)
+        self.assertIsNone(self.get_restriction_error(item, Restriction.state))
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_result_updated_register(self):
+        item1 = self.make_item(State.active)
+        item2 = self.make_item(State.overload)
+        self.add_item(item1)
+        self.assertFalse(self.rs.has_violations(self.skip_checks))
+        self.add_item(item2)
+        self.assertIsNone(self.get_restriction_error(item1, Restriction.state))
+        self.assertIsNotNone(self.get_restriction_error(item2, Restriction.state))
+        self.remove_item(item2)
+        self.assertFalse(self.rs.has_violations(self.skip_checks))
+        self.remove_item(item1)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_result_updated_refresh(self):
+        item = self.make_item(State.overload)
+        self.add_item(item)
+        self.assertIsNotNone(self.get_restriction_error(item, Restriction.state))
+        item.state = State.active
+        self.fit._volatile_mgr._notify(RefreshSource())
+        self.assertIsNone(self.get_restriction_error(item, Restriction.state))
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_has_violations(self):
+        item = self.make_item(State.overload)
+        self.add_item(item)
+        self.assertTrue(self.rs.has_violations(self.skip_checks))
+        self.assertFalse(self.rs.has_violations(set(Restriction)))
+        self.remove_item(item)
+        self.assertFalse(self.rs.has_violations(self.skip_checks))
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_item_violations(self):
+        item1 = self.make_item(State.active)
+        item2 = self.make_item(State.overload)
+        self.add_item(item1)
+        self.add_item(item2)
+        self.assertEqual(self.rs.get_item_violations(item1, self.skip_checks), {})
+        item_violations = self.rs.get_item_violations(item2, self.skip_checks)
+        self.assertCountEqual(item_violations, (Restriction.state,))
+        self.assertEqual(item_violations[Restriction.state].current_state, State.overload)
+        self.assertEqual(self.rs.get_item_violations(item2, set(Restriction)), {})
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_register_changes_reported(self):
+        # Registers report if their contents have been changed,
+        # to mark only them for re-validation
+        register = MaxGroupFittedRegister()
+        item = self.make_item(State.online)
+        item_no_group = self.make_item_mock(ModuleHigh, self.ch.type(type_id=2, group=None))
+        self.eve_type.group = 5
+        self.assertIs(register.register_item(item), True)
+        self.assertIs(register.register_item(item_no_group), False)
+        self.assertIs(register.unregister_item(item_no_group), False)
+        self.assertIs(register.unregister_item(item), True)
+        self.assertIs(register.unregister_item(item), False)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
@@ -0,0 +1,116 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from itertools import chain
+
+from eos.const.eos import Restriction, State
+from eos.const.eve import Attribute
+from eos.fit.item import ModuleHigh
+from eos.fit.messages import DisableServices, EnableServices, ItemStateChanged
+from tests.restriction.restriction_testcase import RestrictionTestCase
+
+
+class TestLazy(RestrictionTestCase):
+    """Check that registers are populated only when needed"""
+
+    def get_register_entry_amount(self):
+        entry_num = 0
+        for register in chain(
+                self.rs._RestrictionService__regs_stateless,
+                *self.rs._RestrictionService__regs_stateful.values()
+        ):
+            entry_num += self._get_object_buffer_entry_amount(register)
+        return entry_num
+
+    def make_item(self, state):
+        eve_type = self.ch.type(type_id=1, attributes={Attribute.cpu: 0})
+        item = self.make_item_mock(ModuleHigh, eve_type, state=state)
+        item.attributes = {Attribute.cpu: 50}
+        self.fit.stats.cpu.used = 50
+        self.fit.stats.cpu.output = 40
+        return item
+
+    def test_not_populated(self):
+        item = self.make_item(State.online)
+        self.add_item(item)
+        self.assertEqual(self.get_register_entry_amount(), 0)
+        self.remove_item(item)
+        self.assertEqual(self.get_register_entry_amount(), 0)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_populated_on_query(self):
+        item = self.make_item(State.online)
+        self.add_item(item)
+        restriction_error = self.get_restriction_error(item, Restriction.cpu)
+        self.assertIsNotNone(restriction_error)
+        self.assertGreater(self.get_register_entry_amount(), 0)
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_populated_incremental(self):
+        # After population, changes should be applied to
+        # registers right away
+        self.assertFalse(self.rs.has_violations(set(Restriction)))
+        item = self.make_item(State.offline)
+        self.add_item(item)
+        self.assertGreater(self.get_register_entry_amount(), 0)
+        item.state = State.online
+        self.rs._notify(ItemStateChanged(item, State.offline, State.online))
+        restriction_error = self.get_restriction_error(item, Restriction.cpu)
+        self.assertIsNotNone(restriction_error)
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_state_change_unpopulated(self):
+        # State changes which happen before population are
+        # picked up from items themselves
+        item = self.make_item(State.online)
+        self.add_item(item)
+        item.state = State.offline
+        self.rs._notify(ItemStateChanged(item, State.online, State.offline))
+        restriction_error = self.get_restriction_error(item, Restriction.cpu)
+        self.assertIsNone(restriction_error)
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
+
+    def test_partial_disable(self):
+        # When services are disabled only for some of items,
+        # other items stay registered, and re-enabled items
+        # are registered right away
+        item1 = self.make_item(State.online)
+        item2 = self.make_item_mock(ModuleHigh, item1._eve_type, state=State.online)
+        item2.attributes = {Attribute.cpu: 0}
+        self.add_item(item1)
+        self.add_item(item2)
+        self.assertIsNotNone(self.get_restriction_error(item1, Restriction.cpu))
+        entries_before = self.get_register_entry_amount()
+        self.rs._notify(DisableServices({item1}))
+        self.rs._notify(EnableServices({item1}))
+        self.assertEqual(self.get_register_entry_amount(), entries_before)
+        self.assertIsNotNone(self.get_restriction_error(item1, Restriction.cpu))
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_restriction_buffers_empty()
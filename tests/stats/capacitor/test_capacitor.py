@@ -0,0 +1,136 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from eos.const.eos import State
+from eos.const.eve import Attribute
+from eos.fit.item import ModuleHigh, Ship
+from tests.stats.stat_testcase import StatTestCase
+
+
+class TestCapacitor(StatTestCase):
+    """Check functionality of capacitor stats"""
+
+    def setUp(self):
+        super().setUp()
+        self.discharge_attr = self.ch.attribute(attribute_id=100000)
+        self.effect = self.ch.effect(effect_id=100000, discharge_attribute=self.discharge_attr.id)
+        self.type_id = 0
+
+    def make_ship(self, capacity=1000, recharge_ms=100000):
+        self.type_id += 1
+        ship_eve_type = self.ch.type(type_id=self.type_id)
+        ship_item = self.make_item_mock(Ship, ship_eve_type)
+        ship_item.attributes = {Attribute.capacitor_capacity: capacity, Attribute.recharge_rate: recharge_ms}
+        self.set_ship(ship_item)
+        return ship_item
+
+    def make_module(self, amount, cycle_time, reactivation_delay=None, state=State.active):
+        self.type_id += 1
+        eve_type = self.ch.type(type_id=self.type_id, default_effect=self.effect)
+        item = self.make_item_mock(ModuleHigh, eve_type, state=state)
+        item.attributes = {self.discharge_attr.id: amount}
+        item.cycle_time = cycle_time
+        item.reactivation_delay = reactivation_delay
+        self.add_item(item)
+        return item
+
+    def test_ship_data(self):
+        self.make_ship(capacity=1200, recharge_ms=250000)
+        self.assertEqual(self.ss.capacitor.capacity, 1200)
+        self.assertAlmostEqual(self.ss.capacitor.recharge_time, 250)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_no_ship(self):
+        self.make_module(30, 1)
+        capacitor = self.ss.capacitor
+        self.assertIsNone(capacitor.capacity)
+        self.assertIsNone(capacitor.recharge_time)
+        self.assertIsNone(capacitor.stable)
+        self.assertIsNone(capacitor.stable_level)
+        self.assertIsNone(capacitor.depletion_time)
+        self.assertEqual(len(self.log), 0)
+
+    def test_no_modules(self):
+        self.make_ship()
+        self.assertIs(self.ss.capacitor.stable, True)
+        self.assertAlmostEqual(self.ss.capacitor.stable_level, 1)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_unstable(self):
+        self.make_ship()
+        item = self.make_module(30, 1)
+        capacitor = self.ss.capacitor
+        self.assertIs(capacitor.stable, False)
+        self.assertIsNone(capacitor.stable_level)
+        self.assertAlmostEqual(capacitor.depletion_time, 102)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_reactivation_delay(self):
+        # With reactivation delay, module activates every 2 seconds
+        # and drains at 15 per second, which capacitor can sustain
+        self.make_ship()
+        item = self.make_module(30, 1, reactivation_delay=1)
+        self.assertIs(self.ss.capacitor.stable, True)
+        self.assertIsNone(self.ss.capacitor.depletion_time)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_inactive(self):
+        self.make_ship()
+        item = self.make_module(30, 1, state=State.online)
+        self.assertIs(self.ss.capacitor.stable, True)
+        self.assertAlmostEqual(self.ss.capacitor.stable_level, 1)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_no_discharge(self):
+        self.make_ship()
+        self.type_id += 1
+        eve_type = self.ch.type(type_id=self.type_id, default_effect=self.ch.effect(effect_id=100001))
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        item.attributes = {}
+        self.add_item(item)
+        self.assertIs(self.ss.capacitor.stable, True)
+        self.assertAlmostEqual(self.ss.capacitor.stable_level, 1)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_no_cycle_time(self):
+        self.make_ship()
+        item = self.make_module(30, None)
+        self.assertIs(self.ss.capacitor.stable, True)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
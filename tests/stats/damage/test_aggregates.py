@@ -0,0 +1,136 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.const.eve import Group
+from eos.fit.item import ModuleHigh
+from eos.fit.messages import RefreshSource
+from eos.fit.volatile import FitVolatileManager
+from eos.holder_filter import turret_filter
+from tests.stats.stat_testcase import StatTestCase
+
+
+class TestStatsDamageAggregates(StatTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.fit._volatile_mgr = FitVolatileManager(Mock())
+        self.type_id = 0
+
+    def make_dealer(self, em, group=None):
+        self.type_id += 1
+        eve_type = self.ch.type(type_id=self.type_id, group=group, attributes={})
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        item.get_nominal_dps.return_value = Mock(em=em, thermal=None, kinetic=None, explosive=None)
+        self.add_item(item)
+        return item
+
+    def test_cached(self):
+        item = self.make_dealer(1.5)
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 1.5)
+        # Action
+        stats_dps = self.ss.get_nominal_dps()
+        # Verification
+        self.assertAlmostEqual(stats_dps.em, 1.5)
+        self.assertAlmostEqual(stats_dps.total, 1.5)
+        self.assertEqual(len(item.get_nominal_dps.mock_calls), 1)
+        # Cleanup
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_dealer_changed(self):
+        item1 = self.make_dealer(1.5)
+        item2 = self.make_dealer(2)
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 3.5)
+        # Action
+        item1.get_nominal_dps.return_value = Mock(em=4, thermal=None, kinetic=None, explosive=None)
+        self.fit._volatile_mgr._invalidate(item1)
+        # Verification
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 6)
+        self.assertEqual(len(item1.get_nominal_dps.mock_calls), 2)
+        self.assertEqual(len(item2.get_nominal_dps.mock_calls), 1)
+        # Cleanup
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_dealer_added_removed(self):
+        item1 = self.make_dealer(1.5)
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 1.5)
+        # Action
+        item2 = self.make_dealer(2)
+        # Verification
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 3.5)
+        # Action
+        self.remove_item(item1)
+        # Verification
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 2)
+        self.assertEqual(len(item1.get_nominal_dps.mock_calls), 1)
+        # Cleanup
+        self.remove_item(item2)
+        self.assertIsNone(self.ss.get_nominal_dps().em)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_preset_filter(self):
+        item1 = self.make_dealer(1.5, group=Group.projectile_weapon)
+        item2 = self.make_dealer(2)
+        # Action
+        self.assertAlmostEqual(self.ss.get_nominal_dps(item_filter=turret_filter).em, 1.5)
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 3.5)
+        # Verification
+        self.assertAlmostEqual(self.ss.get_nominal_dps(item_filter=turret_filter).em, 1.5)
+        self.assertEqual(len(item1.get_nominal_dps.mock_calls), 2)
+        self.assertEqual(len(item2.get_nominal_dps.mock_calls), 1)
+        # Cleanup
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_custom_filter(self):
+        item = self.make_dealer(1.5)
+        self.assertAlmostEqual(self.ss.get_nominal_dps(item_filter=lambda i: True).em, 1.5)
+        # Action
+        self.assertAlmostEqual(self.ss.get_nominal_dps(item_filter=lambda i: True).em, 1.5)
+        # Verification
+        self.assertEqual(len(item.get_nominal_dps.mock_calls), 2)
+        # Cleanup
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_source_refresh(self):
+        item = self.make_dealer(1.5)
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 1.5)
+        # Action
+        self.fit._volatile_mgr._notify(RefreshSource())
+        # Verification
+        self.assertAlmostEqual(self.ss.get_nominal_dps().em, 1.5)
+        self.assertEqual(len(item.get_nominal_dps.mock_calls), 2)
+        # Cleanup
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
@@ -0,0 +1,77 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.fit.item import ModuleHigh
+from eos.fit.tuples import TargetData
+from tests.stats.stat_testcase import StatTestCase
+
+
+class TestStatsDamageVolleyVsTarget(StatTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.target = TargetData(distance=[1000, 2000], transversal=0, signature_radius=100, velocity=0)
+
+    def test_empty(self):
+        stats_volley = self.ss.get_volley_vs_target(self.target)
+        self.assertIsNone(stats_volley.em)
+        self.assertIsNone(stats_volley.total)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_multiple(self):
+        eve_type = self.ch.type(type_id=1, attributes={})
+        item1 = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        item2 = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        self.add_item(item1)
+        self.add_item(item2)
+        item1.get_volley_vs_target.return_value = Mock(em=[1, 0.5], thermal=None, kinetic=[2, 1], explosive=None)
+        item2.get_volley_vs_target.return_value = Mock(em=[3, 3], thermal=None, kinetic=None, explosive=None)
+        stats_volley = self.ss.get_volley_vs_target(self.target)
+        self.assertEqual(list(stats_volley.em), [4, 3.5])
+        self.assertIsNone(stats_volley.thermal)
+        self.assertEqual(list(stats_volley.kinetic), [2, 1])
+        self.assertIsNone(stats_volley.explosive)
+        self.assertEqual(list(stats_volley.total), [6, 4.5])
+        item1.get_volley_vs_target.assert_called_once_with(self.target, target_resistances=None)
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_filter(self):
+        eve_type = self.ch.type(type_id=1, attributes={})
+        item1 = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        item2 = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        self.add_item(item1)
+        self.add_item(item2)
+        item1.get_volley_vs_target.return_value = Mock(em=[1, 0.5], thermal=None, kinetic=None, explosive=None)
+        item2.get_volley_vs_target.return_value = Mock(em=[3, 3], thermal=None, kinetic=None, explosive=None)
+        stats_volley = self.ss.get_volley_vs_target(self.target, item_filter=lambda i: i is item2)
+        self.assertEqual(list(stats_volley.em), [3, 3])
+        self.assertEqual(list(stats_volley.total), [3, 3])
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
@@ -0,0 +1,131 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+import pickle
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.const.eve import Attribute
+from eos.fit.item import ModuleHigh, Ship
+from tests.stats.stat_testcase import StatTestCase
+
+
+class TestStatSnapshot(StatTestCase):
+
+    def make_ship(self):
+        ship_eve_type = self.ch.type(type_id=1)
+        ship_item = self.make_item_mock(Ship, ship_eve_type)
+        ship_item.attributes = {
+            Attribute.cpu_output: 50, Attribute.hi_slots: 3,
+            Attribute.agility: 2, Attribute.mass: 1000000
+        }
+        ship_item.hp = Mock(hull=10, armor=20, shield=30, total=60)
+        ship_item.resistances = Mock()
+        ship_item.resistances.hull = Mock(em=0.1, thermal=0.2, kinetic=0.3, explosive=0.4)
+        ship_item.resistances.armor = Mock(em=0.5, thermal=0.6, kinetic=0.7, explosive=0.8)
+        ship_item.resistances.shield = Mock(em=0, thermal=0.2, kinetic=0.4, explosive=0.5)
+        ship_item.worst_case_ehp = Mock(hull=11, armor=40, shield=30, total=81)
+        self.set_ship(ship_item)
+        return ship_item
+
+    def test_values(self):
+        self.make_ship()
+        eve_type = self.ch.type(type_id=2, attributes={Attribute.cpu: 0})
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.active)
+        item.attributes = {Attribute.cpu: 15}
+        item.get_nominal_volley.return_value = Mock(em=10, thermal=None, kinetic=None, explosive=None)
+        item.get_nominal_dps.return_value = Mock(em=2, thermal=None, kinetic=None, explosive=None)
+        self.add_item(item)
+        self.fit.modules.high.append(item)
+        # Action
+        snapshot = self.ss.snapshot()
+        # Verification
+        self.assertEqual(snapshot.hp_armor, 20)
+        self.assertEqual(snapshot.hp_total, 60)
+        self.assertAlmostEqual(snapshot.resist_hull_explosive, 0.4)
+        self.assertAlmostEqual(snapshot.resist_armor_em, 0.5)
+        self.assertAlmostEqual(snapshot.resist_shield_kinetic, 0.4)
+        self.assertEqual(snapshot.worst_case_ehp_total, 81)
+        self.assertEqual(snapshot.cpu_used, 15)
+        self.assertEqual(snapshot.cpu_output, 50)
+        self.assertEqual(snapshot.powergrid_used, 0)
+        self.assertIsNone(snapshot.powergrid_output)
+        self.assertEqual(snapshot.high_slots_used, 1)
+        self.assertEqual(snapshot.high_slots_total, 3)
+        self.assertIsNone(snapshot.med_slots_total)
+        self.assertEqual(snapshot.volley_em, 10)
+        self.assertIsNone(snapshot.volley_thermal)
+        self.assertEqual(snapshot.volley_total, 10)
+        self.assertEqual(snapshot.dps_total, 2)
+        self.assertEqual(snapshot.align_time, self.ss.align_time)
+        self.assertIsNone(snapshot.capacitor_capacity)
+        self.assertIsNone(snapshot.capacitor_stable)
+        # Cleanup
+        self.fit.modules.high.remove(item)
+        self.remove_item(item)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_damage_single_pass(self):
+        items = []
+        for type_id, volley, dps in ((2, 10, 2), (3, 30, 5)):
+            item = self.make_item_mock(ModuleHigh, self.ch.type(type_id=type_id), state=State.active)
+            item.get_nominal_volley.return_value = Mock(em=volley, thermal=None, kinetic=1, explosive=None)
+            item.get_nominal_dps.return_value = Mock(em=dps, thermal=None, kinetic=None, explosive=None)
+            self.add_item(item)
+            items.append(item)
+        # Action
+        snapshot = self.ss.snapshot()
+        # Verification
+        self.assertEqual(snapshot.volley_em, 40)
+        self.assertEqual(snapshot.volley_kinetic, 2)
+        self.assertIsNone(snapshot.volley_thermal)
+        self.assertEqual(snapshot.volley_total, 42)
+        self.assertEqual(snapshot.dps_em, 7)
+        self.assertIsNone(snapshot.dps_kinetic)
+        self.assertEqual(snapshot.dps_total, 7)
+        for item in items:
+            self.assertEqual(item.get_nominal_volley.call_count, 1)
+            self.assertEqual(item.get_nominal_dps.call_count, 1)
+        # Cleanup
+        for item in items:
+            self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_no_ship(self):
+        snapshot = self.ss.snapshot()
+        self.assertIsNone(snapshot.hp_total)
+        self.assertIsNone(snapshot.resist_shield_em)
+        self.assertIsNone(snapshot.cpu_output)
+        self.assertIsNone(snapshot.agility_factor)
+        self.assertIsNone(snapshot.dps_total)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_pickle(self):
+        self.make_ship()
+        snapshot = self.ss.snapshot()
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
@@ -0,0 +1,158 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.const.eos import State
+from eos.const.eve import Attribute
+from eos.fit.item import ModuleHigh
+from eos.fit.messages import ItemRemoved, RefreshSource
+from eos.fit.volatile import FitVolatileManager
+from tests.stats.stat_testcase import StatTestCase
+
+
+class CountingDict(dict):
+    """Dictionary which counts its item reads."""
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return dict.__getitem__(self, key)
+
+
+class TestResourceRunningTotal(StatTestCase):
+    """Check that resource use is maintained incrementally"""
+
+    def setUp(self):
+        super().setUp()
+        self.fit._volatile_mgr = FitVolatileManager(Mock())
+        self.type_id = 0
+
+    def make_user(self, cpu):
+        self.type_id += 1
+        eve_type = self.ch.type(type_id=self.type_id, attributes={Attribute.cpu: 0})
+        item = self.make_item_mock(ModuleHigh, eve_type, state=State.online)
+        item.attributes = CountingDict({Attribute.cpu: cpu})
+        self.add_item(item)
+        return item
+
+    def test_cached(self):
+        item1 = self.make_user(50)
+        item2 = self.make_user(30)
+        self.assertEqual(self.ss.cpu.used, 80)
+        # Action
+        self.ss.cpu._clear_volatile_attrs()
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 80)
+        self.assertEqual(item1.attributes.reads, 1)
+        self.assertEqual(item2.attributes.reads, 1)
+        # Cleanup
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_attr_changed(self):
+        item1 = self.make_user(50)
+        item2 = self.make_user(30)
+        self.assertEqual(self.ss.cpu.used, 80)
+        # Action
+        item1.attributes[Attribute.cpu] = 10
+        self.fit._volatile_mgr._invalidate((item1, Attribute.cpu))
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 40)
+        self.assertEqual(item1.attributes.reads, 2)
+        self.assertEqual(item2.attributes.reads, 1)
+        # Cleanup
+        self.remove_item(item1)
+        self.remove_item(item2)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_other_attr_changed(self):
+        item = self.make_user(50)
+        self.assertEqual(self.ss.cpu.used, 50)
+        # Action
+        self.fit._volatile_mgr._invalidate((item, Attribute.power))
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 50)
+        self.assertEqual(item.attributes.reads, 1)
+        # Cleanup
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_item_added_removed(self):
+        item1 = self.make_user(50)
+        self.assertEqual(self.ss.cpu.used, 50)
+        # Action
+        item2 = self.make_user(30)
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 80)
+        # Action
+        self.remove_item(item1)
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 30)
+        self.assertEqual(item1.attributes.reads, 1)
+        self.assertEqual(item2.attributes.reads, 1)
+        # Cleanup
+        self.remove_item(item2)
+        self.assertEqual(self.ss.cpu.used, 0)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_source_refresh(self):
+        item = self.make_user(50)
+        self.assertEqual(self.ss.cpu.used, 50)
+        # Action
+        item.attributes[Attribute.cpu] = 20
+        self.fit._volatile_mgr._notify(RefreshSource())
+        # Verification
+        self.assertEqual(self.ss.cpu.used, 20)
+        self.assertEqual(item.attributes.reads, 2)
+        # Cleanup
+        self.remove_item(item)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_removed_item_untracked(self):
+        volatile_mgr = self.fit._volatile_mgr
+        for _ in range(5):
+            item = self.make_user(50)
+            self.assertEqual(self.ss.cpu.used, 50)
+            # Action
+            self.remove_item(item)
+            volatile_mgr._notify(ItemRemoved(item))
+            # Verification
+            self.assertEqual(self.ss.cpu.used, 0)
+            dependencies = volatile_mgr._FitVolatileManager__dependencies
+            for (_, name), keys in dependencies.items():
+                self.assertIsNot(name, item)
+                self.assertNotIn(item, keys)
+                self.assertNotIn((item, Attribute.cpu), keys)
+            dependents = volatile_mgr._FitVolatileManager__dependents
+            self.assertNotIn(item, dependents)
+            self.assertNotIn((item, Attribute.cpu), dependents)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
@@ -0,0 +1,88 @@
+# ===============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+from unittest.mock import Mock
+
+from eos.fit.ehp import get_fits_ehp_matrix
+from eos.fit.item import Ship
+from eos.fit.stats import StatsDisabledError
+from eos.fit.tuples import DamageTypes, TankingLayers, TankingLayersTotal
+from tests.stats.stat_testcase import StatTestCase
+
+
+class TestEhpMatrix(StatTestCase):
+
+    def make_ship(self, hull, armor, shield, resist):
+        ship_eve_type = self.ch.type(type_id=1)
+        ship_item = self.make_item_mock(Ship, ship_eve_type)
+        ship_item.hp = Mock(hull=hull, armor=armor, shield=shield, total=hull + armor + shield)
+        layer = DamageTypes(em=resist, thermal=resist, kinetic=resist, explosive=resist)
+        ship_item.resistances = TankingLayers(hull=layer, armor=layer, shield=layer)
+        return ship_item
+
+    def test_relay(self):
+        ship_item = self.make_ship(10, 20, 30, 0.5)
+        self.set_ship(ship_item)
+        profiles = (Mock(em=1, thermal=0, kinetic=0, explosive=0), Mock(em=1, thermal=2, kinetic=3, explosive=4))
+        rows = self.ss.get_ehp_matrix(profiles)
+        self.assertEqual(len(rows), 2)
+        for row in rows:
+            self.assertAlmostEqual(row[0], 20)
+            self.assertAlmostEqual(row[1], 40)
+            self.assertAlmostEqual(row[2], 60)
+            self.assertAlmostEqual(row[3], 120)
+        self.assertFalse(ship_item.get_ehp.called)
+        self.set_ship(None)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_no_ship(self):
+        profiles = (Mock(em=1, thermal=1, kinetic=1, explosive=1),)
+        rows = self.ss.get_ehp_matrix(profiles)
+        self.assertEqual(rows, [TankingLayersTotal(hull=None, armor=None, shield=None, total=None)])
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_multiple_fits(self):
+        layer1 = DamageTypes(em=0.5, thermal=0.5, kinetic=0.5, explosive=0.5)
+        layer2 = DamageTypes(em=0, thermal=0, kinetic=0, explosive=0.75)
+        fit1 = Mock()
+        fit1.stats.hp = TankingLayersTotal(hull=10, armor=20, shield=30, total=60)
+        fit1.stats.resistances = TankingLayers(hull=layer1, armor=layer1, shield=layer1)
+        fit2 = Mock()
+        fit2.stats.hp = TankingLayersTotal(hull=None, armor=None, shield=100, total=100)
+        fit2.stats.resistances = TankingLayers(hull=layer2, armor=layer2, shield=layer2)
+        profiles = (Mock(em=1, thermal=0, kinetic=0, explosive=0), Mock(em=0, thermal=0, kinetic=0, explosive=1))
+        matrices = get_fits_ehp_matrix((fit1, fit2), profiles)
+        self.assertEqual(len(matrices), 2)
+        self.assertEqual(matrices[0], [(20, 40, 60, 120), (20, 40, 60, 120)])
+        rows2 = matrices[1]
+        self.assertEqual(rows2[0], (None, None, 100, 100))
+        self.assertEqual(rows2[1], (None, None, 400, 400))
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()
+
+    def test_stats_disabled(self):
+        profiles = (Mock(em=1, thermal=1, kinetic=1, explosive=1),)
+        with self.assertRaises(StatsDisabledError):
+            get_fits_ehp_matrix((Mock(stats=None),), profiles)
+        self.assertEqual(len(self.log), 0)
+        self.assert_stat_buffers_empty()